@@ -0,0 +1,257 @@
+"""
+Game loop benchmark: measures GameLogic.update across the board presets,
+snake counts, controller mixes and game modes of config/settings.json.
+
+Usage:
+    python -m benchmarks.game_loop [--maps XS L] [--snakes 1 12] [--mixes greedy bfs]
+                                   [--ticks 300] [--out results.json]
+                                   [--baseline benchmarks/baseline.json] [--save-baseline]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_logic import GameLogic
+from benchmarks.report import save_results, load_results, compare
+
+SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "..", "config", "settings.json")
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# controller types cycled over the snakes of a game
+CONTROLLER_MIXES = {
+    "greedy": ["Greedy"],
+    "bfs": ["BFS"],
+    "safe_greedy": ["SafeGreedy"],
+    "mixed": ["Greedy", "BFS", "SafeGreedy"],
+    "hamiltonian": ["Hamiltonian"],
+}
+# mixes that only make sense for a single snake
+SINGLE_SNAKE_MIXES = {"hamiltonian"}
+
+
+def load_settings(path: str = SETTINGS_FILE) -> dict:
+    """Load the game settings the sweep is taken from."""
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def supported_modes(modes: List[str]) -> List[str]:
+    """Keep the game modes GameLogic can run."""
+    return [mode for mode in modes if hasattr(GameLogic, f"update_{mode}")]
+
+
+def build_cases(settings: dict, maps: Optional[List[str]] = None, snakes: Optional[List[int]] = None,
+                mixes: Optional[List[str]] = None, modes: Optional[List[str]] = None) -> List[dict]:
+    """
+    Build the benchmark cases of a sweep.
+
+    Args:
+        settings (dict): The game settings.
+        maps (Optional[List[str]]): The MAPS presets to run, all if None.
+        snakes (Optional[List[int]]): The snake counts to run, all of N_SNAKES if None.
+        mixes (Optional[List[str]]): The controller mixes to run, all if None.
+        modes (Optional[List[str]]): The game modes to run, all runnable MODES if None.
+
+    Returns:
+        List[dict]: One dict per case with its id and game parameters.
+    """
+    cases = []
+    for map_name in maps or list(settings["MAPS"]):
+        preset = settings["MAPS"][map_name]
+        for n_snakes in snakes or settings["N_SNAKES"]:
+            for mix in mixes or list(CONTROLLER_MIXES):
+                if mix in SINGLE_SNAKE_MIXES and n_snakes != 1:
+                    continue
+                for mode in supported_modes(modes or settings["MODES"]):
+                    controllers = [CONTROLLER_MIXES[mix][i % len(CONTROLLER_MIXES[mix])] for i in range(n_snakes)]
+                    cases.append({
+                        "id": f"{map_name}/{n_snakes}/{mix}/{mode}",
+                        "size": preset["number_of_cells"],
+                        "snake_size": preset["snake_size"],
+                        "controllers": controllers,
+                        "mode": mode,
+                    })
+    return cases
+
+
+def new_game(case: dict, seed: int) -> GameLogic:
+    """Create the game of a case the way PlayGame does."""
+    return GameLogic(
+        case["size"], case["size"], case["controllers"], case["snake_size"], len(case["controllers"]),
+        case["mode"], cell_index=True, seed=seed
+    )
+
+
+def run_ticks(case: dict, ticks: int, seed: int, on_tick=None) -> None:
+    """
+    Play a number of ticks, starting a new game whenever every snake is gone.
+
+    Args:
+        case (dict): The case to play.
+        ticks (int): The number of ticks.
+        seed (int): The seed of the first game.
+        on_tick: Called with the game before each tick, returns a callable run after it.
+    """
+    logic = new_game(case, seed)
+    for _ in range(ticks):
+        if not logic.keys:
+            seed += 1
+            logic = new_game(case, seed)
+        after = on_tick(logic) if on_tick is not None else None
+        logic.update()
+        if after is not None:
+            after()
+
+
+def run_case(case: dict, ticks: int = 300, warmup: int = 20, seed: int = 0, allocations: bool = True) -> dict:
+    """
+    Benchmark one case.
+
+    Args:
+        case (dict): The case to run.
+        ticks (int): The number of measured ticks.
+        warmup (int): The number of ticks played before measuring.
+        seed (int): The seed of the first game.
+        allocations (bool): Also measure allocations in a separate traced run.
+
+    Returns:
+        dict: Ticks per second, per-tick latency percentiles in microseconds and allocation figures.
+    """
+    run_ticks(case, warmup, seed)
+    latencies = np.zeros(ticks, dtype=np.int64)
+    tick = 0
+
+    def on_tick(logic):
+        start = time.perf_counter_ns()
+
+        def after():
+            nonlocal tick
+            latencies[tick] = time.perf_counter_ns() - start
+            tick += 1
+        return after
+
+    run_ticks(case, ticks, seed, on_tick)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) / 1000
+    result = {
+        "ticks": ticks,
+        "ticks_per_sec": float(1e9 / latencies.mean()),
+        "p50_us": float(p50),
+        "p90_us": float(p90),
+        "p99_us": float(p99),
+        "max_us": float(latencies.max() / 1000),
+    }
+    if allocations:
+        result.update(measure_allocations(case, min(ticks, 100), seed))
+    return result
+
+
+def measure_allocations(case: dict, ticks: int, seed: int) -> dict:
+    """
+    Measure allocations per tick with tracemalloc, in a run of its own as tracing slows the game down.
+
+    Args:
+        case (dict): The case to run.
+        ticks (int): The number of traced ticks.
+        seed (int): The seed of the first game.
+
+    Returns:
+        dict: The mean bytes allocated on top of the live memory during a tick,
+            and the mean number of memory blocks a tick leaves behind.
+    """
+    peaks = []
+    blocks = []
+
+    def on_tick(logic):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        start_blocks = sys.getallocatedblocks()
+
+        def after():
+            blocks.append(sys.getallocatedblocks() - start_blocks)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        return after
+
+    tracemalloc.start()
+    try:
+        run_ticks(case, ticks, seed, on_tick)
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_bytes_per_tick": float(np.mean(peaks)),
+        "net_blocks_per_tick": float(np.mean(blocks)),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the game loop.")
+    parser.add_argument("--maps", nargs="*", help="MAPS presets to run (default: all)")
+    parser.add_argument("--snakes", nargs="*", type=int, help="snake counts to run (default: N_SNAKES)")
+    parser.add_argument("--mixes", nargs="*", choices=list(CONTROLLER_MIXES), help="controller mixes to run")
+    parser.add_argument("--modes", nargs="*", help="game modes to run (default: MODES)")
+    parser.add_argument("--ticks", type=int, default=300, help="measured ticks per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-alloc", action="store_true", help="skip the allocation measurement")
+    parser.add_argument("--out", help="where to save the results (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    skipped = [mode for mode in args.modes or settings["MODES"] if mode not in supported_modes([mode])]
+    if skipped:
+        print(f"skipping game modes without an update method: {', '.join(skipped)}")
+
+    # a case id names the board, snakes, controllers and mode, these are the rest
+    params = {"ticks": args.ticks, "seed": args.seed}
+    results = {}
+    for case in build_cases(settings, args.maps, args.snakes, args.mixes, args.modes):
+        result = run_case(case, args.ticks, seed=args.seed, allocations=not args.no_alloc)
+        results[case["id"]] = result
+        print(
+            f"{case['id']:<32} {result['ticks_per_sec']:>10.0f} ticks/s"
+            f"  p50 {result['p50_us']:>8.1f}us  p99 {result['p99_us']:>8.1f}us"
+            + (f"  {result['alloc_peak_bytes_per_tick']:>9.0f} B/tick" if not args.no_alloc else "")
+        )
+
+    out = args.out or os.path.join(RESULTS_DIR, datetime.now().strftime("game_loop_%Y%m%d_%H%M%S.json"))
+    save_results(out, results, params)
+    print(f"saved {out}")
+    if args.save_baseline:
+        save_results(args.baseline, results, params)
+        print(f"saved baseline {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        baseline, baseline_params = load_results(args.baseline)
+        try:
+            regressions = compare(
+                results, baseline, args.tolerance, metrics=("ticks_per_sec",),
+                higher_is_better=("ticks_per_sec",), params=params, baseline_params=baseline_params
+            )
+        except ValueError as e:
+            print(f"not comparing: {e}, run with --save-baseline to replace it")
+            return 2
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['id']}: {regression['baseline']:.0f} -> "
+                f"{regression['result']:.0f} ticks/s ({regression['ratio']:.0%})"
+            )
+        if regressions:
+            return 1
+        print("no regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
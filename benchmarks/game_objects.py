@@ -0,0 +1,338 @@
+"""
+Microbenchmarks for the data structures in logic/game_objects, each run in
+isolation with the operation mixes the game produces.
+
+Usage:
+    python -m benchmarks.game_objects [--filter snake] [--size 50] [--repeat 5]
+                                      [--out results.json] [--tolerance 0.2]
+                                      [--baseline benchmarks/game_objects_baseline.json] [--save-baseline]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.hash_queue import HashQueue
+from logic.game_objects.compact_hash_queue import CompactHashQueue
+from logic.game_objects.spawn_generator import SpawnGenerator
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.cell_codec import CellCodec
+from logic.game_objects.hamiltonian_cycle import HamiltonianCycle
+from logic.game_objects.snake import Snake
+from logic.game_objects.food import Food
+from benchmarks.report import save_results, load_results, compare
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "game_objects_baseline.json")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# a benchmark builds its structure outside the timing and returns the
+# operation to time with the number of operations it performs
+Setup = Callable[[int], Tuple[Callable[[], None], int]]
+
+
+def queue_steady(make_queue: Callable[[int], object], board_cells: Callable[[int], Sequence]) -> Setup:
+    """A queue moving like a snake body: a new front and a popped back per step."""
+    def setup(size: int):
+        board = board_cells(size)
+        cells = len(board)
+        queue = make_queue(cells)
+        for i in range(cells // 4):
+            queue.add_back(board[i])
+        steps = list(board)
+
+        def run():
+            for item in steps:
+                queue.add_front(item)
+                queue.pop_back()
+                queue.has_multi(item)
+        return run, 3 * len(steps)
+    return setup
+
+
+def queue_growth(make_queue: Callable[[int], object], board_cells: Callable[[int], Sequence]) -> Setup:
+    """A queue growing in a burst, stacking copies of its tail."""
+    def setup(size: int):
+        board = board_cells(size)
+        cells = len(board)
+        queue = make_queue(cells)
+        queue.add_back(board[0])
+
+        def run():
+            for _ in range(cells - 1):
+                queue.add_back(queue.peak_back())
+        return run, 2 * (cells - 1)
+    return setup
+
+
+def queue_drain(make_queue: Callable[[int], object], board_cells: Callable[[int], Sequence]) -> Setup:
+    """A dead snake's body popped back to front until empty."""
+    def setup(size: int):
+        board = board_cells(size)
+        cells = len(board)
+        queue = make_queue(cells)
+        for cell in board:
+            queue.add_back(cell)
+
+        def run():
+            for _ in range(cells):
+                queue.pop_back()
+        return run, cells
+    return setup
+
+
+def spawn_churn(cell_index: bool) -> Setup:
+    """Cells leaving and rejoining the free set as snakes move, with a spawn drawn per step."""
+    def setup(size: int):
+        generator = SpawnGenerator(size, size, cell_index)
+        codec = CellCodec(size, size)
+        cells = list(range(size * size)) if cell_index else codec.positions
+
+        def run():
+            for cell in cells:
+                generator.remove(cell)
+                generator.insert(cell)
+                generator.get_random()
+        return run, 3 * len(cells)
+    return setup
+
+
+def cycle_directions(size: int) -> List[Tuple[int, int]]:
+    """The directions of a lap around the board's Hamiltonian cycle."""
+    order = HamiltonianCycle.build(size, size)
+    return [
+        ((b % size) - (a % size), (b // size) - (a // size))
+        for a, b in zip(order, order[1:] + order[:1])
+    ]
+
+
+def new_snake(size: int, length: int, cell_index: bool, compact: bool) -> Snake:
+    """A snake at the top left corner with a shared occupancy grid."""
+    codec = CellCodec(size, size) if cell_index else None
+    grid = OccupancyGrid(size, size, SpawnGenerator(size, size, cell_index), cell_index)
+    start = codec.encode((0, 0)) if codec is not None else (0, 0)
+    return Snake(start, length, grid, 0, codec, compact)
+
+
+def snake_move(cell_index: bool, compact: bool) -> Setup:
+    """A snake following the board's Hamiltonian cycle for a lap, checking collisions every step."""
+    def setup(size: int):
+        snake = new_snake(size, size, cell_index, compact)
+        directions = cycle_directions(size)
+
+        def run():
+            for direction in directions:
+                snake.move(direction)
+                snake.check_collision(size, size, {}, [])
+        return run, len(directions)
+    return setup
+
+
+def snake_growth(cell_index: bool, compact: bool) -> Setup:
+    """A snake eating on every step for a quarter of the board, growing as it moves."""
+    def setup(size: int):
+        snake = new_snake(size, 1, cell_index, compact)
+        directions = cycle_directions(size)[:size * size // 4]
+
+        def run():
+            for direction in directions:
+                snake.move(direction)
+                snake.grow()
+        return run, 2 * len(directions)
+    return setup
+
+
+def snake_drain(cell_index: bool, compact: bool) -> Setup:
+    """A dead snake retracting one segment per step until it is gone."""
+    def setup(size: int):
+        snake = new_snake(size, 1, cell_index, compact)
+        for direction in cycle_directions(size)[:size * size // 2]:
+            snake.add_head(direction)
+        snake.die()
+        count = snake.get_size()
+
+        def run():
+            while snake.check_exists():
+                snake.update((0, 1), None)
+        return run, count
+    return setup
+
+
+def food_cycle() -> Setup:
+    """Food eaten and respawned, as checked by every snake each step."""
+    def setup(size: int):
+        food = Food()
+        cells = list(range(size * size))
+
+        def run():
+            for cell in cells:
+                food.respawn(cell)
+                food.get_position()
+                food.exists()
+                food.remove()
+        return run, 4 * len(cells)
+    return setup
+
+
+def tuple_cells(size: int) -> List[Tuple[int, int]]:
+    return CellCodec(size, size).positions
+
+
+def index_cells(size: int) -> range:
+    return range(size * size)
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "hash_queue/steady": queue_steady(lambda cells: HashQueue(), tuple_cells),
+    "hash_queue/growth": queue_growth(lambda cells: HashQueue(), tuple_cells),
+    "hash_queue/drain": queue_drain(lambda cells: HashQueue(), tuple_cells),
+    "compact_hash_queue/steady": queue_steady(CompactHashQueue, index_cells),
+    "compact_hash_queue/growth": queue_growth(CompactHashQueue, index_cells),
+    "compact_hash_queue/drain": queue_drain(CompactHashQueue, index_cells),
+    "spawn_generator/churn/tuple": spawn_churn(False),
+    "spawn_generator/churn/index": spawn_churn(True),
+    "snake/move/tuple": snake_move(False, False),
+    "snake/move/index": snake_move(True, False),
+    "snake/move/compact": snake_move(True, True),
+    "snake/growth/tuple": snake_growth(False, False),
+    "snake/growth/compact": snake_growth(True, True),
+    "snake/drain/tuple": snake_drain(False, False),
+    "snake/drain/compact": snake_drain(True, True),
+    "food/cycle": food_cycle(),
+}
+
+# the structure holding the elements, to measure memory per element
+FOOTPRINTS: Dict[str, Callable[[int], object]] = {
+    "hash_queue": lambda size: fill_queue(HashQueue(), tuple_cells(size)),
+    "compact_hash_queue": lambda size: fill_queue(CompactHashQueue(size * size), index_cells(size)),
+    "spawn_generator/tuple": lambda size: SpawnGenerator(size, size),
+    "spawn_generator/index": lambda size: SpawnGenerator(size, size, True),
+}
+
+
+def fill_queue(queue, cells: Sequence):
+    for cell in cells:
+        queue.add_back(cell)
+    return queue
+
+
+def time_benchmark(setup: Setup, size: int, repeat: int) -> float:
+    """
+    Time a benchmark, building a fresh structure for every repeat.
+
+    Args:
+        setup (Setup): The benchmark to time.
+        size (int): The width and height of the board.
+        repeat (int): The number of timed runs, the fastest is kept.
+
+    Returns:
+        float: Nanoseconds per operation.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        run, ops = setup(size)
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / ops)
+    return best
+
+
+def measure_footprint(build: Callable[[int], object], size: int) -> float:
+    """
+    Measure the memory a structure holds per element.
+
+    Args:
+        build (Callable[[int], object]): Builds the structure holding one element per cell of the board.
+        size (int): The width and height of the board.
+
+    Returns:
+        float: Bytes per element.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(size)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return (after - before) / (size * size)
+
+
+def run_all(size: int = 50, repeat: int = 5, name_filter: str = "") -> Dict[str, dict]:
+    """
+    Run the benchmarks and footprint measurements whose names contain the filter.
+
+    Args:
+        size (int): The width and height of the board.
+        repeat (int): The number of timed runs per benchmark.
+        name_filter (str): Only run the benchmarks whose name contains this.
+
+    Returns:
+        Dict[str, dict]: ns_per_op for each benchmark and bytes_per_element for each footprint.
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if name_filter in name:
+            results[name] = {"ns_per_op": time_benchmark(setup, size, repeat)}
+    for name, build in FOOTPRINTS.items():
+        if name_filter in name:
+            results[f"{name}/footprint"] = {"bytes_per_element": measure_footprint(build, size)}
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the game object data structures.")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--size", type=int, default=50, help="board width and height")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark, the fastest is kept")
+    parser.add_argument("--out", help="where to save the results (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative increase")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.size, args.repeat, args.filter)
+    params = {"size": args.size}
+    for name, result in results.items():
+        for metric, value in result.items():
+            print(f"{name:<36} {value:>10.1f} {metric}")
+
+    out = args.out or os.path.join(RESULTS_DIR, datetime.now().strftime("game_objects_%Y%m%d_%H%M%S.json"))
+    save_results(out, results, params)
+    print(f"saved {out}")
+    if args.save_baseline:
+        save_results(args.baseline, results, params)
+        print(f"saved baseline {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        baseline, baseline_params = load_results(args.baseline)
+        try:
+            regressions = compare(results, baseline, args.tolerance, params=params, baseline_params=baseline_params)
+        except ValueError as e:
+            print(f"not comparing: {e}, run with --save-baseline to replace it")
+            return 2
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['id']} {regression['metric']}: "
+                f"{regression['baseline']:.1f} -> {regression['result']:.1f} ({regression['ratio']:.0%})"
+            )
+        if regressions:
+            return 1
+        print("no regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Saving and loading benchmark results shared by the benchmark runners.
+"""
+import json
+import os
+import platform
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def save_results(path: str, results: Dict[str, dict], params: Dict[str, Any]) -> None:
+    """Save results together with the parameters and the machine they were measured with."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=4)
+
+
+def load_results(path: str) -> Tuple[Dict[str, dict], Optional[Dict[str, Any]]]:
+    """Load the results saved by save_results and their parameters, None for files saved without them."""
+    with open(path, "r") as file:
+        report = json.load(file)
+    return report["results"], report.get("params")
+
+
+def compare(
+    results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float = 0.1,
+    metrics: Optional[Iterable[str]] = None, higher_is_better: Iterable[str] = (),
+    params: Optional[Dict[str, Any]] = None, baseline_params: Optional[Dict[str, Any]] = None
+) -> List[dict]:
+    """
+    Compare results against a baseline measured with the same parameters.
+
+    Args:
+        results (Dict[str, dict]): The new results by benchmark id.
+        baseline (Dict[str, dict]): The baseline results by benchmark id.
+        tolerance (float): The relative change for the worse allowed before a metric counts as a regression.
+        metrics (Optional[Iterable[str]]): The metrics to compare, every metric of a result if None.
+        higher_is_better (Iterable[str]): The metrics where higher is better, lower is better for the rest.
+        params (Optional[Dict[str, Any]]): The parameters the results were measured with, such as the board size.
+        baseline_params (Optional[Dict[str, Any]]): The parameters the baseline was measured with.
+
+    Returns:
+        List[dict]: The regressed metrics with their old and new values.
+
+    Raises:
+        ValueError: If the results and the baseline were measured with different parameters.
+    """
+    if params != baseline_params:
+        raise ValueError(f"the baseline was measured with {baseline_params}, not {params}")
+    higher_is_better = set(higher_is_better)
+    regressions = []
+    for name, result in results.items():
+        for metric in result if metrics is None else metrics:
+            old = baseline.get(name, {}).get(metric)
+            new = result.get(metric)
+            if not old or new is None:
+                continue
+            change = old - new if metric in higher_is_better else new - old
+            # relative to the size of the baseline, which can be negative for net counts
+            if change > abs(old) * tolerance:
+                regressions.append({"id": name, "metric": metric, "baseline": old, "result": new, "ratio": new / old})
+    return regressions
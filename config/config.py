@@ -1,6 +1,7 @@
 import pygame
 import json
 import os
+from diagnostics.tracer import tracer
 
 class GameConfig:
     _sound_cache = {}
@@ -24,7 +25,7 @@ class GameConfig:
             return json.load(file)
         
     def save_settings(self):
-        with open(self.settings_file, 'w') as file:
+        with tracer.span("save_settings", "config"), open(self.settings_file, 'w') as file:
             json.dump(self.settings, file, indent=4)
 
     def load_attributes(self):
@@ -123,6 +124,30 @@ class GameConfig:
         self.FOOD_COLOR = tuple(colors['FOOD_COLOR'])
         self.BORDER_COLOR = tuple(colors['BORDER_COLOR'])
         self.SNAKE_TRANS = colors['SNAKE_TRANS']
+
+        # replays
+        replay = self.settings['replay']
+        self.REPLAY_DIR = replay['DIR']
+        self.REPLAY_KEYFRAME_INTERVAL = replay['KEYFRAME_INTERVAL']
+
+        # rendering
+        self.RENDER_MODE = self.settings['rendering']['MODE']
+
+        # turbo, logic ticks batched per frame in AI only games
+        turbo = self.settings['turbo']
+        self.TURBO = turbo['ENABLED']
+        # ticks per second, 0 to tick as fast as the frame budget allows
+        self.TURBO_TICK_RATE = turbo['TICK_RATE']
+        self.TURBO_FRAME_BUDGET_MS = turbo['FRAME_BUDGET_MS']
+
+        # debug
+        debug = self.settings['debug']
+        self.SHOW_HUD = debug['SHOW_HUD']
+        # toggled with F3 while running
+        self.show_hud = self.SHOW_HUD
+        self.TRACE = debug['TRACE']
+        self.TRACE_CAPACITY = debug['TRACE_CAPACITY']
+        self.TRACE_DIR = debug['TRACE_DIR']
         
         
     def load_sounds(self):
@@ -0,0 +1,183 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Iterator, List, Optional
+
+TRACE_EXTENSION = ".json"
+
+
+class Tracer:
+    """
+    Records timed spans into a ring buffer and exports them as Chrome
+    trace-event JSON, which chrome://tracing and Perfetto open as a timeline.
+
+    A span is a name, a category, a start and an end in perf_counter_ns time.
+    Once the buffer is full the oldest spans are overwritten. Recording is off
+    until enable is called, and code on hot paths checks enabled before timing
+    anything, so a disabled tracer costs one attribute check.
+
+    Attributes:
+        enabled (bool): Whether spans are being recorded.
+        capacity (int): The number of spans the buffer holds.
+        count (int): The number of spans in the buffer.
+        dropped (int): The number of spans overwritten since the last clear.
+    """
+
+    def __init__(self, capacity: int = 100000) -> None:
+        """
+        Initialize a disabled tracer.
+
+        Args:
+            capacity (int): The number of spans the buffer holds.
+        """
+        self.enabled = False
+        self.resize(capacity)
+
+    def resize(self, capacity: int) -> None:
+        """
+        Allocate an empty buffer.
+
+        Args:
+            capacity (int): The number of spans the buffer holds.
+        """
+        if capacity < 1:
+            raise ValueError(f"Trace capacity must be positive: {capacity}")
+        self.capacity = capacity
+        self.names: List[str] = [""] * capacity
+        self.categories: List[str] = [""] * capacity
+        self.starts = [0] * capacity
+        self.durations = [0] * capacity
+        self.args: List[Optional[dict]] = [None] * capacity
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every recorded span."""
+        self.slot = 0
+        self.count = 0
+        self.dropped = 0
+
+    def enable(self, capacity: Optional[int] = None) -> None:
+        """
+        Start recording spans.
+
+        Args:
+            capacity (Optional[int]): A new buffer size, the current one is kept if None.
+        """
+        if capacity is not None and capacity != self.capacity:
+            self.resize(capacity)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans, keeping the ones recorded so far."""
+        self.enabled = False
+
+    def add(self, name: str, category: str, start_ns: int, end_ns: int, args: Optional[dict] = None) -> None:
+        """
+        Record a span that has already ended.
+
+        Args:
+            name (str): The name of the span.
+            category (str): The category of the span.
+            start_ns (int): The perf_counter_ns time the span started at.
+            end_ns (int): The perf_counter_ns time the span ended at.
+            args (Optional[dict]): Extra values shown with the span.
+        """
+        slot = self.slot
+        self.names[slot] = name
+        self.categories[slot] = category
+        self.starts[slot] = start_ns
+        self.durations[slot] = end_ns - start_ns
+        self.args[slot] = args
+        self.slot = (slot + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.dropped += 1
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Optional[dict] = None) -> Iterator[None]:
+        """
+        Record the time spent in a with block, when enabled.
+
+        Args:
+            name (str): The name of the span.
+            category (str): The category of the span.
+            args (Optional[dict]): Extra values shown with the span.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, perf_counter_ns(), args)
+
+    def get_events(self) -> List[dict]:
+        """
+        Get the recorded spans as trace events, oldest first.
+
+        Returns:
+            List[dict]: Complete ('X') events with times in microseconds.
+        """
+        pid = os.getpid()
+        first = (self.slot - self.count) % self.capacity
+        events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "Snake AI 2"}},
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "game loop"}},
+        ]
+        for i in range(self.count):
+            slot = (first + i) % self.capacity
+            event = {
+                "name": self.names[slot],
+                "cat": self.categories[slot],
+                "ph": "X",
+                "ts": self.starts[slot] / 1000,
+                "dur": self.durations[slot] / 1000,
+                "pid": pid,
+                "tid": 0,
+            }
+            if self.args[slot] is not None:
+                event["args"] = self.args[slot]
+            events.append(event)
+        return events
+
+    def save(self, path: str) -> None:
+        """
+        Write the recorded spans to a Chrome trace-event file.
+
+        Args:
+            path (str): The path of the trace file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        trace = {
+            "traceEvents": self.get_events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped": self.dropped},
+        }
+        with open(path, "w") as file:
+            json.dump(trace, file, separators=(",", ":"))
+
+
+def save_trace(directory: str, trace: Optional[Tracer] = None) -> str:
+    """
+    Save a tracer's spans to a new timestamped file.
+
+    Args:
+        directory (str): The directory to write the trace into.
+        trace (Optional[Tracer]): The tracer to save, the shared tracer if None.
+
+    Returns:
+        str: The path of the trace file.
+    """
+    path = os.path.join(directory, time.strftime("trace_%Y%m%d_%H%M%S") + TRACE_EXTENSION)
+    (trace or tracer).save(path)
+    return path
+
+
+# the tracer shared by the game loop, the game logic and the config
+tracer = Tracer()
@@ -2,6 +2,7 @@ import pygame
 import sys
 from abc import ABC, abstractmethod
 from config.config import GameConfig
+from diagnostics.tracer import tracer, save_trace
 
 
 class EventHandler(ABC):
@@ -28,6 +29,10 @@ class EventHandler(ABC):
                 or event.type == pygame.MOUSEBUTTONUP
             ):
                 self.handle_mouse_button_down(event)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.config.show_hud = not self.config.show_hud
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.dump_trace()
             elif event.type == pygame.KEYDOWN:
                 self.handle_key_down(event)
             elif event.type == pygame.KEYUP:
@@ -39,6 +44,14 @@ class EventHandler(ABC):
         pygame.quit()
         sys.exit()
 
+    def dump_trace(self) -> None:
+        """Save the recorded trace, or start tracing if it is off."""
+        if not tracer.enabled:
+            tracer.enable(self.config.TRACE_CAPACITY)
+            print("Tracing started, press F9 again to save the trace.")
+            return
+        print(f"Trace saved to {save_trace(self.config.TRACE_DIR)}")
+
     def handle_resize(self, event: pygame.event.Event) -> None:
         """Handle the window resize event."""
         self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
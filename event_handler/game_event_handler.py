@@ -43,6 +43,8 @@ class GameEventHandler(EventHandler):
         elif event.key == pygame.K_SPACE:
             self.play_game.curr_speed *= self.play_game.config.game_speed_mult
             self.play_game.mult = True
+        elif event.key == pygame.K_t:
+            self.play_game.set_turbo(not self.play_game.turbo)
         elif event.key == pygame.K_ESCAPE:
             self.play_game.running = False
             
@@ -0,0 +1,30 @@
+import pygame
+from event_handler.game_event_handler import GameEventHandler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from interfaces.replay_game import ReplayGame
+
+
+class ReplayEventHandler(GameEventHandler):
+    """Handles all events for replay playback."""
+
+    def __init__(self, replay_game: "ReplayGame") -> None:
+        """Initialize the EventHandler with a reference to the ReplayGame instance."""
+        super().__init__(replay_game)
+        self.replay_game = replay_game
+
+    def handle_key_down(self, event: pygame.event.Event) -> None:
+        """Handle the key down event."""
+        if event.key == pygame.K_p:
+            self.replay_game.set_paused(not self.replay_game.paused)
+        elif event.key == pygame.K_RIGHT:
+            self.replay_game.seek(self.replay_game.SEEK_TICKS)
+        elif event.key == pygame.K_LEFT:
+            self.replay_game.seek(-self.replay_game.SEEK_TICKS)
+            self.replay_game.set_paused(False)
+        elif event.key == pygame.K_HOME:
+            self.replay_game.restart()
+            self.replay_game.set_paused(False)
+        else:
+            super().handle_key_down(event)
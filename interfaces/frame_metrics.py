@@ -0,0 +1,113 @@
+from time import perf_counter_ns
+from typing import Dict, List
+
+
+class FrameMetrics:
+    """
+    Frame pacing figures over a window of recent frames: frame times, logic
+    ticks per frame, the backlog left in the logic accumulator and the time
+    spent in each phase of the frame.
+
+    The window is a fixed set of ring buffers, so recording a frame never allocates.
+    """
+
+    # waiting on the frame clock, game logic, events, drawing and flipping the display
+    PHASES = ("wait", "logic", "events", "draw", "flip")
+
+    def __init__(self, window: int = 240) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            window (int): The number of recent frames to keep.
+        """
+        self.window = window
+        self.frame_ns = [0] * window
+        self.ticks = [0] * window
+        self.backlog = [0.0] * window
+        self.phase_ns: Dict[str, List[int]] = {phase: [0] * window for phase in self.PHASES}
+        self.count = 0
+        self.slot = 0
+        self.frame_start = 0
+        self.frame_ticks = 0
+        self.frame_backlog = 0.0
+
+    def begin_frame(self) -> None:
+        """Start timing a frame, closing the previous one."""
+        now = perf_counter_ns()
+        if self.frame_start:
+            self.end_frame(now)
+        self.frame_start = now
+        self.frame_ticks = 0
+        self.frame_backlog = 0.0
+        for times in self.phase_ns.values():
+            times[self.slot] = 0
+
+    def end_frame(self, now: int) -> None:
+        """
+        Store the frame that started at the last begin_frame.
+
+        Args:
+            now (int): The perf_counter_ns time the frame ended at.
+        """
+        slot = self.slot
+        self.frame_ns[slot] = now - self.frame_start
+        self.ticks[slot] = self.frame_ticks
+        self.backlog[slot] = self.frame_backlog
+        self.slot = (slot + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+
+    def add_phase(self, phase: str, elapsed_ns: int) -> None:
+        """
+        Add time to a phase of the current frame.
+
+        Args:
+            phase (str): One of PHASES.
+            elapsed_ns (int): The time spent.
+        """
+        self.phase_ns[phase][self.slot] += elapsed_ns
+
+    def set_logic(self, ticks: int, backlog: float) -> None:
+        """
+        Record the logic updates of the current frame.
+
+        Args:
+            ticks (int): The number of logic ticks run in the frame.
+            backlog (float): The ticks still owed by the accumulator after the frame.
+        """
+        self.frame_ticks = ticks
+        self.frame_backlog = backlog
+
+    def get_summary(self) -> dict:
+        """
+        Get the figures over the recorded frames.
+
+        Returns:
+            dict: fps, frame time percentiles and max in ms, mean ticks per frame,
+                the last and largest backlog in ticks and the mean ms of each phase.
+        """
+        if not self.count:
+            return {"fps": 0.0, "frame_p50_ms": 0.0, "frame_p95_ms": 0.0, "frame_p99_ms": 0.0,
+                    "frame_max_ms": 0.0, "ticks_per_frame": 0.0, "backlog": 0.0, "max_backlog": 0.0,
+                    "phases_ms": {phase: 0.0 for phase in self.PHASES}}
+        count = self.count
+        frames = sorted(self.frame_ns[:count]) if count < self.window else sorted(self.frame_ns)
+        last = (self.slot - 1) % self.window
+        recorded = range(count) if count < self.window else range(self.window)
+
+        def percentile(p: float) -> float:
+            return frames[min(count - 1, int(p * count))] / 1e6
+
+        return {
+            "fps": 1e9 * count / sum(frames) if sum(frames) else 0.0,
+            "frame_p50_ms": percentile(0.50),
+            "frame_p95_ms": percentile(0.95),
+            "frame_p99_ms": percentile(0.99),
+            "frame_max_ms": frames[-1] / 1e6,
+            "ticks_per_frame": sum(self.ticks[i] for i in recorded) / count,
+            "backlog": self.backlog[last],
+            "max_backlog": max(self.backlog[i] for i in recorded),
+            "phases_ms": {
+                phase: sum(times[i] for i in recorded) / count / 1e6 for phase, times in self.phase_ns.items()
+            },
+        }
@@ -1,10 +1,13 @@
 import pygame
 from abc import abstractmethod
+from time import perf_counter_ns
 from interfaces.interface import Interface
 
 class GameInterface(Interface):
     """Abstract base class for game interfaces."""
     MILLISECONDS_PER_SECOND = 1000
+    # most time owed to the logic, so ticks slower than the game speed drop behind instead of piling up
+    MAX_BACKLOG_MS = 250
 
     def __init__(self, screen: pygame.Surface, config) -> None:
         """Initialize the game interface with screen, dimensions, and configuration."""
@@ -14,15 +17,21 @@ class GameInterface(Interface):
         self.time_accumulator = 0  # Time accumulator for logic updates
         self.curr_speed = self.config.game_speed
         self.mult = False
+        self.hud_shown = False
+        self.turbo = False
 
     def handle_logic(self) -> None:
         """Handle the game timing and updates based on game speed."""
-        delta_time = self.clock.tick(self.config.FPS)  # Get the time elapsed since the last frame in milliseconds
+        delta_time = self.tick_clock()  # Get the time elapsed since the last frame in milliseconds
+        if self.turbo:
+            self.handle_turbo_logic(delta_time)
+            return
+        ticks = 0
+        update_interval = GameInterface.MILLISECONDS_PER_SECOND // self.curr_speed
         if not self.paused:
-            self.time_accumulator += delta_time
-
-            # Calculate the update interval based on actual game speed
-            update_interval = GameInterface.MILLISECONDS_PER_SECOND // self.curr_speed
+            self.time_accumulator = min(
+                self.time_accumulator + delta_time, max(GameInterface.MAX_BACKLOG_MS, update_interval)
+            )
 
             # Update the game logic based on the time accumulated
             while self.time_accumulator >= update_interval:
@@ -30,7 +39,57 @@ class GameInterface(Interface):
                     self.running = False
                     break
                 self.time_accumulator -= update_interval
+                ticks += 1
+        self.metrics.set_logic(ticks, self.time_accumulator / update_interval)
+
+    def handle_turbo_logic(self, delta_time: int) -> None:
+        """
+        Run a batch of logic ticks, stopping once the frame budget is spent so
+        events and drawing still happen every frame. Without a tick rate the
+        batch fills the budget. With one, ticks the budget could not fit are
+        dropped instead of carried into the next frame.
+
+        Args:
+            delta_time (int): The milliseconds since the last frame.
+        """
+        deadline = perf_counter_ns() + self.config.TURBO_FRAME_BUDGET_MS * 1_000_000
+        rate = self.config.TURBO_TICK_RATE
+        update_interval = GameInterface.MILLISECONDS_PER_SECOND / rate if rate else 0
+        ticks = 0
+        if not self.paused:
+            if rate:
+                self.time_accumulator += delta_time
+            while not rate or self.time_accumulator >= update_interval:
+                if not self.update_game_logic():
+                    self.running = False
+                    break
+                self.time_accumulator -= update_interval
+                ticks += 1
+                if perf_counter_ns() >= deadline:
+                    if rate:
+                        self.time_accumulator %= update_interval
+                    break
+        self.metrics.set_logic(ticks, self.time_accumulator / update_interval if rate else 0)
+
+    def can_turbo(self) -> bool:
+        """Check if the game may run in turbo."""
+        return True
+
+    def set_turbo(self, turbo: bool) -> None:
+        """Switch turbo on or off, if the game may run in turbo."""
+        self.turbo = turbo and self.can_turbo()
+        self.time_accumulator = 0
 
+    def draw_static_layers(self) -> None:
+        """
+        Start a full frame from the compositor's cached layers. When they did not
+        change and the HUD was not drawn over the screen, only the game board is
+        restored and pushed to the display.
+        """
+        # the HUD is drawn outside the board, restore everything while it shows and once after
+        area = None if self.config.show_hud or self.hud_shown else self.game_rd.get_board_rect()
+        self.hud_shown = self.config.show_hud
+        self.update_rects = None if self.compositor.draw(area) else [area]
 
     @abstractmethod
     def update_game_logic(self) -> bool:
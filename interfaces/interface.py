@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from time import perf_counter_ns
 import pygame
 from config.config import GameConfig
+from interfaces.frame_metrics import FrameMetrics
+from rendering.metrics_hud import MetricsHud
+from diagnostics.tracer import tracer
 
 
 class Interface(ABC):
@@ -12,19 +16,62 @@ class Interface(ABC):
         self.config = config
         self.running = True
         self.clock = pygame.time.Clock()
+        self.metrics = FrameMetrics()
+        self.hud = MetricsHud(screen, config)
+        # the screen areas draw changed, None to flip the whole display
+        self.update_rects = None
 
 
     def run(self) -> str:
         """Run the main game loop."""
+        metrics = self.metrics
         while self.running:
+            metrics.begin_frame()
+            frame_start = start = perf_counter_ns()
             self.handle_logic()
+            now = perf_counter_ns()
+            # the clock's wait is recorded on its own by tick_clock
+            metrics.add_phase("logic", now - start - metrics.phase_ns["wait"][metrics.slot])
+            if tracer.enabled:
+                tracer.add("logic", "frame", start, now)
+            start = now
             self.handle_events()
+            now = perf_counter_ns()
+            metrics.add_phase("events", now - start)
+            if tracer.enabled:
+                tracer.add("events", "frame", start, now)
+            start = now
             self.draw()
-            pygame.display.flip()
+            if self.config.show_hud:
+                self.hud.draw(metrics)
+            now = perf_counter_ns()
+            metrics.add_phase("draw", now - start)
+            if tracer.enabled:
+                tracer.add("draw", "frame", start, now)
+            start = now
+            if self.update_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self.update_rects)
+            now = perf_counter_ns()
+            metrics.add_phase("flip", now - start)
+            if tracer.enabled:
+                tracer.add("flip", "frame", start, now)
+                tracer.add("frame", "frame", frame_start, now, {"class": type(self).__name__})
 
             
     def handle_logic(self) -> None:
-        self.clock.tick(self.config.FPS)
+        self.tick_clock()
+
+    def tick_clock(self) -> int:
+        """Wait for the next frame and return the milliseconds since the last one."""
+        start = perf_counter_ns()
+        delta_time = self.clock.tick(self.config.FPS)
+        now = perf_counter_ns()
+        self.metrics.add_phase("wait", now - start)
+        if tracer.enabled:
+            tracer.add("wait", "frame", start, now)
+        return delta_time
 
     @abstractmethod
     def handle_events(self) -> None:
@@ -1,10 +1,14 @@
+import os
+import time
 import pygame
 from rendering.game_ui_manager import GameUIManager
 from rendering.game_renderer import GameRenderer
+from rendering.compositor import Compositor
 from logic.game_logic_human import GameLogicHuman
 from config.config import GameConfig
 from event_handler.game_event_handler import GameEventHandler
 from interfaces.game_interface import GameInterface
+from logic.replay import ReplayRecorder, REPLAY_EXTENSION
 
 class PlayGame(GameInterface):
     """Manages the main game loop and game state."""
@@ -14,6 +18,9 @@ class PlayGame(GameInterface):
         super().__init__(screen, config)
         self.ui = GameUIManager(screen, config)
         self.game_rd = GameRenderer(screen, config)
+        self.compositor = Compositor(screen)
+        self.ui.add_layers(self.compositor)
+        self.game_rd.add_layers(self.compositor)
         self.event_handler = GameEventHandler(self)
         controllers = self.init_controller_types(config, config.n_snakes)
         self.logic = GameLogicHuman(
@@ -22,13 +29,41 @@ class PlayGame(GameInterface):
             controllers=controllers,
             snake_size=config.snake_size,
             num_snakes=config.n_snakes,
-            game_mode=config.game_mode
+            game_mode=config.game_mode,
+            cell_index=True
         )
+        self.recorder = ReplayRecorder(self.logic, config.REPLAY_KEYFRAME_INTERVAL)
+        # matches started without human players end on their own, human games wait for Back
+        self.ai_only = not self.logic.human_controllers
+        if config.RENDER_MODE not in GameRenderer.RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {config.RENDER_MODE}")
+        self.render_mode = config.RENDER_MODE
+        if self.render_mode == "dirty":
+            self.game_rd.track(self.logic)
+        self.set_turbo(config.TURBO)
         self.ui.init()
 
+    def run(self) -> str:
+        """Run the game loop and save the replay once it ends."""
+        super().run()
+        self.save_replay()
+
+    def save_replay(self) -> None:
+        """Save the recorded game to the replay directory."""
+        if self.recorder.ticks == 0:
+            return
+        filename = time.strftime("replay_%Y%m%d_%H%M%S") + REPLAY_EXTENSION
+        self.recorder.save(os.path.join(self.config.REPLAY_DIR, filename))
+
     def update_game_logic(self) -> bool:
-        """Update the game logic."""
-        return self.logic.update()
+        """Update the game logic and record the tick, ending AI only matches once every snake is gone."""
+        result = self.logic.update()
+        self.recorder.record_tick()
+        return result and not (self.ai_only and not self.logic.keys)
+
+    def can_turbo(self) -> bool:
+        """Only games without living human players can run in turbo."""
+        return not self.logic.human_controllers
 
     def handle_events(self) -> None:
         """Handle the game events."""
@@ -36,7 +71,20 @@ class PlayGame(GameInterface):
 
     def draw(self) -> None:
         """Update game elements such as UI and renderer dimensions and Draw the game elements."""
-        self.ui.draw()
+        self.update_rects = None
+        self.game_rd.update_screen_size()
+        if self.render_mode == "dirty":
+            if self.config.show_hud or self.compositor.is_stale():
+                # the HUD is blended over the screen and changed layers cover it, redraw everything
+                self.game_rd.invalidate()
+            rects = self.game_rd.update_dirty()
+            if rects is not None:
+                self.update_rects = rects
+                return
+        self.draw_static_layers()
+        if self.render_mode == "lowres":
+            self.game_rd.update_low_res(self.logic)
+            return
         snake_data = self.logic.get_all_snakes_body_and_direction()
         self.game_rd.update(snake_data, self.logic.get_food_position())
 
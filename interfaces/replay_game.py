@@ -0,0 +1,69 @@
+import pygame
+from rendering.game_ui_manager import GameUIManager
+from rendering.game_renderer import GameRenderer
+from rendering.compositor import Compositor
+from logic.game_logic_human import GameLogicHuman
+from logic.replay import load_replay
+from config.config import GameConfig
+from event_handler.replay_event_handler import ReplayEventHandler
+from interfaces.game_interface import GameInterface
+
+
+class ReplayGame(GameInterface):
+    """Plays back a recorded game, streaming ticks from the replay file as they are needed."""
+    SEEK_TICKS = 50
+
+    def __init__(self, screen: pygame.Surface, config: GameConfig, path: str) -> None:
+        """Initialize the ReplayGame class."""
+        super().__init__(screen, config)
+        self.replay = load_replay(path)
+        self.logic = self.replay.create_game(GameLogicHuman, cell_index=True)
+        self.ui = GameUIManager(screen, config)
+        self.game_rd = GameRenderer(
+            screen, config, board_size=(self.replay.header["width"], self.replay.header["height"])
+        )
+        self.compositor = Compositor(screen)
+        self.ui.add_layers(self.compositor)
+        self.game_rd.add_layers(self.compositor)
+        self.event_handler = ReplayEventHandler(self)
+        self.ui.init()
+
+    def run(self) -> str:
+        """Run the playback loop and release the replay file once it ends."""
+        super().run()
+        self.replay.close()
+
+    def update_game_logic(self) -> bool:
+        """Play the next recorded tick, pausing on the last one."""
+        tick = self.logic.get_step_count()
+        if tick >= self.replay.ticks:
+            self.set_paused(True)
+            return True
+        self.replay.step(self.logic, tick)
+        return True
+
+    def seek(self, delta: int) -> None:
+        """Jump forwards or backwards by a number of ticks."""
+        self.replay.seek(self.logic, self.logic.get_step_count() + delta)
+        self.time_accumulator = 0
+
+    def restart(self) -> None:
+        """Jump back to the start of the replay."""
+        self.replay.seek(self.logic, 0)
+        self.time_accumulator = 0
+
+    def set_paused(self, paused: bool) -> None:
+        """Pause or resume playback."""
+        self.paused = paused
+        self.game_rd.paused = paused
+
+    def handle_events(self) -> None:
+        """Handle the game events."""
+        self.event_handler.handle_events()
+
+    def draw(self) -> None:
+        """Update game elements such as UI and renderer dimensions and Draw the game elements."""
+        self.game_rd.update_screen_size()
+        self.draw_static_layers()
+        snake_data = self.logic.get_all_snakes_body_and_direction()
+        self.game_rd.update(snake_data, self.logic.get_food_position())
@@ -0,0 +1,346 @@
+import numpy as np
+from logic.game_objects.snake_spawner import SnakeSpawner
+from logic.controller.controller import Controller
+from typing import Optional, Tuple, List
+
+
+class BatchGameLogic:
+    """
+    Headless game logic that advances many boards at once.
+
+    Every board follows the same rules as GameLogic.update_normal: snakes are
+    updated one at a time in a random order, they move, eat, grow, die on
+    walls or bodies, dead snakes retract their tail until they disappear and
+    food respawns on a random free cell. The state of all boards lives in
+    NumPy arrays, so a step costs a fixed number of array operations per snake
+    slot instead of one Python object graph per board.
+
+    Cells are encoded as ``y * width + x`` and directions as indices into
+    Controller.DIRECTIONS.
+
+    Attributes:
+        num_boards (int): The number of boards simulated in parallel.
+        width (int): The width of each board.
+        height (int): The height of each board.
+        num_snakes (int): The number of snakes on each board.
+        grid (np.ndarray): Per-board occupancy counts, shape (boards, cells).
+        food (np.ndarray): Per-board food cell, -1 when there is no food.
+        scores (np.ndarray): Food eaten on each board in the current game.
+        steps (np.ndarray): Steps taken on each board in the current game.
+        alive (np.ndarray): Per-snake alive flags, shape (boards, snakes).
+        exists (np.ndarray): Per-snake exists flags, shape (boards, snakes).
+        directions (np.ndarray): Per-snake direction indices, shape (boards, snakes).
+    """
+
+    DX = np.array([direction[0] for direction in Controller.DIRECTIONS], dtype=np.int32)
+    DY = np.array([direction[1] for direction in Controller.DIRECTIONS], dtype=np.int32)
+
+    def __init__(
+        self,
+        num_boards: int,
+        width: int,
+        height: int,
+        snake_size: int = 3,
+        num_snakes: int = 1,
+        max_steps: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the batch with every board in its starting state.
+
+        Args:
+            num_boards (int): The number of boards to simulate.
+            width (int): The width of each board.
+            height (int): The height of each board.
+            snake_size (int): The initial size of each snake (default is 3).
+            num_snakes (int): The number of snakes per board (default is 1).
+            max_steps (int): Steps after which a board is finished, 0 for no limit.
+            seed (Optional[int]): Seed for the random number generator.
+        """
+        self.num_boards = num_boards
+        self.width = width
+        self.height = height
+        self.snake_size = snake_size
+        self.max_steps = max_steps
+        self.cells = width * height
+        self.rng = np.random.default_rng(seed)
+
+        spawns = SnakeSpawner(width, height, num_snakes).get_spawns()[:num_snakes]
+        self.num_snakes = len(spawns)
+        self.start_cells = np.array([y * width + x for (x, y), _ in spawns], dtype=np.int32)
+        self.start_directions = np.array(
+            [Controller.DIRECTIONS.index(direction) for _, direction in spawns], dtype=np.int8
+        )
+
+        # A snake can never hold more segments than free cells plus its stacked start
+        self.capacity = self.cells + snake_size + 1
+        cell_type = np.int16 if self.cells < 2 ** 15 else np.int32
+        shape = (num_boards, self.num_snakes)
+
+        self.bodies = np.zeros(shape + (self.capacity,), dtype=cell_type)
+        self.head_idx = np.zeros(shape, dtype=np.int32)
+        self.length = np.zeros(shape, dtype=np.int32)
+        self.alive = np.zeros(shape, dtype=bool)
+        self.exists = np.zeros(shape, dtype=bool)
+        self.directions = np.zeros(shape, dtype=np.int8)
+
+        self.grid = np.zeros((num_boards, self.cells), dtype=np.uint8)
+        self.free_list = np.zeros((num_boards, self.cells), dtype=np.int32)
+        self.free_pos = np.zeros((num_boards, self.cells), dtype=np.int32)
+        self.free_count = np.zeros(num_boards, dtype=np.int32)
+
+        self.food = np.full(num_boards, -1, dtype=np.int32)
+        self.scores = np.zeros(num_boards, dtype=np.int32)
+        self.steps = np.zeros(num_boards, dtype=np.int32)
+        self.boards = np.arange(num_boards)
+
+        self.init_templates()
+        self.reset()
+
+    def init_templates(self) -> None:
+        """
+        Build the starting grid and free-cell set shared by every new game.
+        """
+        grid = np.zeros(self.cells, dtype=np.uint8)
+        np.add.at(grid, self.start_cells, self.snake_size)
+        free_cells = np.flatnonzero(grid == 0)
+
+        self.grid_template = grid
+        self.free_list_template = np.zeros(self.cells, dtype=np.int32)
+        self.free_list_template[:len(free_cells)] = free_cells
+        self.free_pos_template = np.full(self.cells, -1, dtype=np.int32)
+        self.free_pos_template[free_cells] = np.arange(len(free_cells), dtype=np.int32)
+        self.free_count_template = len(free_cells)
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Reset boards to their starting state.
+
+        Args:
+            mask (Optional[np.ndarray]): Boolean mask of boards to reset, all boards if None.
+        """
+        boards = self.boards if mask is None else np.flatnonzero(mask)
+        if len(boards) == 0:
+            return
+
+        self.bodies[boards, :, :self.snake_size] = self.start_cells[:, None]
+        self.head_idx[boards] = 0
+        self.length[boards] = self.snake_size
+        self.alive[boards] = True
+        self.exists[boards] = True
+        self.directions[boards] = self.start_directions
+
+        self.grid[boards] = self.grid_template
+        self.free_list[boards] = self.free_list_template
+        self.free_pos[boards] = self.free_pos_template
+        self.free_count[boards] = self.free_count_template
+
+        self.food[boards] = -1
+        self.scores[boards] = 0
+        self.steps[boards] = 0
+
+    def step(self, actions: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every board by one step.
+
+        Finished boards are reset in place after their final score is reported.
+
+        Args:
+            actions (Optional[np.ndarray]): Direction indices of shape (boards, snakes).
+                Snakes keep their current direction when None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The score and done flag of each board.
+        """
+        if actions is not None:
+            self.directions[:] = actions
+
+        # iterate in random order to balance who has prio
+        order = np.argsort(self.rng.random((self.num_boards, self.num_snakes)), axis=1)
+        for slot in range(self.num_snakes):
+            self.update_slot(order[:, slot])
+            self.update_food()
+
+        self.steps += 1
+        dones = ~self.alive.any(axis=1)
+        if self.max_steps:
+            dones |= self.steps >= self.max_steps
+
+        scores = self.scores.copy()
+        if dones.any():
+            self.reset(dones)
+        return scores, dones
+
+    def update_slot(self, keys: np.ndarray) -> None:
+        """
+        Update one snake on every board.
+
+        Args:
+            keys (np.ndarray): The index of the snake to update on each board.
+        """
+        exists = self.exists[self.boards, keys]
+        alive = self.alive[self.boards, keys]
+
+        dead = exists & ~alive
+        if dead.any():
+            boards, snakes = self.boards[dead], keys[dead]
+            self.pop_tail(boards, snakes)
+            self.update_exists(boards, snakes)
+
+        moving = exists & alive
+        if not moving.any():
+            return
+        boards, snakes = self.boards[moving], keys[moving]
+
+        head = self.bodies[boards, snakes, self.head_idx[boards, snakes]].astype(np.int32)
+        direction = self.directions[boards, snakes]
+        x = head % self.width + self.DX[direction]
+        y = head // self.width + self.DY[direction]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+
+        in_boards, in_snakes = boards[inside], snakes[inside]
+        new_head = (y * self.width + x)[inside]
+        self.push_head(in_boards, in_snakes, new_head)
+        self.pop_tail(boards, snakes)
+
+        ate = self.food[in_boards] == new_head
+        if ate.any():
+            self.grow(in_boards[ate], in_snakes[ate])
+            self.scores[in_boards[ate]] += 1
+            self.food[in_boards[ate]] = -1
+
+        crashed = self.grid[in_boards, new_head] > 1
+        if crashed.any():
+            self.pop_head(in_boards[crashed], in_snakes[crashed])
+
+        died = ~inside
+        died[inside] = crashed
+        if died.any():
+            boards, snakes = boards[died], snakes[died]
+            self.alive[boards, snakes] = False
+            self.update_exists(boards, snakes)
+
+    def update_exists(self, boards: np.ndarray, snakes: np.ndarray) -> None:
+        """
+        Mark snakes without any segments left as no longer existing.
+        """
+        self.exists[boards, snakes] = self.length[boards, snakes] > 0
+
+    def update_food(self) -> None:
+        """
+        Respawn food on a random free cell of every board without food.
+        """
+        boards = np.flatnonzero((self.food < 0) & (self.free_count > 0))
+        if len(boards) == 0:
+            return
+        idx = (self.rng.random(len(boards)) * self.free_count[boards]).astype(np.int32)
+        self.food[boards] = self.free_list[boards, idx]
+
+    def push_head(self, boards: np.ndarray, snakes: np.ndarray, cells: np.ndarray) -> None:
+        """
+        Add a new head segment to the given snakes.
+        """
+        idx = (self.head_idx[boards, snakes] - 1) % self.capacity
+        self.bodies[boards, snakes, idx] = cells
+        self.head_idx[boards, snakes] = idx
+        self.length[boards, snakes] += 1
+        self.occupy(boards, cells)
+
+    def pop_head(self, boards: np.ndarray, snakes: np.ndarray) -> None:
+        """
+        Remove the head segment of the given snakes.
+        """
+        idx = self.head_idx[boards, snakes]
+        cells = self.bodies[boards, snakes, idx].astype(np.int32)
+        self.head_idx[boards, snakes] = (idx + 1) % self.capacity
+        self.length[boards, snakes] -= 1
+        self.vacate(boards, cells)
+
+    def pop_tail(self, boards: np.ndarray, snakes: np.ndarray) -> None:
+        """
+        Remove the tail segment of the given snakes.
+        """
+        idx = (self.head_idx[boards, snakes] + self.length[boards, snakes] - 1) % self.capacity
+        cells = self.bodies[boards, snakes, idx].astype(np.int32)
+        self.length[boards, snakes] -= 1
+        self.vacate(boards, cells)
+
+    def grow(self, boards: np.ndarray, snakes: np.ndarray) -> None:
+        """
+        Grow the given snakes by repeating their tail segment.
+        """
+        tail_idx = (self.head_idx[boards, snakes] + self.length[boards, snakes] - 1) % self.capacity
+        cells = self.bodies[boards, snakes, tail_idx]
+        self.bodies[boards, snakes, (tail_idx + 1) % self.capacity] = cells
+        self.length[boards, snakes] += 1
+        self.occupy(boards, cells.astype(np.int32))
+
+    def occupy(self, boards: np.ndarray, cells: np.ndarray) -> None:
+        """
+        Add one segment to each cell and drop newly occupied cells from the free set.
+        """
+        was_free = self.grid[boards, cells] == 0
+        self.grid[boards, cells] += 1
+        if not was_free.any():
+            return
+        boards, cells = boards[was_free], cells[was_free]
+        idx = self.free_pos[boards, cells]
+        last = self.free_count[boards] - 1
+        last_cells = self.free_list[boards, last]
+        self.free_list[boards, idx] = last_cells
+        self.free_pos[boards, last_cells] = idx
+        self.free_pos[boards, cells] = -1
+        self.free_count[boards] = last
+
+    def vacate(self, boards: np.ndarray, cells: np.ndarray) -> None:
+        """
+        Remove one segment from each cell and add newly empty cells to the free set.
+        """
+        self.grid[boards, cells] -= 1
+        now_free = self.grid[boards, cells] == 0
+        if not now_free.any():
+            return
+        boards, cells = boards[now_free], cells[now_free]
+        idx = self.free_count[boards]
+        self.free_list[boards, idx] = cells
+        self.free_pos[boards, cells] = idx
+        self.free_count[boards] = idx + 1
+
+    def get_heads(self) -> np.ndarray:
+        """
+        Get the head cell of every snake.
+
+        Returns:
+            np.ndarray: Head cells of shape (boards, snakes); stale for snakes that no longer exist.
+        """
+        idx = self.head_idx[:, :, None]
+        return np.take_along_axis(self.bodies, idx, axis=2)[:, :, 0].astype(np.int32)
+
+    def get_snake_body(self, board: int, snake_id: int) -> List[Tuple[int, int]]:
+        """
+        Get the positions of a snake's body, head first.
+
+        Args:
+            board (int): The index of the board.
+            snake_id (int): The index of the snake on the board.
+
+        Returns:
+            List[Tuple[int, int]]: The positions of the snake's body.
+        """
+        idx = (self.head_idx[board, snake_id] + np.arange(self.length[board, snake_id])) % self.capacity
+        return [(int(cell) % self.width, int(cell) // self.width) for cell in self.bodies[board, snake_id, idx]]
+
+    def get_food_position(self, board: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the position of the food on a board.
+
+        Args:
+            board (int): The index of the board.
+
+        Returns:
+            Optional[Tuple[int, int]]: The position of the food, or None if there is no food.
+        """
+        cell = int(self.food[board])
+        if cell < 0:
+            return None
+        return cell % self.width, cell // self.width
@@ -0,0 +1,83 @@
+from logic.controller.controller import Controller
+from logic.game_objects.snake import Snake
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logic.game_logic import GameLogic
+
+
+class BFSController(Controller):
+    """
+    AI controller that follows the shortest path to the food, read from the
+    distance field the game shares between all snakes.
+    """
+
+    def __init__(self, starting_direction) -> None:
+        """
+        Initialize the controller, it has no game until attached.
+
+        Args:
+            starting_direction (Tuple[int, int]): The initial direction of the controller.
+        """
+        super().__init__(starting_direction)
+        self.game_logic: Optional["GameLogic"] = None
+
+    def attach(self, game_logic: "GameLogic") -> None:
+        """
+        Keep a reference to the game to read its distance field.
+
+        Args:
+            game_logic (GameLogic): The game the controller plays in.
+        """
+        self.game_logic = game_logic
+
+    def get_direction(
+        self,
+        snake: Snake,
+        food_pos: Tuple[int, int],
+        width: int,
+        height: int,
+        snakes: Dict[int, Snake],
+        keys: List[int]
+    ) -> Tuple[int, int]:
+        """
+        Step onto the free neighbour closest to the food, or any free neighbour
+        when the food cannot be reached.
+
+        Args:
+            snake (Snake): The snake object.
+            food_pos (Tuple[int, int]): The position of the food.
+            width (int): The width of the game board.
+            height (int): The height of the game board.
+            snakes (Dict[int, Snake]): All snakes in the game.
+            keys (List[int]): The keys of the snakes still in the game.
+
+        Returns:
+            Tuple[int, int]: The best direction as (x, y) coordinates.
+        """
+        field = self.game_logic.get_distance_field()
+        occupancy = snake.occupancy
+        head = snake.get_head()
+        best_distance = None
+        best_direction = None
+
+        for direction in self.DIRECTIONS:
+            if direction == self.opposite_direction:
+                continue
+            if snake.codec is not None:
+                next_position = snake.codec.step(head, direction)
+            else:
+                next_position = (head[0] + direction[0], head[1] + direction[1])
+            if not occupancy.is_free(next_position):
+                continue
+            distance = field.get_distance(next_position)
+            if distance == field.UNREACHABLE:
+                distance = float("inf")
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best_direction = direction
+
+        if best_direction is not None:
+            self.direction = best_direction
+            self.opposite_direction = self.get_opposite_direction(self.direction)
+        return self.direction
@@ -1,5 +1,6 @@
 from typing import Tuple
 from abc import abstractclassmethod
+from logic.game_objects.directions import DIRECTIONS
 class Controller:
     """
     Base class for all controllers.
@@ -16,12 +17,7 @@ class Controller:
     RIGHT = 3
 
     # Directions as tuples
-    DIRECTIONS = [
-        (0, -1),  # UP
-        (0, 1),   # DOWN
-        (-1, 0),  # LEFT
-        (1, 0)    # RIGHT
-    ]
+    DIRECTIONS = DIRECTIONS
 
     def __init__(self, starting_direction) -> None:
         """
@@ -44,6 +40,14 @@ class Controller:
         raise NotImplementedError("This method must be implemented") 
         
     
+    def attach(self, game_logic) -> None:
+        """
+        Hook called once the game the controller plays in is created.
+
+        Args:
+            game_logic (GameLogic): The game the controller plays in.
+        """
+
     def get_current_direction(self):
         return self.direction
         
@@ -89,6 +93,15 @@ class Controller:
         if controller_type == "Greedy":
             from logic.controller.greedy_controller import GreedyController
             return GreedyController(starting_direction)
+        elif controller_type == "BFS":
+            from logic.controller.bfs_controller import BFSController
+            return BFSController(starting_direction)
+        elif controller_type == "Hamiltonian":
+            from logic.controller.hamiltonian_controller import HamiltonianController
+            return HamiltonianController(starting_direction)
+        elif controller_type == "SafeGreedy":
+            from logic.controller.safe_greedy_controller import SafeGreedyController
+            return SafeGreedyController(starting_direction)
         elif controller_type == "Arrow":
             from logic.controller.human_controllers import ArrowKeyController
             return ArrowKeyController(starting_direction)
@@ -98,5 +111,8 @@ class Controller:
         elif controller_type == "Human":
             from logic.controller.human_controllers import CombinedController
             return CombinedController(starting_direction)
+        elif controller_type == "External":
+            from logic.controller.external_controller import ExternalController
+            return ExternalController(starting_direction)
         else:
             raise ValueError(f"Unknown controller type: {controller_type}")
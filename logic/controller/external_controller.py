@@ -0,0 +1,28 @@
+from logic.controller.controller import Controller
+from typing import Tuple
+
+
+class ExternalController(Controller):
+    """
+    Controller whose moves are set from outside the game loop,
+    for example by a replay or a training agent.
+    """
+
+    def set_direction(self, direction: Tuple[int, int]) -> None:
+        """
+        Set the direction to return on the next update.
+
+        Args:
+            direction (Tuple[int, int]): The direction vector.
+        """
+        self.direction = direction
+        self.opposite_direction = self.get_opposite_direction(direction)
+
+    def get_direction(self, *args) -> Tuple[int, int]:
+        """
+        Return the direction last set from outside.
+
+        Returns:
+            Tuple[int, int]: The current direction as (x, y) coordinates.
+        """
+        return self.direction
@@ -1,6 +1,7 @@
 from logic.controller.controller import Controller
 from logic.game_objects.snake import Snake
-from typing import Tuple, List, Dict
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from typing import Tuple, List, Dict, Optional
 
 
 class GreedyController(Controller):
@@ -38,17 +39,23 @@ class GreedyController(Controller):
             if direction == self.opposite_direction:
                 continue
 
-            next_position = (head[0] + direction[0], head[1] + direction[1])
+            if snake.codec is not None:
+                next_position = snake.codec.step(head, direction)
+            else:
+                next_position = (head[0] + direction[0], head[1] + direction[1])
 
             if not snake.check_bounds(
                 width, height, next_position
-            ) and not self.check_position_in_snakes(next_position, snakes, keys):
+            ) and not self.check_position_in_snakes(next_position, snakes, keys, snake.occupancy):
 
                 if food_pos is None:
                     self.direction = direction
                     return self.direction
 
-                distance = self.heuristic(next_position, food_pos)
+                if snake.codec is not None:
+                    distance = self.heuristic(snake.codec.decode(next_position), snake.codec.decode(food_pos))
+                else:
+                    distance = self.heuristic(next_position, food_pos)
 
                 if distance < best_distance:
                     best_distance = distance
@@ -72,7 +79,11 @@ class GreedyController(Controller):
         return abs(target[0] - goal[0]) + abs(target[1] - goal[1])
 
     def check_position_in_snakes(
-        self, position: Tuple[int, int], snakes: Dict[int, Snake], keys: List[int]
+        self,
+        position: Tuple[int, int],
+        snakes: Dict[int, Snake],
+        keys: List[int],
+        occupancy: Optional[OccupancyGrid] = None,
     ) -> bool:
         """
         Check if the position collides with any other snake.
@@ -80,11 +91,14 @@ class GreedyController(Controller):
         Args:
             position (Tuple[int, int]): The position to check.
             snakes (List[Snake]): List of all snakes in the game.
+            occupancy (Optional[OccupancyGrid]): Shared occupancy grid for an O(1) lookup.
 
         Returns:
             bool: True if there is a collision, False otherwise.
         """
-        
+        if occupancy is not None:
+            return occupancy.is_occupied(position)
+
         for key in keys:
             snake = snakes[key]
             if snake.check_position_exists(position):
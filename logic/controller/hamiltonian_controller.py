@@ -0,0 +1,180 @@
+from logic.controller.controller import Controller
+from logic.game_objects.snake import Snake
+from logic.game_objects.hamiltonian_cycle import HamiltonianCycle
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logic.game_logic import GameLogic
+
+
+class HamiltonianController(Controller):
+    """
+    AI controller that follows a Hamiltonian cycle of the board, so a lone
+    snake never runs into itself. While the snake is short it takes
+    shortcuts towards the food that cannot cut across its own body.
+    """
+
+    # stop taking shortcuts once the snake covers this share of the cycle
+    SHORTCUT_MAX_FILL = 0.5
+    # free cells kept between the head and the tail when taking a shortcut
+    SHORTCUT_MARGIN = 2
+
+    def __init__(self, starting_direction) -> None:
+        """
+        Initialize the controller, it has no cycle until attached.
+
+        Args:
+            starting_direction (Tuple[int, int]): The initial direction of the controller.
+        """
+        super().__init__(starting_direction)
+        self.game_logic: Optional["GameLogic"] = None
+        self.cycle: Optional[HamiltonianCycle] = None
+
+    def attach(self, game_logic: "GameLogic") -> None:
+        """
+        Load the cycle for the board of the game.
+
+        Args:
+            game_logic (GameLogic): The game the controller plays in.
+        """
+        self.game_logic = game_logic
+        self.cycle = HamiltonianCycle.load(game_logic.width, game_logic.height)
+
+    def get_direction(
+        self,
+        snake: Snake,
+        food_pos: Tuple[int, int],
+        width: int,
+        height: int,
+        snakes: Dict[int, Snake],
+        keys: List[int]
+    ) -> Tuple[int, int]:
+        """
+        Step to the next cell of the cycle, or further along it through a safe shortcut.
+
+        Args:
+            snake (Snake): The snake object.
+            food_pos (Tuple[int, int]): The position of the food.
+            width (int): The width of the game board.
+            height (int): The height of the game board.
+            snakes (Dict[int, Snake]): All snakes in the game.
+            keys (List[int]): The keys of the snakes still in the game.
+
+        Returns:
+            Tuple[int, int]: The chosen direction as (x, y) coordinates.
+        """
+        cycle = self.cycle
+        occupancy = snake.occupancy
+        codec = occupancy.codec
+        head = occupancy.index(snake.get_head())
+        if head < 0:
+            return self.direction
+
+        neighbours = [(direction, codec.step(head, direction)) for direction in self.DIRECTIONS]
+        if cycle.get_place(head) == cycle.NOT_ON_CYCLE:
+            # only the skipped corner of an odd board is off the cycle, leave it for any free cell
+            target = next((cell for _, cell in neighbours if cell >= 0 and occupancy.counts[cell] == 0), -1)
+        elif self.can_detour(snake, head, food_pos):
+            target = occupancy.index(food_pos)
+        else:
+            target = cycle.get_next(head)
+            if len(keys) == 1 and snake.get_size() < cycle.length * self.SHORTCUT_MAX_FILL:
+                target = self.find_shortcut(snake, head, target, neighbours, food_pos)
+
+        for direction, cell in neighbours:
+            if cell == target:
+                self.direction = direction
+                self.opposite_direction = self.get_opposite_direction(direction)
+                break
+        return self.direction
+
+    def can_detour(self, snake: Snake, head: int, food_pos) -> bool:
+        """
+        Check if the food lies on the cell left out of the cycle, next to the
+        head, and the cycle can be rejoined two cells ahead of the head from
+        there. That takes as many steps as following the cycle, so the only
+        risk is the rejoining cell still being taken when the head gets there.
+
+        Args:
+            snake (Snake): The snake object.
+            head (int): The cell index of the head.
+            food_pos: The position of the food.
+
+        Returns:
+            bool: True if the snake should step off the cycle onto the food.
+        """
+        cycle = self.cycle
+        occupancy = snake.occupancy
+        codec = occupancy.codec
+        food = occupancy.index(food_pos) if food_pos is not None else -1
+        if food < 0 or cycle.get_place(food) != cycle.NOT_ON_CYCLE:
+            return False
+        if food not in (codec.step(head, direction) for direction in self.DIRECTIONS):
+            return False
+        if snake.get_size() + 1 >= cycle.width * cycle.height:
+            # eating the food fills the board, there is nothing left to rejoin
+            return True
+        tail = occupancy.index(snake.get_body()[-1])
+        for direction in self.DIRECTIONS:
+            cell = codec.step(food, direction)
+            if cell < 0 or cell == head or cycle.get_place(cell) == cycle.NOT_ON_CYCLE:
+                continue
+            if cycle.distance(head, cell) == 2:
+                # a tail that is not stacked leaves the cell while the head eats
+                return not occupancy.counts[cell] or (cell == tail and occupancy.counts[cell] == 1)
+        return False
+
+    def find_shortcut(self, snake: Snake, head: int, target: int, neighbours, food_pos) -> int:
+        """
+        Pick the free neighbour furthest along the cycle that neither passes the
+        food nor gets within the margin of the tail.
+
+        Args:
+            snake (Snake): The snake object.
+            head (int): The cell index of the head.
+            target (int): The next cell of the cycle, used if no shortcut is safe.
+            neighbours: The (direction, cell index) pairs around the head.
+            food_pos: The position of the food.
+
+        Returns:
+            int: The cell index to move to.
+        """
+        cycle = self.cycle
+        occupancy = snake.occupancy
+        food = occupancy.index(food_pos) if food_pos is not None else -1
+        if food < 0 or cycle.get_place(food) == cycle.NOT_ON_CYCLE:
+            return target
+        limit = min(cycle.distance(head, food), self.get_tail_gap(snake, head) - self.SHORTCUT_MARGIN)
+
+        best_gap = 1
+        for _, cell in neighbours:
+            if cell < 0 or occupancy.counts[cell] or cycle.get_place(cell) == cycle.NOT_ON_CYCLE:
+                continue
+            gap = cycle.distance(head, cell)
+            if best_gap < gap <= limit:
+                best_gap = gap
+                target = cell
+        return target
+
+    def get_tail_gap(self, snake: Snake, head: int) -> int:
+        """
+        Get how many steps along the cycle lead from the head to the last
+        segment of the body on the cycle. A tail in the cell left out of the
+        cycle is skipped, it only ever leaves onto the segment ahead of it.
+
+        Args:
+            snake (Snake): The snake object.
+            head (int): The cell index of the head.
+
+        Returns:
+            int: The number of steps, the whole cycle if no other segment is on it.
+        """
+        cycle = self.cycle
+        occupancy = snake.occupancy
+        body = snake.get_body()
+        for i in range(len(body) - 1, 0, -1):
+            cell = occupancy.index(body[i])
+            if cycle.get_place(cell) != cycle.NOT_ON_CYCLE:
+                # a body stacked on the head leaves the whole cycle ahead free
+                return cycle.distance(head, cell) or cycle.length
+        return cycle.length
@@ -0,0 +1,93 @@
+from logic.controller.greedy_controller import GreedyController
+from logic.game_objects.snake import Snake
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logic.game_logic import GameLogic
+
+
+class SafeGreedyController(GreedyController):
+    """
+    Greedy controller that only heads for the food through cells with enough
+    reachable space behind them, so it does not walk into dead-end pockets.
+    """
+
+    # cells of free space required per body segment for a move to count as safe
+    SPACE_PER_SEGMENT = 2
+
+    def __init__(self, starting_direction) -> None:
+        """
+        Initialize the controller, it has no game until attached.
+
+        Args:
+            starting_direction (Tuple[int, int]): The initial direction of the controller.
+        """
+        super().__init__(starting_direction)
+        self.game_logic: Optional["GameLogic"] = None
+
+    def attach(self, game_logic: "GameLogic") -> None:
+        """
+        Keep a reference to the game to read its space evaluator.
+
+        Args:
+            game_logic (GameLogic): The game the controller plays in.
+        """
+        self.game_logic = game_logic
+
+    def get_direction(
+        self,
+        snake: Snake,
+        food_pos: Tuple[int, int],
+        width: int,
+        height: int,
+        snakes: Dict[int, Snake],
+        keys: List[int]
+    ) -> Tuple[int, int]:
+        """
+        Move towards the food among the moves with enough space, or into the
+        largest space if no move has enough.
+
+        Args:
+            snake (Snake): The snake object.
+            food_pos (Tuple[int, int]): The position of the food.
+            width (int): The width of the game board.
+            height (int): The height of the game board.
+            snakes (Dict[int, Snake]): All snakes in the game.
+            keys (List[int]): The keys of the snakes still in the game.
+
+        Returns:
+            Tuple[int, int]: The best direction as (x, y) coordinates.
+        """
+        evaluator = self.game_logic.space_evaluator
+        codec = snake.codec
+        head = snake.get_head()
+        limit = snake.get_size() * self.SPACE_PER_SEGMENT
+        best = None
+        best_direction = None
+
+        for direction in self.DIRECTIONS:
+            if direction == self.opposite_direction:
+                continue
+            if codec is not None:
+                next_position = codec.step(head, direction)
+            else:
+                next_position = (head[0] + direction[0], head[1] + direction[1])
+            space = evaluator.count_reachable(next_position, limit)
+            if space == 0:
+                continue
+            if food_pos is None:
+                distance = 0
+            elif codec is not None:
+                distance = self.heuristic(codec.decode(next_position), codec.decode(food_pos))
+            else:
+                distance = self.heuristic(next_position, food_pos)
+            # safe moves first, then the closest to the food, then the most space
+            rank = (space < limit, distance if space >= limit else -space, distance)
+            if best is None or rank < best:
+                best = rank
+                best_direction = direction
+
+        if best_direction is not None:
+            self.direction = best_direction
+            self.opposite_direction = self.get_opposite_direction(self.direction)
+        return self.direction
@@ -2,9 +2,16 @@ from logic.game_objects.snake import Snake
 from logic.game_objects.food import Food
 from logic.game_objects.spawn_generator import SpawnGenerator
 from logic.game_objects.snake_spawner import SnakeSpawner
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.cell_codec import CellCodec
+from logic.game_objects.distance_field import DistanceField
+from logic.game_objects.space_evaluator import SpaceEvaluator
 from logic.controller.controller import Controller
-from typing import Tuple, List, Deque, Dict
-from random import  sample
+from logic.tick_profiler import TickProfiler
+from diagnostics.tracer import tracer
+from typing import Tuple, List, Deque, Dict, Optional, Sequence
+from random import Random, randrange
+from time import perf_counter_ns
 class GameLogic:
     """
     Manages the game logic for a snake game controlled by AI.
@@ -14,14 +21,23 @@ class GameLogic:
         height (int): The height of the game area.
         snakes (List[Snake]): The list of snake objects.
         spawn_generator (SpawnGenerator): The spawn generator for food.
+        occupancy (OccupancyGrid): The shared record of cells covered by snakes.
+        distance_field (DistanceField): The shared distances to the food, rebuilt once per tick.
+        space_evaluator (SpaceEvaluator): The shared counter of cells reachable from a cell.
         food (Food): The food object.
         controllers (List[Controller]): The controllers for the snakes' movement.
         step_count (int): The number of steps taken in the current game.
         game_mode (str): The current game mode ('normal' or 'survival').
+        codec (Optional[CellCodec]): The cell codec when positions are stored as cell indices.
+        seed (int): The seed of the game's random number generator.
+        rng (Random): The random number generator for update order and food spawns.
+        last_directions (Dict[int, Tuple[int, int]]): The direction each snake was given in the last step.
+        profiler (Optional[TickProfiler]): The profiler timing each tick, None when profiling is off.
     """
 
     def __init__(
-        self, width: int, height: int, controllers: List[str] = ["Greedy"], snake_size: int = 3, num_snakes: int = 1, game_mode: str = 'survival'
+        self, width: int, height: int, controllers: List[str] = ["Greedy"], snake_size: int = 3, num_snakes: int = 1, game_mode: str = 'survival',
+        cell_index: bool = False, compact_body: bool = False, seed: Optional[int] = None
     ) -> None:
         """
         Initialize the game logic with the given parameters.
@@ -33,26 +49,43 @@ class GameLogic:
             snake_size (int): The initial size of the snake (default is 3).
             num_snakes (int): The number of snakes in the game (default is 1).
             game_mode (str): The game mode ('normal' or 'survival', default is 'normal').
+            cell_index (bool): Store positions as cell indices instead of (x, y) tuples internally.
+            compact_body (bool): Store snake bodies in ring buffers, requires cell_index.
+            seed (Optional[int]): Seed for the game's random number generator, random if None.
         """
         self.width = width
         self.height = height
-        self.spawn_generator = SpawnGenerator(self.width, self.height)
+        self.snake_size = snake_size
+        self.seed = seed if seed is not None else randrange(2 ** 32)
+        self.rng = Random(self.seed)
+        self.codec: Optional[CellCodec] = CellCodec(width, height) if cell_index else None
+        self.spawn_generator = SpawnGenerator(self.width, self.height, cell_index, self.rng)
+        self.occupancy = OccupancyGrid(self.width, self.height, self.spawn_generator, cell_index)
+        self.distance_field = DistanceField(self.occupancy)
+        self.space_evaluator = SpaceEvaluator(self.occupancy)
         spawns = SnakeSpawner(width, height, num_snakes).get_spawns()
         self.snakes: Dict[int, Snake] = {}
         self.controllers: Dict[int, Controller] = {}
+        self.controller_types: List[str] = []
+        self.last_directions: Dict[int, Tuple[int, int]] = {}
         self.keys = []
 
         for key, ((start_pos, start_dir), controller) in enumerate(zip(spawns, controllers)):
-            self.snakes[key] = Snake(start_pos, snake_size)
+            if self.codec is not None:
+                start_pos = self.codec.encode(start_pos)
+            self.snakes[key] = Snake(start_pos, snake_size, self.occupancy, key, self.codec, compact_body)
             self.controllers[key] = Controller.select(controller, start_dir)
-            self.spawn_generator.remove(start_pos)
+            self.controller_types.append(controller)
             self.keys.append(key)
 
         self.running = True
         self.food = Food()
         self.step_count = 0
         self.game_mode = game_mode
+        self.profiler: Optional[TickProfiler] = None
 
+        for controller in self.controllers.values():
+            controller.attach(self)
  
 
     def update(self) -> bool:
@@ -65,6 +98,8 @@ class GameLogic:
         self.step_count += 1
 
         if self.game_mode == 'normal':
+            if self.profiler is not None or tracer.enabled:
+                return self.update_normal_profiled()
             return self.update_normal()
         elif self.game_mode == 'survival':
             return self.update_survival()
@@ -78,49 +113,192 @@ class GameLogic:
         Returns:
             bool: True if the game continues, False if there's a collision.
         """
-        #nned to update eat 
-
-        # iterate in random order to balance who has prio
-        for key in sample(self.keys, len(self.keys)):
-
+        for key in self.get_update_order():
             snake = self.snakes[key]
             self.update_snake(key, snake)
+            self.resolve_collisions(key, snake)
+            self.resolve_food(snake)
 
-       
-            if not snake.check_exists():
-                self.remove_key(key)
-            else:
-                if snake.check_alive():
-                    self.check_collisions(snake)
-                
+        return self.running
 
-            self.update_spawns(snake)
-            self.check_food_collision(snake)
-            self.update_food()
+    def update_normal_profiled(self) -> bool:
+        """
+        Update the game state for the normal mode with the same phases as
+        update_normal, timing each phase and counting events in the profiler,
+        and recording the tick and every controller decision as spans when
+        tracing is enabled.
 
+        Returns:
+            bool: True if the game continues, False if there's a collision.
+        """
+        profiler = self.profiler
+        tracing = tracer.enabled
+        tick_start = perf_counter_ns()
+        for key in self.get_update_order():
+            snake = self.snakes[key]
+            controller_type = self.controller_types[key]
+            nodes = self.distance_field.nodes_expanded + self.space_evaluator.nodes_expanded
+
+            start = perf_counter_ns()
+            direction = self.choose_direction(key, snake)
+            controller_end = perf_counter_ns()
+            expanded = self.distance_field.nodes_expanded + self.space_evaluator.nodes_expanded - nodes
+            if tracing:
+                tracer.add(controller_type, "controller", start, controller_end, {"snake": key, "nodes_expanded": expanded})
+            if profiler is None:
+                # tracing only, the other phases are not timed
+                self.move_snake(key, snake, direction)
+                self.resolve_collisions(key, snake)
+                self.resolve_food(snake)
+                continue
+            profiler.add(key, controller_type, "controller", controller_end - start)
+            profiler.add(key, controller_type, "nodes_expanded", expanded)
+
+            start = controller_end
+            self.move_snake(key, snake, direction)
+            now = perf_counter_ns()
+            profiler.add(key, controller_type, "movement", now - start)
+
+            start = now
+            collided = self.resolve_collisions(key, snake)
+            if collided is not None:
+                profiler.add(key, controller_type, "collisions_checked", 1)
+                if collided:
+                    profiler.add(key, controller_type, "collisions", 1)
+            now = perf_counter_ns()
+            profiler.add(key, controller_type, "collision", now - start)
+
+            start = now
+            if self.resolve_food(snake):
+                profiler.add(key, controller_type, "food_respawns", 1)
+            profiler.add(key, controller_type, "food", perf_counter_ns() - start)
+
+        tick_end = perf_counter_ns()
+        if profiler is not None:
+            profiler.end_tick(tick_end - tick_start)
+        if tracing:
+            tracer.add("tick", "logic", tick_start, tick_end, {"step": self.step_count, "snakes": len(self.keys)})
         return self.running
 
+    def enable_profiling(self, profiler: Optional[TickProfiler] = None) -> TickProfiler:
+        """
+        Start timing the phases of every tick.
+
+        Args:
+            profiler (Optional[TickProfiler]): The profiler to record into, a new one if None.
+
+        Returns:
+            TickProfiler: The profiler in use.
+        """
+        self.profiler = profiler if profiler is not None else TickProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[TickProfiler]:
+        """
+        Stop timing ticks.
+
+        Returns:
+            Optional[TickProfiler]: The profiler that was in use, with everything it recorded.
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
     def remove_key(self, key):
         self.snakes.pop(key, None)
         self.controllers.pop(key, None)
         self.keys.remove(key)
 
+    def get_direction(self, snake_id: int) -> Tuple[int, int]:
+        """
+        Get the direction from the controller.
+
+        Args:
+            snake_id (int): The ID of the snake.
+
+        Returns:
+            Tuple[int, int]: The direction vector.
+        """
+        return self.controllers[snake_id].get_direction(
+            self.snakes[snake_id], self.food.get_position(), self.width, self.height, self.snakes, self.keys
+        )
+
     def update_snake(self, snake_id: int, snake: 'Snake') -> None:
         """
         Update the snake's position based on the direction.
         """
-        direction = self.controllers[snake_id].get_direction(
-            snake, self.food.get_position(), self.width, self.height, self.snakes, self.keys
-        )
+        self.move_snake(snake_id, snake, self.choose_direction(snake_id, snake))
+
+    def choose_direction(self, snake_id: int, snake: Snake) -> Tuple[int, int]:
+        """
+        Get the direction for a snake from its controller. A snake that crashed
+        with nothing left has no head to steer, so it keeps its current direction
+        until it is removed.
+
+        Args:
+            snake_id (int): The ID of the snake.
+            snake (Snake): The snake.
+
+        Returns:
+            Tuple[int, int]: The direction vector.
+        """
+        if not snake.get_size():
+            return self.controllers[snake_id].get_current_direction()
+        return self.get_direction(snake_id)
+
+    def get_update_order(self) -> List[int]:
+        """
+        Get the ids of the snakes in the order they move this tick, random so
+        no snake always has priority.
+
+        Returns:
+            List[int]: The snake ids.
+        """
+        return self.rng.sample(self.keys, len(self.keys))
+
+    def move_snake(self, snake_id: int, snake: Snake, direction: Tuple[int, int]) -> None:
+        """
+        Move the snake one step in the direction its controller chose.
+
+        Args:
+            snake_id (int): The ID of the snake.
+            snake (Snake): The snake.
+            direction (Tuple[int, int]): The direction vector.
+        """
+        self.last_directions[snake_id] = direction
         snake.update(direction, self.food.get_position())
 
-    def update_spawns(self, snake: Snake) -> None:
+    def resolve_collisions(self, snake_id: int, snake: Snake) -> Optional[bool]:
         """
-        Update the spawn generator.
+        Remove the snake once it is gone, otherwise check it for collisions while it is alive.
+
+        Args:
+            snake_id (int): The ID of the snake.
+            snake (Snake): The snake.
+
+        Returns:
+            Optional[bool]: True if the snake collided, None if it was not checked.
+        """
+        if not snake.check_exists():
+            self.remove_key(snake_id)
+            return None
+        if snake.check_alive():
+            return self.check_collisions(snake)
+        return None
+
+    def resolve_food(self, snake: Snake) -> bool:
+        """
+        Remove the food if the snake ate it, and respawn it if it is gone.
+
+        Args:
+            snake (Snake): The snake.
+
+        Returns:
+            bool: True if the food was respawned.
         """
-        head_pos = snake.get_head()
-        tail_pos = snake.get_last_tail()
-        self.spawn_generator.update(head_pos, tail_pos)
+        self.check_food_collision(snake)
+        had_food = self.food.exists()
+        self.update_food()
+        return not had_food and self.food.exists()
 
     def check_food_collision(self, snake: Snake) -> None:
         """
@@ -174,9 +352,12 @@ class GameLogic:
         Returns:
             Tuple[int, int]: The position of the snake's head.
         """
-        return self.snakes[snake_id].get_head()
+        head = self.snakes[snake_id].get_head()
+        if self.codec is not None:
+            return self.codec.decode(head)
+        return head
 
-    def get_snake_body(self, snake_id: int) -> Deque[Tuple[int, int]]:
+    def get_snake_body(self, snake_id: int) -> Sequence[Tuple[int, int]]:
         """
         Get the positions of the snake's body.
 
@@ -184,19 +365,35 @@ class GameLogic:
             snake_id (int): The ID of the snake.
 
         Returns:
-            Deque[Tuple[int, int]]: The positions of the snake's body.
+            Sequence[Tuple[int, int]]: The positions of the snake's body.
         """
-        return self.snakes[snake_id].get_body()
+        body = self.snakes[snake_id].get_body()
+        if self.codec is not None:
+            return self.codec.decode_all(body)
+        return body
 
-    def get_food_position(self) -> Tuple[int, int]:
+    def get_food_position(self) -> Optional[Tuple[int, int]]:
         """
         Get the position of the food.
 
         Returns:
-            Tuple[int, int]: The position of the food.
+            Optional[Tuple[int, int]]: The position of the food.
+        """
+        food = self.food.get_position()
+        if self.codec is not None:
+            return self.codec.decode(food)
+        return food
+
+
+    def get_distance_field(self) -> DistanceField:
         """
-        return self.food.get_position()
+        Get the distances to the food, computing them once per tick.
 
+        Returns:
+            DistanceField: The shared distance field.
+        """
+        self.distance_field.update(self.step_count, self.food.get_position())
+        return self.distance_field
 
     def get_controller(self, snake_id: int) -> Controller:
         """
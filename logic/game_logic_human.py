@@ -8,7 +8,7 @@ from logic.game_objects.food import Food
 from logic.game_objects.spawn_generator import SpawnGenerator
 from logic.game_objects.snake_spawner import SnakeSpawner
 from logic.controller.controller import Controller
-from typing import Tuple, List, Deque, Dict
+from typing import Tuple, List, Deque, Dict, Optional
 class GameLogicHuman(GameLogic):
     """
     Manages the game logic for a snake game controlled by a human.
@@ -23,9 +23,10 @@ class GameLogicHuman(GameLogic):
         step_count (int): The number of steps taken in the current game.
     """
     def __init__(
-        self, width: int, height: int, controllers: List[str] = ["Greedy"], snake_size: int = 3, num_snakes: int = 1, game_mode: str = 'survival'
+        self, width: int, height: int, controllers: List[str] = ["Greedy"], snake_size: int = 3, num_snakes: int = 1, game_mode: str = 'survival',
+        cell_index: bool = False, compact_body: bool = False, seed: Optional[int] = None
     ) -> None:
-        super().__init__(width, height, controllers, snake_size, num_snakes, game_mode)
+        super().__init__(width, height, controllers, snake_size, num_snakes, game_mode, cell_index, compact_body, seed)
         self.human_controllers = []
         for key in self.keys:
             if isinstance(self.controllers[key], HumanController):
@@ -45,18 +46,7 @@ class GameLogicHuman(GameLogic):
         controller = self.controllers[snake_id]
         if isinstance(controller, HumanController):
             return controller.get_direction()
-        
-        snake = self.snakes[snake_id]
-        return controller.get_direction(
-            snake, self.food.get_position(), self.width, self.height, self.snakes, self.keys
-        )
-
-    def update_snake(self, snake_id: int, snake: Snake) -> None:
-        """
-        Update the snake's position based on the direction.
-        """
-        direction = self.get_direction(snake_id)
-        snake.update(direction, self.food.get_position())
+        return super().get_direction(snake_id)
 
 
     def get_all_snakes_body_and_direction(
@@ -75,7 +65,7 @@ class GameLogicHuman(GameLogic):
         result = []
         for snake_id, snake in self.snakes.items():
             if snake_id in self.controllers:  
-                snake_body = snake.get_body() 
+                snake_body = self.get_snake_body(snake_id)
                 snake_direction = self.get_controller(snake_id).get_current_direction()  
                 result.append((snake_id, snake_body, snake_direction))
         return result
@@ -0,0 +1,84 @@
+from typing import Tuple, List, Dict, Union, Iterable, Optional
+from logic.game_objects.directions import DIRECTIONS
+
+# A board position, either as (x, y) coordinates or as a cell index
+Position = Union[Tuple[int, int], int]
+
+
+class CellCodec:
+    """
+    Converts between (x, y) positions and integer cell indices (y * width + x).
+
+    All tuples and neighbour lookups are precomputed, so moving and decoding
+    cells never allocates.
+    """
+
+    OUT = -1
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initialize the lookup tables for a board.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        """
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.positions: List[Tuple[int, int]] = [(cell % width, cell // width) for cell in range(self.size)]
+        self.neighbours: Dict[Tuple[int, int], List[int]] = {
+            direction: [self.encode((x + direction[0], y + direction[1])) for x, y in self.positions]
+            for direction in DIRECTIONS
+        }
+
+    def encode(self, pos: Tuple[int, int]) -> int:
+        """
+        Convert a position to a cell index.
+
+        :param pos: The position to convert.
+        :return: The cell index, or OUT if the position is out of bounds.
+        """
+        x, y = pos
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            return self.OUT
+        return y * self.width + x
+
+    def decode(self, cell: Optional[int]) -> Optional[Tuple[int, int]]:
+        """
+        Convert a cell index to a position.
+
+        :param cell: The cell index to convert.
+        :return: The cached position tuple, or None if the cell is None or out of bounds.
+        """
+        if cell is None or cell < 0:
+            return None
+        return self.positions[cell]
+
+    def decode_all(self, cells: Iterable[int]) -> List[Tuple[int, int]]:
+        """
+        Convert a sequence of cell indices to positions.
+
+        :param cells: The cell indices to convert.
+        :return: The positions in the same order.
+        """
+        positions = self.positions
+        return [positions[cell] for cell in cells]
+
+    def step(self, cell: int, direction: Tuple[int, int]) -> int:
+        """
+        Get the neighbouring cell in a direction.
+
+        :param cell: The cell index to move from, must be inside the board.
+        :param direction: The direction to move in.
+        :return: The neighbouring cell index, or OUT if it is out of bounds.
+        """
+        return self.neighbours[direction][cell]
+
+    def in_bounds(self, cell: int) -> bool:
+        """
+        Check if a cell index lies inside the board.
+
+        :param cell: The cell index to check.
+        :return: True if the cell is inside the board, False otherwise.
+        """
+        return cell >= 0
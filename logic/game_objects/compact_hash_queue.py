@@ -0,0 +1,221 @@
+from array import array
+from collections.abc import Sequence
+from typing import Optional, Iterator, Tuple
+
+
+class CompactHashQueue:
+    """
+    A HashQueue for integer cell indices backed by a preallocated ring buffer
+    and a dense per-cell count array instead of a deque and a dictionary.
+
+    Elements must be cell indices in [0, num_cells) or -1 for a position
+    outside the board, which is counted in a dedicated sentinel slot.
+    """
+
+    __slots__ = ("buffer", "counts", "capacity", "head", "length")
+
+    def __init__(self, num_cells: int, capacity: Optional[int] = None) -> None:
+        """
+        Initialize an empty CompactHashQueue.
+
+        :param num_cells: The number of cells on the board.
+        :param capacity: The initial size of the ring buffer, grown when full.
+        """
+        self.capacity = capacity or num_cells + 1
+        self.buffer = array("i", [0]) * self.capacity
+        # one extra slot so the out of bounds index -1 has its own count
+        self.counts = array("H", [0]) * (num_cells + 1)
+        self.head = 0
+        self.length = 0
+
+    def add_front(self, element: int) -> None:
+        """
+        Add an element to the front of the queue.
+
+        :param element: The element to add to the front.
+        """
+        if self.length == self.capacity:
+            self.expand()
+        self.head = (self.head - 1) % self.capacity
+        self.buffer[self.head] = element
+        self.length += 1
+        self.counts[element] += 1
+
+    def add_back(self, element: int) -> None:
+        """
+        Add an element to the back of the queue.
+
+        :param element: The element to add to the back.
+        """
+        if self.length == self.capacity:
+            self.expand()
+        self.buffer[(self.head + self.length) % self.capacity] = element
+        self.length += 1
+        self.counts[element] += 1
+
+    def pop_back(self) -> Optional[int]:
+        """
+        Remove and return the element from the back of the queue.
+
+        :return: The element from the back of the queue, or None if the queue is empty.
+        """
+        if not self.length:
+            return None
+        self.length -= 1
+        element = self.buffer[(self.head + self.length) % self.capacity]
+        self.counts[element] -= 1
+        return element
+
+    def pop_front(self) -> Optional[int]:
+        """
+        Remove and return the element from the front of the queue.
+
+        :return: The element from the front of the queue, or None if the queue is empty.
+        """
+        if not self.length:
+            return None
+        element = self.buffer[self.head]
+        self.head = (self.head + 1) % self.capacity
+        self.length -= 1
+        self.counts[element] -= 1
+        return element
+
+    def peak_front(self) -> Optional[int]:
+        """
+        Return the element at the front of the queue without removing it.
+
+        :return: The element at the front of the queue, or None if the queue is empty.
+        """
+        if not self.length:
+            return None
+        return self.buffer[self.head]
+
+    def peak_back(self) -> Optional[int]:
+        """
+        Return the element at the back of the queue without removing it.
+
+        :return: The element at the back of the queue, or None if the queue is empty.
+        """
+        if not self.length:
+            return None
+        return self.buffer[(self.head + self.length - 1) % self.capacity]
+
+    def has_multi(self, element: int) -> bool:
+        """
+        Check if the element appears more than once in the queue.
+
+        :param element: The element to check.
+        :return: True if the element appears more than once, False otherwise.
+        """
+        return self.counts[element] > 1
+
+    def has_one(self, element: int) -> bool:
+        """
+        Check if the element appears at least once in the queue.
+
+        :param element: The element to check.
+        :return: True if the element appears at least once, False otherwise.
+        """
+        return self.counts[element] > 0
+
+    def get_data(self) -> "RingView":
+        """
+        Get a read-only view of the queue, front to back, without copying it.
+
+        :return: A view over the ring buffer.
+        """
+        return RingView(self)
+
+    def get_segments(self) -> Tuple[memoryview, ...]:
+        """
+        Get the queue contents as at most two contiguous memoryviews, front to back.
+
+        :return: The memoryviews over the ring buffer.
+        """
+        end = self.head + self.length
+        view = memoryview(self.buffer)
+        if end <= self.capacity:
+            return (view[self.head:end],)
+        return view[self.head:], view[:end - self.capacity]
+
+    def get_length(self) -> int:
+        """
+        Get the number of elements in the queue.
+
+        :return: The length of the queue.
+        """
+        return self.length
+
+    def expand(self) -> None:
+        """
+        Double the ring buffer, moving the elements to the start of the new buffer.
+        """
+        data = array("i", self.get_data())
+        data.extend(array("i", [0]) * self.capacity)
+        self.buffer = data
+        self.capacity *= 2
+        self.head = 0
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the CompactHashQueue.
+
+        :return: A string representing the CompactHashQueue.
+        """
+        return f"CompactHashQueue(data={list(self.get_data())}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the CompactHashQueue.
+
+        :return: A string representing the CompactHashQueue.
+        """
+        return self.__str__()
+
+
+class RingView(Sequence):
+    """
+    A read-only, zero-copy view over the elements of a CompactHashQueue.
+
+    The view is live: it reflects later changes to the queue.
+    """
+
+    __slots__ = ("queue",)
+
+    def __init__(self, queue: CompactHashQueue) -> None:
+        """
+        Initialize the view.
+
+        :param queue: The queue to view.
+        """
+        self.queue = queue
+
+    def __len__(self) -> int:
+        return self.queue.length
+
+    def __getitem__(self, idx):
+        queue = self.queue
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(queue.length))]
+        if idx < 0:
+            idx += queue.length
+        if idx < 0 or idx >= queue.length:
+            raise IndexError("RingView index out of range")
+        return queue.buffer[(queue.head + idx) % queue.capacity]
+
+    def __iter__(self) -> Iterator[int]:
+        queue = self.queue
+        buffer, head, capacity = queue.buffer, queue.head, queue.capacity
+        for i in range(queue.length):
+            yield buffer[(head + i) % capacity]
+
+    def __contains__(self, element) -> bool:
+        return isinstance(element, int) and -1 <= element < len(self.queue.counts) - 1 and self.queue.has_one(element)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RingView({list(self)})"
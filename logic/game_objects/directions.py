@@ -0,0 +1,10 @@
+from typing import List, Tuple
+
+# The four moves as (dx, dy) steps. The order is shared by the controllers,
+# the cell codec's neighbour tables, replays and observations, so never reorder it.
+DIRECTIONS: List[Tuple[int, int]] = [
+    (0, -1),  # UP
+    (0, 1),   # DOWN
+    (-1, 0),  # LEFT
+    (1, 0)    # RIGHT
+]
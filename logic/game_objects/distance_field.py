@@ -0,0 +1,93 @@
+from array import array
+from typing import Optional, Tuple
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.cell_codec import Position
+
+
+class DistanceField:
+    """
+    Shortest path distances from the food to every free cell, found with one
+    breadth-first search over the occupancy grid and shared by all snakes.
+
+    The field is rebuilt at most once per tick, or when the food moves, so its
+    cost does not grow with the number of snakes reading it. Snakes that move
+    later in the same tick do not invalidate it; readers must still check that
+    the cell they step into is free.
+    """
+
+    UNREACHABLE = -1
+
+    def __init__(self, occupancy: OccupancyGrid) -> None:
+        """
+        Initialize an empty distance field.
+
+        :param occupancy: The occupancy grid to search over.
+        """
+        self.occupancy = occupancy
+        self.codec = occupancy.codec
+        self.neighbours = [self.codec.neighbours[direction] for direction in self.codec.neighbours]
+        # copied over the distances to reset them before each search
+        self.blank = array("i", [self.UNREACHABLE]) * self.codec.size
+        self.distances = array("i", self.blank)
+        self.queue = array("i", [0]) * self.codec.size
+        self.key: Optional[Tuple[int, int]] = None
+        self.nodes_expanded = 0
+
+    def update(self, tick: int, food_pos: Optional[Position]) -> None:
+        """
+        Rebuild the field unless it is already up to date for this tick and food position.
+
+        :param tick: The current step of the game.
+        :param food_pos: The position of the food.
+        """
+        target = self.occupancy.index(food_pos) if food_pos is not None else -1
+        if self.key == (tick, target):
+            return
+        self.key = (tick, target)
+        self.search(target)
+
+    def invalidate(self) -> None:
+        """
+        Force the next update to rebuild the field, e.g. after the board was replaced.
+        """
+        self.key = None
+
+    def search(self, target: int) -> None:
+        """
+        Breadth-first search outwards from the target over the free cells.
+
+        :param target: The cell index to measure distances to, or -1 for none.
+        """
+        distances = self.distances
+        distances[:] = self.blank
+        if target < 0:
+            return
+        counts = self.occupancy.counts
+        neighbours = self.neighbours
+        queue = self.queue
+        queue[0] = target
+        distances[target] = 0
+        read, write = 0, 1
+        while read < write:
+            cell = queue[read]
+            read += 1
+            distance = distances[cell] + 1
+            for table in neighbours:
+                nxt = table[cell]
+                if nxt >= 0 and distances[nxt] < 0 and counts[nxt] == 0:
+                    distances[nxt] = distance
+                    queue[write] = nxt
+                    write += 1
+        self.nodes_expanded += read
+
+    def get_distance(self, pos: Position) -> int:
+        """
+        Get the distance from a cell to the food.
+
+        :param pos: The position to look up.
+        :return: The number of steps to the food, or UNREACHABLE.
+        """
+        idx = self.occupancy.index(pos)
+        if idx < 0:
+            return self.UNREACHABLE
+        return self.distances[idx]
@@ -1,17 +1,19 @@
-from typing import Tuple, Optional
+from typing import Optional
+from logic.game_objects.cell_codec import Position
 
 class Food:
     """
     A class to manage the food item in the game, including its position and state.
+    The position is either an (x, y) tuple or a cell index, matching the game's encoding.
     """
 
     def __init__(self) -> None:
         """
         Initialize the Food object with no position.
         """
-        self.pos: Optional[Tuple[int, int]] = None
+        self.pos: Optional[Position] = None
 
-    def respawn(self, pos: Optional[Tuple[int, int]]) -> None:
+    def respawn(self, pos: Optional[Position]) -> None:
         """
         Respawn the food at the given position.
 
@@ -19,7 +21,7 @@ class Food:
         """
         self.pos = pos
 
-    def get_position(self) -> Optional[Tuple[int, int]]:
+    def get_position(self) -> Optional[Position]:
         """
         Get the current position of the food.
 
@@ -0,0 +1,180 @@
+import os
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+
+class HamiltonianCycle:
+    """
+    A closed path visiting every cell of the board once, stored as the cell
+    indices in visiting order together with each cell's place on the path.
+
+    Cycles are built once per board size and cached both in memory and on
+    disk. Boards with an odd number of cells have no such cycle, so there the
+    cell in the bottom left corner is left out.
+    """
+
+    CACHE_DIR = os.path.join("cache", "hamiltonian")
+    NOT_ON_CYCLE = -1
+    _cache: Dict[Tuple[int, int], "HamiltonianCycle"] = {}
+
+    def __init__(self, width: int, height: int, order: Iterable[int]) -> None:
+        """
+        Initialize a cycle from its visiting order.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :param order: The cell indices in the order the cycle visits them.
+        """
+        self.width = width
+        self.height = height
+        self.order = array("i", order)
+        self.length = len(self.order)
+        self.positions = array("i", [self.NOT_ON_CYCLE]) * (width * height)
+        for place, cell in enumerate(self.order):
+            self.positions[cell] = place
+
+    @classmethod
+    def load(cls, width: int, height: int) -> "HamiltonianCycle":
+        """
+        Get the cycle for a board size, building and caching it if needed.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :return: The cycle for the board.
+        """
+        key = (width, height)
+        if key not in cls._cache:
+            order = cls.read(width, height)
+            if order is None:
+                order = cls.build(width, height)
+                cls.write(width, height, order)
+            cls._cache[key] = cls(width, height, order)
+        return cls._cache[key]
+
+    @classmethod
+    def precompute(cls, sizes: Iterable[Tuple[int, int]]) -> None:
+        """
+        Make sure the cycles for the given board sizes are cached on disk.
+
+        :param sizes: The (width, height) pairs to cache.
+        """
+        for width, height in sizes:
+            if not os.path.exists(cls.cache_path(width, height)):
+                cls.write(width, height, cls.build(width, height))
+
+    @classmethod
+    def cache_path(cls, width: int, height: int) -> str:
+        """
+        Get the file a cycle is cached in.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :return: The path of the cache file.
+        """
+        return os.path.join(cls.CACHE_DIR, f"{width}x{height}.bin")
+
+    @staticmethod
+    def typecode(width: int, height: int) -> str:
+        """
+        Get the smallest array typecode that fits every cell index of a board.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :return: The array typecode.
+        """
+        return "H" if width * height <= 0xFFFF else "I"
+
+    @classmethod
+    def read(cls, width: int, height: int):
+        """
+        Read a cached cycle from disk.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :return: The visiting order, or None if it is not cached or the file is damaged.
+        """
+        order = array(cls.typecode(width, height))
+        try:
+            with open(cls.cache_path(width, height), "rb") as file:
+                order.frombytes(file.read())
+        except (OSError, ValueError):
+            return None
+        if len(order) != width * height - (width * height) % 2:
+            return None
+        return order
+
+    @classmethod
+    def write(cls, width: int, height: int, order: List[int]) -> None:
+        """
+        Cache a cycle on disk. Failing to write only costs rebuilding it later.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :param order: The visiting order to cache.
+        """
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            with open(cls.cache_path(width, height), "wb") as file:
+                file.write(array(cls.typecode(width, height), order).tobytes())
+        except OSError:
+            pass
+
+    @staticmethod
+    def build(width: int, height: int) -> List[int]:
+        """
+        Construct a cycle: along the top row, then zigzag through the rows in
+        columns 1 and up, and back up column 0. Boards with an odd number of
+        rows are built transposed, or if both sides are odd the last two rows
+        are zigzagged column by column, skipping the bottom left cell.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :return: The cell indices in visiting order.
+        """
+        if width < 2 or height < 2:
+            raise ValueError(f"No cycle exists on a {width}x{height} board")
+        if height % 2 and not width % 2:
+            transposed = HamiltonianCycle.build(height, width)
+            return [(cell % height) * width + cell // height for cell in transposed]
+
+        path = [(0, 0)]
+        rows = height if height % 2 == 0 else height - 2
+        for y in range(rows):
+            xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+            path.extend((x, y) for x in xs)
+        if height % 2:
+            for x in range(width - 1, 0, -1):
+                ys = (rows, rows + 1) if (width - 1 - x) % 2 == 0 else (rows + 1, rows)
+                path.extend((x, y) for y in ys)
+            path.extend((0, y) for y in range(rows, 0, -1))
+        else:
+            path.extend((0, y) for y in range(height - 1, 0, -1))
+        return [y * width + x for x, y in path]
+
+    def get_place(self, cell: int) -> int:
+        """
+        Get the place of a cell on the cycle.
+
+        :param cell: The cell index.
+        :return: The place on the cycle, or NOT_ON_CYCLE.
+        """
+        return self.positions[cell]
+
+    def get_next(self, cell: int) -> int:
+        """
+        Get the cell the cycle visits after a cell on it.
+
+        :param cell: The cell index, must be on the cycle.
+        :return: The next cell index.
+        """
+        return self.order[(self.positions[cell] + 1) % self.length]
+
+    def distance(self, start: int, end: int) -> int:
+        """
+        Get how many steps along the cycle lead from one cell to another.
+
+        :param start: The cell index to start at, must be on the cycle.
+        :param end: The cell index to reach, must be on the cycle.
+        :return: The number of steps forwards along the cycle.
+        """
+        return (self.positions[end] - self.positions[start]) % self.length
@@ -0,0 +1,143 @@
+from typing import Optional, List, TYPE_CHECKING
+from logic.game_objects.cell_codec import CellCodec, Position
+
+if TYPE_CHECKING:
+    from logic.game_objects.spawn_generator import SpawnGenerator
+
+
+class OccupancyGrid:
+    """
+    A board-level record of how many snake segments cover each cell and which
+    snake owns it, giving O(1) collision and free-cell queries regardless of
+    the number of snakes.
+    """
+
+    def __init__(
+        self, width: int, height: int, spawn_generator: Optional["SpawnGenerator"] = None, cell_index: bool = False
+    ) -> None:
+        """
+        Initialize an empty grid.
+
+        :param width: The width of the game board.
+        :param height: The height of the game board.
+        :param spawn_generator: The spawn generator to keep in sync with the free cells.
+        :param cell_index: True if positions are passed as cell indices instead of (x, y) tuples.
+        """
+        self.width = width
+        self.height = height
+        self.cell_index = cell_index
+        self.codec = CellCodec(width, height)
+        self.counts = bytearray(width * height)
+        # snake id + 1 of the first snake to cover the cell, 0 when empty
+        self.owners = bytearray(width * height)
+        self.spawn_generator = spawn_generator
+        # bumped on every change so derived data can tell when it is stale
+        self.version = 0
+        # objects with a cell_changed(index, owner) method, told when a cell becomes empty or occupied
+        self.listeners: List = []
+
+    def index(self, pos: Position) -> int:
+        """
+        Get the flat index of a position.
+
+        :param pos: The position to convert.
+        :return: The index of the cell, or -1 if the position is out of bounds.
+        """
+        if self.cell_index:
+            return pos
+        x, y = pos
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            return -1
+        return y * self.width + x
+
+    def add(self, pos: Position, owner: int) -> None:
+        """
+        Add a segment of a snake to a cell. Positions out of bounds are ignored.
+
+        :param pos: The position of the segment.
+        :param owner: The id of the snake the segment belongs to.
+        """
+        idx = self.index(pos)
+        if idx < 0:
+            return
+        self.version += 1
+        if self.counts[idx] == 0:
+            self.owners[idx] = owner + 1
+            if self.spawn_generator is not None:
+                self.spawn_generator.remove(pos)
+            for listener in self.listeners:
+                listener.cell_changed(idx, owner + 1)
+        self.counts[idx] += 1
+
+    def remove(self, pos: Position) -> None:
+        """
+        Remove a segment from a cell. Positions out of bounds are ignored.
+
+        :param pos: The position of the segment.
+        """
+        idx = self.index(pos)
+        if idx < 0:
+            return
+        self.version += 1
+        self.counts[idx] -= 1
+        if self.counts[idx] == 0:
+            self.owners[idx] = 0
+            if self.spawn_generator is not None:
+                self.spawn_generator.insert(pos)
+            for listener in self.listeners:
+                listener.cell_changed(idx, 0)
+
+    def clear(self) -> None:
+        """
+        Empty every cell without updating the spawn generator.
+        """
+        self.version += 1
+        for listener in self.listeners:
+            for idx, owner in enumerate(self.owners):
+                if owner:
+                    listener.cell_changed(idx, 0)
+        self.counts[:] = bytes(len(self.counts))
+        self.owners[:] = bytes(len(self.owners))
+
+    def get_count(self, pos: Position) -> int:
+        """
+        Get the number of segments covering a cell.
+
+        :param pos: The position to check.
+        :return: The number of segments, 0 if the position is out of bounds.
+        """
+        idx = self.index(pos)
+        if idx < 0:
+            return 0
+        return self.counts[idx]
+
+    def get_owner(self, pos: Position) -> Optional[int]:
+        """
+        Get the id of the snake occupying a cell.
+
+        :param pos: The position to check.
+        :return: The snake id, or None if the cell is empty or out of bounds.
+        """
+        idx = self.index(pos)
+        if idx < 0 or self.owners[idx] == 0:
+            return None
+        return self.owners[idx] - 1
+
+    def is_occupied(self, pos: Position) -> bool:
+        """
+        Check if any snake segment covers a cell.
+
+        :param pos: The position to check.
+        :return: True if the cell is occupied, False otherwise.
+        """
+        return self.get_count(pos) > 0
+
+    def is_free(self, pos: Position) -> bool:
+        """
+        Check if a cell is inside the board and not covered by any snake.
+
+        :param pos: The position to check.
+        :return: True if the cell is free, False otherwise.
+        """
+        idx = self.index(pos)
+        return idx >= 0 and self.counts[idx] == 0
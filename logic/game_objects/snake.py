@@ -1,30 +1,58 @@
 from typing import Tuple, Optional, Deque, List
 from logic.game_objects.hash_queue import HashQueue
+from logic.game_objects.compact_hash_queue import CompactHashQueue
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.cell_codec import CellCodec, Position
 
 from typing import Tuple, Optional, Deque, List, Dict
 
 class Snake:
     """
     A class representing the snake in the game, managing its movement, growth, and collision detection.
+
+    With a codec the snake works on integer cell indices instead of (x, y) tuples,
+    so moving never allocates.
     """
 
-    def __init__(self, start_pos: Tuple[int, int], size: int = 3) -> None:
+    def __init__(
+        self,
+        start_pos: Position,
+        size: int = 3,
+        occupancy: Optional[OccupancyGrid] = None,
+        snake_id: int = 0,
+        codec: Optional[CellCodec] = None,
+        compact_body: bool = False,
+    ) -> None:
         """
         Initialize the snake with a starting position and initial size.
 
         :param start_pos: The starting position of the snake's head.
         :param size: The initial size of the snake.
-        """
-        self.body: HashQueue[Tuple[int, int]] = HashQueue()
+        :param occupancy: The shared occupancy grid to keep updated, if any.
+        :param snake_id: The id of the snake in the occupancy grid.
+        :param codec: The cell codec to use cell indices for positions, if any.
+        :param compact_body: Store the body in a CompactHashQueue, requires a codec.
+        """
+        self.occupancy = occupancy
+        self.snake_id = snake_id
+        self.codec = codec
+        if compact_body:
+            if codec is None:
+                raise ValueError("A compact body requires a cell codec")
+            self.body = CompactHashQueue(codec.size, codec.size + size + 1)
+        else:
+            self.body: HashQueue[Position] = HashQueue()
         self.body.add_back(start_pos)
+        if self.occupancy is not None:
+            self.occupancy.add(start_pos, self.snake_id)
         for _ in range(size - 1):
             self.grow()
-        self.last_tail: Optional[Tuple[int, int]] = None
+        self.last_tail: Optional[Position] = None
         self.ate: bool = False
         self.alive: bool = True
         self.exists: bool = True
 
-    def update(self, direction: Tuple[int, int], food_pos: Tuple[int, int]) -> None:
+    def update(self, direction: Tuple[int, int], food_pos: Optional[Position]) -> None:
         """
         Update the snake's position based on the direction and check if it eats the food.
 
@@ -43,8 +71,10 @@ class Snake:
         """
         Grow the snake by adding a segment to its body.
         """
-        tail_x, tail_y = self.body.peak_back()
-        self.body.add_back((tail_x, tail_y))
+        tail = self.body.peak_back()
+        self.body.add_back(tail)
+        if self.occupancy is not None:
+            self.occupancy.add(tail, self.snake_id)
 
     def move(self, direction: Tuple[int, int]) -> None:
         """
@@ -61,16 +91,23 @@ class Snake:
 
         :param direction: The direction in which the snake moves.
         """
-        x, y = direction
-        head_x, head_y = self.get_head()
-        new_head: Tuple[int, int] = (head_x + x, head_y + y)
+        if self.codec is not None:
+            new_head = self.codec.step(self.get_head(), direction)
+        else:
+            x, y = direction
+            head_x, head_y = self.get_head()
+            new_head = (head_x + x, head_y + y)
         self.body.add_front(new_head)
+        if self.occupancy is not None:
+            self.occupancy.add(new_head, self.snake_id)
 
     def remove_tail(self) -> None:
         """
         Remove the tail of the snake.
         """
         self.last_tail = self.body.pop_back()
+        if self.occupancy is not None and self.last_tail is not None:
+            self.occupancy.remove(self.last_tail)
         if self.check_position_exists(self.last_tail):
             self.last_tail = None
 
@@ -86,19 +123,21 @@ class Snake:
         """
         Remove the head of the snake.
         """
-        self.body.pop_front()
+        head = self.body.pop_front()
+        if self.occupancy is not None and head is not None:
+            self.occupancy.remove(head)
         if self.get_size() <= 0:
             self.exists = False
 
-    def get_body(self) -> Deque[Tuple[int, int]]:
+    def get_body(self) -> Deque[Position]:
         """
         Get the current body of the snake.
 
-        :return: The body of the snake as a deque of positions.
+        :return: The body of the snake as a deque of positions, or a view over a compact body.
         """
         return self.body.get_data()
 
-    def get_head(self) -> Tuple[int, int]:
+    def get_head(self) -> Position:
         """
         Get the current head position of the snake.
 
@@ -106,7 +145,7 @@ class Snake:
         """
         return self.body.peak_front()
 
-    def check_food(self, food_pos: Tuple[int, int]) -> bool:
+    def check_food(self, food_pos: Optional[Position]) -> bool:
         """
         Check if the snake's head is at the food position.
 
@@ -123,7 +162,7 @@ class Snake:
         """
         return self.body.get_length()
 
-    def get_last_tail(self) -> Optional[Tuple[int, int]]:
+    def get_last_tail(self) -> Optional[Position]:
         """
         Get the last tail position of the snake.
 
@@ -146,6 +185,12 @@ class Snake:
         :return: True if the snake has collided, False otherwise.
         """
         head = self.get_head()
+        if self.occupancy is not None:
+            # any segment on the head's cell besides the head itself is a collision
+            if self.check_bounds(width, height, head) or self.occupancy.get_count(head) > 1:
+                self.die()
+                return True
+            return False
         for key in keys:
             snake = snakes[key]
             if snake and snake is not self and snake.check_position_exists(head):
@@ -167,7 +212,7 @@ class Snake:
         self.alive = False
         self.remove_head()
 
-    def check_bounds(self, width: int, height: int, pos: Tuple[int, int]) -> bool:
+    def check_bounds(self, width: int, height: int, pos: Position) -> bool:
         """
         Check if the position is out of the game bounds.
 
@@ -176,6 +221,8 @@ class Snake:
         :param pos: The position to check.
         :return: True if the position is out of bounds, False otherwise.
         """
+        if self.codec is not None:
+            return not self.codec.in_bounds(pos)
         x, y = pos
         return x < 0 or x >= width or y < 0 or y >= height
 
@@ -187,7 +234,7 @@ class Snake:
         """
         return self.body.has_multi(self.get_head())
 
-    def check_position_exists(self, pos: Tuple[int, int]) -> bool:
+    def check_position_exists(self, pos: Position) -> bool:
         """
         Check if the position exists in the snake's body.
 
@@ -0,0 +1,96 @@
+from array import array
+from typing import List
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.cell_codec import Position
+
+
+class SpaceEvaluator:
+    """
+    Counts how many free cells can be reached from a cell with a flood fill
+    over the occupancy grid.
+
+    Fills stop once they reach the requested limit, and cells are marked with
+    the fill that reached them instead of clearing a visited array, so no fill
+    allocates. Until the grid changes, a cell inside an earlier fill is
+    answered from that fill, so the candidate moves of one snake usually cost
+    a single fill between them.
+    """
+
+    def __init__(self, occupancy: OccupancyGrid) -> None:
+        """
+        Initialize the evaluator.
+
+        :param occupancy: The occupancy grid to search over.
+        """
+        self.occupancy = occupancy
+        self.codec = occupancy.codec
+        self.neighbours = [self.codec.neighbours[direction] for direction in self.codec.neighbours]
+        self.stamps = array("i", [0]) * self.codec.size
+        self.queue = array("i", [0]) * self.codec.size
+        # size of each fill since the last reset and whether it covered its whole region
+        self.sizes: List[int] = []
+        self.complete: List[bool] = []
+        self.first_stamp = 1
+        self.next_stamp = 1
+        self.version = -1
+        self.nodes_expanded = 0
+
+    def count_reachable(self, pos: Position, limit: int) -> int:
+        """
+        Count the free cells connected to a cell, the cell itself included.
+
+        :param pos: The position to start from.
+        :param limit: Stop counting once this many cells were found.
+        :return: The number of reachable cells, at most limit, 0 if the cell is not free.
+        """
+        cell = self.occupancy.index(pos)
+        if cell < 0 or self.occupancy.counts[cell]:
+            return 0
+        if self.version != self.occupancy.version:
+            self.reset()
+        fill = self.stamps[cell] - self.first_stamp
+        if fill >= 0 and (self.complete[fill] or self.sizes[fill] >= limit):
+            return min(self.sizes[fill], limit)
+        return self.fill(cell, limit)
+
+    def reset(self) -> None:
+        """
+        Forget all fills, e.g. because the grid changed.
+        """
+        self.version = self.occupancy.version
+        self.sizes.clear()
+        self.complete.clear()
+        if self.next_stamp > 0x7FFF0000:
+            self.stamps[:] = array("i", [0]) * len(self.stamps)
+            self.next_stamp = 1
+        self.first_stamp = self.next_stamp
+
+    def fill(self, start: int, limit: int) -> int:
+        """
+        Flood fill outwards from a free cell until the region or the limit is exhausted.
+
+        :param start: The cell index to start from.
+        :param limit: The number of cells after which to stop.
+        :return: The number of cells found, at most limit.
+        """
+        stamp = self.next_stamp
+        self.next_stamp += 1
+        stamps = self.stamps
+        counts = self.occupancy.counts
+        queue = self.queue
+        queue[0] = start
+        stamps[start] = stamp
+        read, write = 0, 1
+        while read < write and write < limit:
+            cell = queue[read]
+            read += 1
+            for table in self.neighbours:
+                nxt = table[cell]
+                if nxt >= 0 and stamps[nxt] != stamp and counts[nxt] == 0:
+                    stamps[nxt] = stamp
+                    queue[write] = nxt
+                    write += 1
+        self.nodes_expanded += read
+        self.sizes.append(write)
+        self.complete.append(read == write)
+        return min(write, limit)
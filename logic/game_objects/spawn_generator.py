@@ -1,5 +1,6 @@
 from typing import Tuple, List, Dict, Optional
-from random import choice
+from random import Random
+from logic.game_objects.cell_codec import Position
 
 
 class SpawnGenerator:
@@ -7,24 +8,32 @@ class SpawnGenerator:
     A class to manage the generation and removal of spawn points on a game board.
     """
 
-    def __init__(self, width: int, height: int) -> None:
+    # random cells tried before falling back to counting through the free ones
+    MAX_DRAWS = 8
+
+    def __init__(self, width: int, height: int, cell_index: bool = False, rng: Optional[Random] = None) -> None:
         """
         Initialize the spawn generator with a board of given width and height,
         and remove the starting position from the available spawn points.
 
         :param width: The width of the game board.
         :param height: The height of the game board.
-        :param start_pos: The starting position to be removed from spawn points.
+        :param cell_index: True to store spawn points as cell indices instead of (x, y) tuples.
+        :param rng: The random number generator to pick spawn points with.
         """
-        self.list: List[Tuple[int, int]] = []
-        self.map: Dict[Tuple[int, int], int] = {}
+        self.list: List[Position] = []
+        self.map: Dict[Position, int] = {}
+        self.width = width
+        self.height = height
+        self.cell_index = cell_index
+        self.rng = rng if rng is not None else Random()
         self.init_board(width, height)
     
     def update(self, head_pos, tail_pos):
         self.insert(head_pos)
         self.remove(tail_pos)
 
-    def insert(self, coord: Tuple[int, int]) -> bool:
+    def insert(self, coord: Position) -> bool:
         """
         Insert a coordinate into the available spawn points.
 
@@ -37,7 +46,7 @@ class SpawnGenerator:
         self.list.append(coord)
         return True
 
-    def remove(self, coord: Tuple[int, int]) -> bool:
+    def remove(self, coord: Position) -> bool:
         """
         Remove a coordinate from the available spawn points.
 
@@ -61,16 +70,45 @@ class SpawnGenerator:
         :param width: The width of the game board.
         :param height: The height of the game board.
         """
-        coords = [(x, y) for x in range(width) for y in range(height)]
+        if self.cell_index:
+            coords = [y * width + x for x in range(width) for y in range(height)]
+        else:
+            coords = [(x, y) for x in range(width) for y in range(height)]
         self.list.extend(coords)
         self.map.update({coord: idx for idx, coord in enumerate(coords)})
 
-    def get_random(self) -> Optional[Tuple[int, int]]:
+    def reset(self) -> None:
+        """
+        Make every cell of the board available again.
+        """
+        self.list.clear()
+        self.map.clear()
+        self.init_board(self.width, self.height)
+
+    def get_random(self) -> Optional[Position]:
         """
         Get a random coordinate from the available spawn points.
 
+        The pick depends only on which cells are available and the random
+        number generator, not on the order of the spawn list, so a game
+        restored with a rebuilt list picks the same cells.
+
         :return: A random coordinate, or None if no spawn points are available.
         """
         if not self.list:
             return None
-        return choice(self.list)
+        rng = self.rng
+        width = self.width
+        size = width * self.height
+        free = self.map
+        for _ in range(self.MAX_DRAWS):
+            cell = int(rng.random() * size)
+            coord = cell if self.cell_index else (cell % width, cell // width)
+            if coord in free:
+                return coord
+        # a mostly full board, pick among the free cells in board order
+        if self.cell_index:
+            cells = sorted(self.list)
+        else:
+            cells = sorted(self.list, key=lambda coord: coord[1] * width + coord[0])
+        return cells[rng.randrange(len(cells))]
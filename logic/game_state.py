@@ -1,6 +1,7 @@
 import numpy as np
-from typing import Tuple, Any
+from typing import Tuple, Any, Iterable, Optional, Sequence
 from collections import deque
+from logic.game_objects.directions import DIRECTIONS
 
 class GameState:
     """
@@ -8,6 +9,11 @@ class GameState:
     and assembling the game state for AI training.
     """
 
+    # direction order of the one-hot indicators
+    DIRECTIONS = DIRECTIONS
+    # own body, other bodies, heads, food
+    GRID_CHANNELS = 4
+
     def __init__(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
@@ -84,3 +90,86 @@ class GameState:
         )
 
         return state
+
+    def get_vector_size(self, max_body: int) -> int:
+        """Get the length of a fixed-size vector state for bodies of up to max_body segments."""
+        return 1 + 2 * max_body + 14
+
+    def get_grid_shape(self) -> Tuple[int, int, int]:
+        """Get the shape of a grid state."""
+        return (self.GRID_CHANNELS, self.height, self.width)
+
+    def write_vector_state(self, out: np.ndarray, body_segments: Iterable[Any], food_position: Optional[Tuple[int, int]],
+                           last_direction: Tuple[int, int], opposite_direction: Tuple[int, int]) -> np.ndarray:
+        """
+        Write the state of assemble_game_state into a preallocated vector, with the
+        body padded to a fixed length and preceded by its length.
+
+        Layout: length, body x/y pairs padded with zeros, food, distance to food,
+        direction and opposite direction indicators, width and height.
+
+        Args:
+            out (np.ndarray): The vector to write into, of get_vector_size(max_body) elements.
+            body_segments (Iterable[Any]): The body as cell indices front to back, in one or more
+                buffers such as CompactHashQueue.get_segments(). Cut off after max_body segments.
+            food_position (Optional[Tuple[int, int]]): The position of the food, written as -1, -1 if None.
+            last_direction (Tuple[int, int]): The last direction of the snake.
+            opposite_direction (Tuple[int, int]): The opposite of the last direction.
+
+        Returns:
+            np.ndarray: The out vector.
+        """
+        max_body = (len(out) - 15) // 2
+        pos = 1
+        end = 1 + 2 * max_body
+        for segment in body_segments:
+            cells = np.frombuffer(segment, dtype=np.int32) if not isinstance(segment, np.ndarray) else segment
+            count = min(len(cells), (end - pos) // 2)
+            np.divmod(cells[:count], self.width, out=(out[pos + 1:pos + 2 * count:2], out[pos:pos + 2 * count:2]))
+            pos += 2 * count
+        out[0] = (pos - 1) // 2
+        out[pos:end] = 0
+
+        food_x, food_y = food_position if food_position is not None else (-1, -1)
+        out[end] = food_x
+        out[end + 1] = food_y
+        if pos > 1:
+            out[end + 2] = food_x - out[1]
+            out[end + 3] = food_y - out[2]
+        else:
+            out[end + 2:end + 4] = 0
+        out[end + 4:end + 12] = 0
+        if last_direction in self.DIRECTIONS:
+            out[end + 4 + self.DIRECTIONS.index(last_direction)] = 1
+        if opposite_direction in self.DIRECTIONS:
+            out[end + 8 + self.DIRECTIONS.index(opposite_direction)] = 1
+        out[end + 12] = self.width
+        out[end + 13] = self.height
+        return out
+
+    def write_grid_state(self, out: np.ndarray, owners: Any, snake_id: int, heads: Sequence[Tuple[int, int]],
+                         food_position: Optional[Tuple[int, int]]) -> np.ndarray:
+        """
+        Write the board into a preallocated multi-channel grid.
+
+        Args:
+            out (np.ndarray): The grid to write into, of shape get_grid_shape().
+            owners (Any): The owner of each cell as snake id + 1, 0 when empty, e.g. OccupancyGrid.owners.
+            snake_id (int): The id of the snake the state is for.
+            heads (Sequence[Tuple[int, int]]): The head positions of all snakes.
+            food_position (Optional[Tuple[int, int]]): The position of the food.
+
+        Returns:
+            np.ndarray: The out grid.
+        """
+        owners = np.frombuffer(owners, dtype=np.uint8).reshape(self.height, self.width)
+        np.equal(owners, snake_id + 1, out=out[0])
+        np.not_equal(owners, 0, out=out[1])
+        out[1] -= out[0]
+        out[2:] = 0
+        for x, y in heads:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                out[2, y, x] = 1
+        if food_position is not None:
+            out[3, food_position[1], food_position[0]] = 1
+        return out
@@ -0,0 +1,110 @@
+import numpy as np
+from typing import Dict, Optional
+from logic.game_logic import GameLogic
+from logic.game_state import GameState
+
+
+class GridObservation:
+    """
+    A multi-channel grid of the board (own body, other bodies, heads, food)
+    for one snake, kept up to date from the game's changes instead of being
+    rebuilt every step.
+
+    Body channels follow the occupancy grid, which reports every cell that
+    becomes empty or occupied. Heads and food are moved on update, so a step
+    costs O(changed cells). The layout matches GameState.write_grid_state.
+    """
+
+    def __init__(self, game_logic: GameLogic, snake_id: int = 0, out: Optional[np.ndarray] = None) -> None:
+        """
+        Build the grid for the current board and start following its changes.
+
+        Args:
+            game_logic (GameLogic): The game to observe, GameLogic or GameLogicHuman.
+            snake_id (int): The id of the snake the observation is for.
+            out (Optional[np.ndarray]): The float array of shape (4, height, width) to keep the grid in.
+        """
+        self.game_logic = game_logic
+        self.snake_id = snake_id
+        self.occupancy = game_logic.occupancy
+        shape = GameState(game_logic.width, game_logic.height).get_grid_shape()
+        self.grid = out if out is not None else np.zeros(shape, dtype=np.float32)
+        if not self.grid.flags.c_contiguous:
+            raise ValueError("The grid must be a contiguous array")
+        self.own, self.others, self.heads, self.food = self.grid.reshape(shape[0], -1)
+        self.head_cells: Dict[int, int] = {}
+        self.food_cell = -1
+        self.rebuild()
+        self.occupancy.listeners.append(self)
+
+    def rebuild(self) -> None:
+        """
+        Build the whole grid from the board.
+        """
+        owners = np.frombuffer(self.occupancy.owners, dtype=np.uint8)
+        np.equal(owners, self.snake_id + 1, out=self.own)
+        np.not_equal(owners, 0, out=self.others)
+        self.others -= self.own
+        self.heads[:] = 0
+        self.food[:] = 0
+        self.head_cells = {}
+        self.food_cell = -1
+        self.update()
+
+    def cell_changed(self, index: int, owner: int) -> None:
+        """
+        Update the body channels of a cell that became empty or occupied.
+
+        Args:
+            index (int): The index of the cell.
+            owner (int): The id + 1 of the snake now on the cell, 0 when empty.
+        """
+        own = owner == self.snake_id + 1
+        self.own[index] = own
+        self.others[index] = owner != 0 and not own
+
+    def update(self) -> np.ndarray:
+        """
+        Move the heads and the food to where they are after the last tick.
+
+        Returns:
+            np.ndarray: The grid, of shape (4, height, width).
+        """
+        logic = self.game_logic
+        occupancy = self.occupancy
+        heads = self.heads
+        head_cells = self.head_cells
+        for key in list(head_cells):
+            if key not in logic.snakes:
+                heads[head_cells.pop(key)] = 0
+        for key in logic.keys:
+            cell = occupancy.index(logic.snakes[key].get_head())
+            previous = head_cells.get(key, -1)
+            if cell == previous:
+                continue
+            if previous >= 0:
+                heads[previous] = 0
+            if cell >= 0:
+                head_cells[key] = cell
+            else:
+                head_cells.pop(key, None)
+        # marks are cleared before they are set so snakes sharing a cell keep it marked
+        for cell in head_cells.values():
+            heads[cell] = 1
+
+        food = logic.food.get_position()
+        cell = occupancy.index(food) if food is not None else -1
+        if cell != self.food_cell:
+            if self.food_cell >= 0:
+                self.food[self.food_cell] = 0
+            if cell >= 0:
+                self.food[cell] = 1
+            self.food_cell = cell
+        return self.grid
+
+    def close(self) -> None:
+        """
+        Stop following the board's changes.
+        """
+        if self in self.occupancy.listeners:
+            self.occupancy.listeners.remove(self)
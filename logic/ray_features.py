@@ -0,0 +1,112 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from logic.game_logic import GameLogic
+
+
+class RayFeatures:
+    """
+    Casts rays from the heads of all live snakes on a board and measures how
+    far along each ray the wall, the nearest snake segment and the food are.
+
+    All snakes, directions and ray steps are handled in one set of NumPy
+    operations over the occupancy counts.
+
+    Each distance d, in steps along the ray, is given as 1 / d, so closer
+    things give larger values and 0 means the ray never meets one.
+    """
+
+    DIRECTIONS_8 = [(0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+    DIRECTIONS_16 = DIRECTIONS_8 + [(-1, -2), (1, -2), (-2, -1), (2, -1), (-2, 1), (2, 1), (-1, 2), (1, 2)]
+    FEATURES = ("wall", "body", "food")
+
+    def __init__(self, width: int, height: int, num_directions: int = 8) -> None:
+        """
+        Initialize the ray offsets for a board.
+
+        Args:
+            width (int): The width of the game area.
+            height (int): The height of the game area.
+            num_directions (int): The number of rays per snake, 8 or 16.
+        """
+        if num_directions == 8:
+            directions = self.DIRECTIONS_8
+        elif num_directions == 16:
+            directions = self.DIRECTIONS_16
+        else:
+            raise ValueError(f"Unsupported number of ray directions: {num_directions}")
+        self.width = width
+        self.height = height
+        self.num_directions = num_directions
+        steps = np.arange(1, max(width, height) + 1)
+        directions = np.array(directions)
+        # offsets of every step of every ray, shape (directions, steps)
+        self.offset_x = directions[:, 0, None] * steps
+        self.offset_y = directions[:, 1, None] * steps
+        self.inverse_steps = (1.0 / steps).astype(np.float32)
+
+    def get_feature_size(self) -> int:
+        """
+        Get the number of features per snake.
+
+        Returns:
+            int: The wall, body and food distances of every ray.
+        """
+        return len(self.FEATURES) * self.num_directions
+
+    def compute(self, game_logic: GameLogic, out: Optional[np.ndarray] = None) -> Tuple[List[int], np.ndarray]:
+        """
+        Compute the ray features of every live snake.
+
+        Args:
+            game_logic (GameLogic): The game to read the board from.
+            out (Optional[np.ndarray]): A float array of at least (snakes, get_feature_size()) to write into.
+
+        Returns:
+            Tuple[List[int], np.ndarray]: The ids of the live snakes and their features, one row per
+                snake laid out as all wall, then all body, then all food distances.
+        """
+        occupancy = game_logic.occupancy
+        keys = []
+        heads = []
+        for key in game_logic.keys:
+            snake = game_logic.snakes[key]
+            cell = occupancy.index(snake.get_head())
+            if snake.check_alive() and cell >= 0:
+                keys.append(key)
+                heads.append(cell)
+
+        features = self.get_feature_size()
+        if out is None:
+            out = np.zeros((len(keys), features), dtype=np.float32)
+        out = out[:len(keys)]
+        if not keys:
+            return keys, out
+
+        heads = np.array(heads)
+        # positions along every ray, shape (snakes, directions, steps)
+        xs = (heads % self.width)[:, None, None] + self.offset_x
+        ys = (heads // self.width)[:, None, None] + self.offset_y
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        cells = np.where(inside, ys * self.width + xs, 0)
+
+        counts = np.frombuffer(occupancy.counts, dtype=np.uint8)
+        food = game_logic.food.get_position()
+        food_cell = occupancy.index(food) if food is not None else -1
+        d = self.num_directions
+
+        # rays are straight, so the cells inside the board are a prefix of each ray
+        out[:, :d] = 1.0 / (inside.sum(axis=2) + 1)
+        self.first_hit(counts[cells].astype(bool) & inside, out[:, d:2 * d])
+        self.first_hit((cells == food_cell) & inside, out[:, 2 * d:])
+        return keys, out
+
+    def first_hit(self, hits: np.ndarray, out: np.ndarray) -> None:
+        """
+        Write the inverse distance of the first hit along each ray.
+
+        Args:
+            hits (np.ndarray): Whether each step of each ray hits, shape (snakes, directions, steps).
+            out (np.ndarray): The array of shape (snakes, directions) to write into.
+        """
+        first = hits.argmax(axis=2)
+        np.multiply(self.inverse_steps[first], hits.any(axis=2), out=out)
@@ -0,0 +1,512 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from typing import Dict, List, Tuple, Any, Type, Optional
+from logic.game_logic import GameLogic
+from logic.game_objects.snake import Snake
+from logic.game_objects.cell_codec import CellCodec, Position
+from logic.game_objects.compact_hash_queue import CompactHashQueue
+from logic.controller.controller import Controller
+
+REPLAY_MAGIC = b"SNKR"
+INDEX_MAGIC = b"SNKI"
+REPLAY_VERSION = 2
+REPLAY_EXTENSION = ".snkr"
+DEFAULT_KEYFRAME_INTERVAL = 1000
+
+# magic, version, header length
+HEADER_STRUCT = struct.Struct("<4sBI")
+# start tick, tick count, keyframe offset, keyframe length, chunk offset, chunk length
+INDEX_ENTRY_STRUCT = struct.Struct("<IIQIQI")
+# index offset, block count, total ticks, magic
+FOOTER_STRUCT = struct.Struct("<QII4s")
+# length of the keyframe's JSON part
+KEYFRAME_STRUCT = struct.Struct("<I")
+
+DIRECTION_CODES: Dict[Tuple[int, int], int] = {
+    direction: code for code, direction in enumerate(Controller.DIRECTIONS)
+}
+
+
+def get_codec(game_logic: GameLogic) -> CellCodec:
+    """
+    Get a cell codec for a game, reusing the game's own codec if it has one.
+
+    Args:
+        game_logic (GameLogic): The game.
+
+    Returns:
+        CellCodec: The codec for the game's board.
+    """
+    if game_logic.codec is not None:
+        return game_logic.codec
+    return game_logic.occupancy.codec
+
+
+def encode_position(game_logic: GameLogic, pos: Optional[Position]) -> int:
+    """
+    Convert a position of the game to a cell index, -1 for None.
+    """
+    if pos is None:
+        return CellCodec.OUT
+    if game_logic.codec is not None:
+        return pos
+    return get_codec(game_logic).encode(pos)
+
+
+def decode_position(game_logic: GameLogic, cell: int) -> Optional[Position]:
+    """
+    Convert a cell index to a position of the game, None for -1.
+    """
+    if cell < 0:
+        return None
+    if game_logic.codec is not None:
+        return cell
+    return get_codec(game_logic).decode(cell)
+
+
+def seed_block(game_logic: GameLogic, block: int) -> None:
+    """
+    Reseed the random number generator of a game at the start of a block.
+
+    Every block after the first starts from a seed derived from the game's
+    seed and the block index, so keyframes do not need to store the
+    generator's state.
+
+    Args:
+        game_logic (GameLogic): The game.
+        block (int): The index of the block starting.
+    """
+    game_logic.rng.seed(game_logic.seed if block == 0 else f"{game_logic.seed}/{block}")
+
+
+def encode_keyframe(game_logic: GameLogic) -> bytes:
+    """
+    Serialize the state of a game at the start of a block: snake bodies and
+    food. The free cells are rebuilt from the bodies and the random number
+    generator is reseeded by seed_block.
+
+    Args:
+        game_logic (GameLogic): The game to serialize.
+
+    Returns:
+        bytes: The compressed keyframe.
+    """
+    snakes = []
+    bodies = array("i")
+    for key in game_logic.keys:
+        snake = game_logic.snakes[key]
+        body = [encode_position(game_logic, pos) for pos in snake.get_body()]
+        bodies.extend(body)
+        snakes.append({
+            "id": key,
+            "length": len(body),
+            "alive": snake.check_alive(),
+            "exists": snake.check_exists(),
+            "ate": snake.check_ate(),
+            "last_tail": encode_position(game_logic, snake.get_last_tail()),
+            "direction": DIRECTION_CODES[game_logic.get_controller(key).get_current_direction()],
+        })
+    meta = {
+        "step_count": game_logic.step_count,
+        "running": game_logic.running,
+        "keys": game_logic.keys,
+        "snakes": snakes,
+        "food": encode_position(game_logic, game_logic.food.get_position()),
+        "last_directions": {key: DIRECTION_CODES[direction] for key, direction in game_logic.last_directions.items()},
+    }
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    blob = b"".join((KEYFRAME_STRUCT.pack(len(meta_bytes)), meta_bytes, bodies.tobytes()))
+    return zlib.compress(blob, 6)
+
+
+def restore_keyframe(game_logic: GameLogic, keyframe: bytes) -> None:
+    """
+    Load a keyframe into a game created by Replay.create_game. The caller
+    reseeds the random number generator with seed_block.
+
+    Args:
+        game_logic (GameLogic): The game to overwrite.
+        keyframe (bytes): A keyframe produced by encode_keyframe.
+    """
+    blob = zlib.decompress(keyframe)
+    (meta_len,) = KEYFRAME_STRUCT.unpack_from(blob)
+    offset = KEYFRAME_STRUCT.size
+    meta = json.loads(blob[offset:offset + meta_len].decode("utf-8"))
+    offset += meta_len
+
+    bodies = array("i")
+    bodies.frombytes(blob[offset:])
+
+    # every cell is free until the bodies are added back
+    occupancy = game_logic.occupancy
+    occupancy.clear()
+    occupancy.spawn_generator.reset()
+    compact_body = any(isinstance(snake.body, CompactHashQueue) for snake in game_logic.snakes.values())
+
+    controllers = game_logic.controllers
+    game_logic.snakes = {}
+    game_logic.controllers = {}
+    start = 0
+    for state in meta["snakes"]:
+        key = state["id"]
+        body = [decode_position(game_logic, cell) for cell in bodies[start:start + state["length"]]]
+        start += state["length"]
+        if body:
+            snake = Snake(body[-1], 1, occupancy, key, game_logic.codec, compact_body)
+            for pos in reversed(body[:-1]):
+                snake.body.add_front(pos)
+                occupancy.add(pos, key)
+        else:
+            # crashed with nothing left, removed on the next tick
+            snake = Snake(CellCodec.OUT, 1, None, key, game_logic.codec, compact_body)
+            snake.body.pop_back()
+            snake.occupancy = occupancy
+        snake.alive = state["alive"]
+        snake.exists = state["exists"]
+        snake.ate = state["ate"]
+        snake.last_tail = decode_position(game_logic, state["last_tail"])
+        game_logic.snakes[key] = snake
+        controller = controllers.get(key) or Controller.select("External", Controller.DIRECTIONS[0])
+        controller.set_direction(Controller.DIRECTIONS[state["direction"]])
+        game_logic.controllers[key] = controller
+
+    game_logic.food.respawn(decode_position(game_logic, meta["food"]))
+    game_logic.keys = meta["keys"]
+    game_logic.step_count = meta["step_count"]
+    game_logic.running = meta["running"]
+    game_logic.distance_field.invalidate()
+    game_logic.last_directions = {
+        int(key): Controller.DIRECTIONS[code] for key, code in meta["last_directions"].items()
+    }
+
+
+class ReplayRecorder:
+    """
+    Records a game as its seed, its configuration and the direction given to
+    every snake on every tick, packed at 2 bits per snake per tick.
+
+    Ticks are grouped into blocks of keyframe_interval ticks. Each block is
+    stored as a keyframe of the full game state at its start, followed by its
+    compressed direction codes, so a reader can seek without re-simulating
+    from the first tick.
+
+    Attributes:
+        header (Dict[str, Any]): The seed and configuration needed to rebuild the game.
+        num_snakes (int): The number of snakes recorded per tick.
+        keyframe_interval (int): The number of ticks per block.
+        ticks (int): The number of ticks recorded.
+    """
+
+    def __init__(self, game_logic: GameLogic, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """
+        Initialize the recorder for a freshly created game.
+
+        Args:
+            game_logic (GameLogic): The game to record.
+            keyframe_interval (int): The number of ticks between keyframes.
+        """
+        self.game_logic = game_logic
+        self.num_snakes = len(game_logic.controller_types)
+        self.keyframe_interval = keyframe_interval
+        self.header: Dict[str, Any] = {
+            "seed": game_logic.seed,
+            "width": game_logic.width,
+            "height": game_logic.height,
+            "snake_size": game_logic.snake_size,
+            "num_snakes": self.num_snakes,
+            "game_mode": game_logic.game_mode,
+            "controllers": game_logic.controller_types,
+            "keyframe_interval": keyframe_interval,
+        }
+        self.ticks = 0
+        # finished blocks as (start tick, tick count, keyframe, chunk)
+        self.blocks: List[Tuple[int, int, bytes, bytes]] = []
+        # the first block starts from the initial state, rebuilt from the seed
+        self.keyframe = b""
+        self.block_start = 0
+        self.codes = 0
+        self.data = bytearray()
+
+    def record_tick(self) -> None:
+        """
+        Record the directions the snakes were given in the last update.
+        """
+        last_directions = self.game_logic.last_directions
+        for snake_id in range(self.num_snakes):
+            direction = last_directions.get(snake_id)
+            self.push(DIRECTION_CODES.get(direction, 0))
+        self.ticks += 1
+        if self.ticks - self.block_start == self.keyframe_interval:
+            self.finish_block()
+            self.keyframe = encode_keyframe(self.game_logic)
+            seed_block(self.game_logic, self.ticks // self.keyframe_interval)
+
+    def push(self, code: int) -> None:
+        """
+        Append a 2-bit direction code to the current block.
+
+        Args:
+            code (int): The direction code to append.
+        """
+        offset = self.codes & 3
+        if offset == 0:
+            self.data.append(0)
+        self.data[-1] |= code << (offset * 2)
+        self.codes += 1
+
+    def finish_block(self) -> None:
+        """
+        Compress the current block and start a new one.
+        """
+        chunk = zlib.compress(bytes(self.data), 9)
+        self.blocks.append((self.block_start, self.ticks - self.block_start, self.keyframe, chunk))
+        self.block_start = self.ticks
+        self.codes = 0
+        self.data = bytearray()
+
+    def save(self, path: str) -> None:
+        """
+        Write the replay to a file.
+
+        Args:
+            path (str): The path of the replay file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        blocks = list(self.blocks)
+        if self.ticks > self.block_start or not blocks:
+            chunk = zlib.compress(bytes(self.data), 9)
+            blocks.append((self.block_start, self.ticks - self.block_start, self.keyframe, chunk))
+
+        header = json.dumps(self.header, separators=(",", ":")).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(HEADER_STRUCT.pack(REPLAY_MAGIC, REPLAY_VERSION, len(header)))
+            file.write(header)
+            index = []
+            for start, ticks, keyframe, chunk in blocks:
+                keyframe_offset = file.tell()
+                file.write(keyframe)
+                chunk_offset = file.tell()
+                file.write(chunk)
+                index.append(INDEX_ENTRY_STRUCT.pack(
+                    start, ticks, keyframe_offset, len(keyframe), chunk_offset, len(chunk)
+                ))
+            index_offset = file.tell()
+            file.write(b"".join(index))
+            file.write(FOOTER_STRUCT.pack(index_offset, len(index), self.ticks, INDEX_MAGIC))
+
+
+class Replay:
+    """
+    A recorded game read through a memory map. Only the direction block
+    being played is decompressed, and seeking restores the nearest keyframe
+    before re-simulating the remaining ticks.
+
+    Attributes:
+        header (Dict[str, Any]): The seed and configuration of the game.
+        ticks (int): The number of recorded ticks.
+        num_snakes (int): The number of snakes recorded per tick.
+        keyframe_interval (int): The number of ticks per block.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a replay file.
+
+        Args:
+            path (str): The path of the replay file.
+
+        Raises:
+            ValueError: If the file is not a supported replay.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.read_index()
+        except (ValueError, struct.error) as e:
+            self.file.close()
+            raise ValueError(f"'{path}' is not a supported replay file.") from e
+        self.num_snakes = self.header["num_snakes"]
+        self.block_idx = -1
+        self.block_data = b""
+
+    def read_index(self) -> None:
+        """
+        Read the header and the block index.
+        """
+        magic, version, header_len = HEADER_STRUCT.unpack_from(self.map, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("bad magic or version")
+        offset = HEADER_STRUCT.size
+        self.header = json.loads(self.map[offset:offset + header_len].decode("utf-8"))
+
+        index_offset, count, self.ticks, index_magic = FOOTER_STRUCT.unpack_from(
+            self.map, len(self.map) - FOOTER_STRUCT.size
+        )
+        if index_magic != INDEX_MAGIC:
+            raise ValueError("missing index")
+        self.index = [
+            INDEX_ENTRY_STRUCT.unpack_from(self.map, index_offset + i * INDEX_ENTRY_STRUCT.size)
+            for i in range(count)
+        ]
+        self.keyframe_interval = self.header["keyframe_interval"]
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file.
+        """
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> "Replay":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_block_index(self, tick: int) -> int:
+        """
+        Get the block holding a tick.
+
+        Args:
+            tick (int): The index of the tick.
+
+        Returns:
+            int: The index of the block, clamped to the last block.
+        """
+        return min(tick // self.keyframe_interval, len(self.index) - 1)
+
+    def load_block(self, block_idx: int) -> None:
+        """
+        Decompress the direction codes of a block, dropping the previous block.
+        """
+        if block_idx == self.block_idx:
+            return
+        _, _, _, _, chunk_offset, chunk_len = self.index[block_idx]
+        self.block_data = zlib.decompress(self.map[chunk_offset:chunk_offset + chunk_len])
+        self.block_idx = block_idx
+
+    def get_directions(self, tick: int) -> List[Tuple[int, int]]:
+        """
+        Get the directions given to every snake on a tick.
+
+        Args:
+            tick (int): The index of the tick, starting at 0.
+
+        Returns:
+            List[Tuple[int, int]]: The direction of each snake by id.
+        """
+        block_idx = self.get_block_index(tick)
+        self.load_block(block_idx)
+        directions = []
+        start = (tick - self.index[block_idx][0]) * self.num_snakes
+        for code_idx in range(start, start + self.num_snakes):
+            code = (self.block_data[code_idx >> 2] >> ((code_idx & 3) * 2)) & 3
+            directions.append(Controller.DIRECTIONS[code])
+        return directions
+
+    def create_game(self, logic_class: Type[GameLogic] = GameLogic, **kwargs) -> GameLogic:
+        """
+        Create a game in its starting state, driven by the recorded directions.
+
+        Args:
+            logic_class (Type[GameLogic]): The game logic class to create.
+            **kwargs: Extra arguments for the game logic, such as cell_index.
+
+        Returns:
+            GameLogic: The new game.
+        """
+        header = self.header
+        return logic_class(
+            header["width"],
+            header["height"],
+            controllers=["External"] * self.num_snakes,
+            snake_size=header["snake_size"],
+            num_snakes=self.num_snakes,
+            game_mode=header["game_mode"],
+            seed=header["seed"],
+            **kwargs
+        )
+
+    def step(self, game_logic: GameLogic, tick: int) -> bool:
+        """
+        Feed the recorded directions of a tick to a game and update it.
+
+        Args:
+            game_logic (GameLogic): A game created by create_game.
+            tick (int): The index of the tick to play.
+
+        Returns:
+            bool: True if the game continues, False otherwise.
+        """
+        directions = self.get_directions(tick)
+        for key in game_logic.keys:
+            game_logic.get_controller(key).set_direction(directions[key])
+        if tick and tick % self.keyframe_interval == 0:
+            seed_block(game_logic, tick // self.keyframe_interval)
+        return game_logic.update()
+
+    def seek(self, game_logic: GameLogic, tick: int) -> None:
+        """
+        Move a game to the state after a number of ticks.
+
+        Restores the nearest keyframe at or before the tick, then re-simulates
+        only the ticks between the keyframe and the target.
+
+        Args:
+            game_logic (GameLogic): A game created by create_game.
+            tick (int): The number of ticks played after seeking, clamped to the replay length.
+        """
+        tick = max(0, min(tick, self.ticks))
+        current = game_logic.step_count
+        block_idx = self.get_block_index(tick)
+        start, _, keyframe_offset, keyframe_len, _, _ = self.index[block_idx]
+
+        # step forward from the current state when that is closer than the keyframe
+        if not (start <= current <= tick):
+            if keyframe_len:
+                restore_keyframe(game_logic, self.map[keyframe_offset:keyframe_offset + keyframe_len])
+            else:
+                fresh = self.create_game(type(game_logic), cell_index=game_logic.codec is not None)
+                restore_keyframe(game_logic, encode_keyframe(fresh))
+            seed_block(game_logic, block_idx)
+            current = start
+        for t in range(current, tick):
+            self.step(game_logic, t)
+
+
+def load_replay(path: str) -> Replay:
+    """
+    Open a replay file.
+
+    Args:
+        path (str): The path of the replay file.
+
+    Returns:
+        Replay: The opened replay.
+    """
+    return Replay(path)
+
+
+def list_replays(directory: str) -> List[str]:
+    """
+    List the replay files in a directory, newest first.
+
+    Args:
+        directory (str): The directory to search.
+
+    Returns:
+        List[str]: The paths of the replay files.
+    """
+    if not os.path.isdir(directory):
+        return []
+    paths = [
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(REPLAY_EXTENSION)
+    ]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
@@ -0,0 +1,103 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TickProfiler:
+    """
+    Cumulative time per phase of a tick and event counters, kept per snake
+    and per controller type.
+
+    Attach it with GameLogic.enable_profiling. Games without a profiler run
+    the normal update and pay nothing for it.
+
+    Attributes:
+        ticks (int): The number of profiled ticks.
+        tick_ns (int): The total time spent in profiled ticks.
+        by_snake (Dict[int, Dict[str, int]]): Phase times in ns and counters for each snake id.
+        by_controller (Dict[str, Dict[str, int]]): Phase times in ns and counters for each controller type.
+    """
+
+    PHASES = ("controller", "movement", "collision", "food")
+    COUNTERS = ("collisions_checked", "collisions", "nodes_expanded", "food_respawns")
+
+    def __init__(self, log_interval: int = 0, log: Optional[logging.Logger] = None) -> None:
+        """
+        Initialize an empty profiler.
+
+        Args:
+            log_interval (int): Log a summary every this many ticks, 0 to never log.
+            log (Optional[logging.Logger]): The logger for the summaries, this module's logger if None.
+        """
+        self.log_interval = log_interval
+        self.log = log or logger
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.ticks = 0
+        self.tick_ns = 0
+        self.by_snake: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.by_controller: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, snake_id: int, controller_type: str, name: str, value: int) -> None:
+        """
+        Add to a phase time or a counter of a snake and its controller type.
+
+        Args:
+            snake_id (int): The ID of the snake.
+            controller_type (str): The controller type of the snake.
+            name (str): The phase or counter name.
+            value (int): The ns or the count to add.
+        """
+        self.by_snake[snake_id][name] += value
+        self.by_controller[controller_type][name] += value
+
+    def end_tick(self, elapsed_ns: int) -> None:
+        """
+        Count a finished tick and log a summary when the interval is reached.
+
+        Args:
+            elapsed_ns (int): The time the whole tick took.
+        """
+        self.ticks += 1
+        self.tick_ns += elapsed_ns
+        if self.log_interval and self.ticks % self.log_interval == 0:
+            self.log.info(self.format_summary())
+
+    def get_summary(self) -> dict:
+        """
+        Get everything recorded so far.
+
+        Returns:
+            dict: The tick count, the mean tick time in microseconds and the
+                totals per phase and counter, per snake and per controller type.
+        """
+        totals: Dict[str, int] = defaultdict(int)
+        for values in self.by_controller.values():
+            for name, value in values.items():
+                totals[name] += value
+        return {
+            "ticks": self.ticks,
+            "mean_tick_us": self.tick_ns / self.ticks / 1000 if self.ticks else 0.0,
+            "totals": dict(totals),
+            "by_snake": {key: dict(values) for key, values in self.by_snake.items()},
+            "by_controller": {key: dict(values) for key, values in self.by_controller.items()},
+        }
+
+    def format_summary(self) -> str:
+        """
+        Format the summary as one line per controller type.
+
+        Returns:
+            str: The mean time per tick of each phase in microseconds, and the counters per tick.
+        """
+        ticks = max(self.ticks, 1)
+        lines = [f"{self.ticks} ticks, {self.tick_ns / ticks / 1000:.1f}us per tick"]
+        for controller_type, values in sorted(self.by_controller.items()):
+            phases = " ".join(f"{phase} {values[phase] / ticks / 1000:.1f}us" for phase in self.PHASES)
+            counters = " ".join(f"{name} {values[name] / ticks:.2f}" for name in self.COUNTERS)
+            lines.append(f"  {controller_type}: {phases} | per tick: {counters}")
+        return "\n".join(lines)
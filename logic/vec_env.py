@@ -0,0 +1,320 @@
+import numpy as np
+import multiprocessing as mp
+from random import Random
+from typing import List, Optional, Sequence, Tuple
+from logic.game_logic import GameLogic
+from logic.game_state import GameState
+from logic.grid_observation import GridObservation
+from logic.controller.controller import Controller
+
+
+class SnakeEnv:
+    """
+    A single training board: snake 0 is driven by the agent through an
+    External controller, any other snakes by AI controllers.
+
+    Actions are indices into Controller.DIRECTIONS. An episode ends when the
+    agent's snake dies or after max_steps steps. Observations have a fixed
+    shape: either the padded vector state of GameState or its multi-channel grid.
+
+    Attributes:
+        game_logic (GameLogic): The game of the current episode.
+        game_state (GameState): The reward bookkeeping of the current step.
+        obs_shape (Tuple[int, ...]): The shape of an observation.
+    """
+
+    FOOD_REWARD = 1.0
+    DEATH_REWARD = -1.0
+    STEP_REWARD = 0.0
+
+    def __init__(
+        self, width: int, height: int, opponents: Sequence[str] = (), snake_size: int = 3,
+        max_steps: int = 0, seed: Optional[int] = None, obs_mode: str = "vector"
+    ) -> None:
+        """
+        Initialize the environment, call reset before stepping it.
+
+        Args:
+            width (int): The width of the game area.
+            height (int): The height of the game area.
+            opponents (Sequence[str]): The controller types of the other snakes.
+            snake_size (int): The initial size of the snakes.
+            max_steps (int): The number of steps after which an episode is cut off, 0 for no limit.
+            seed (Optional[int]): Seed for the seeds of the episodes, random if None.
+            obs_mode (str): 'vector' for the padded vector state, 'grid' for the grid state.
+        """
+        self.width = width
+        self.height = height
+        self.controllers = ["External"] + list(opponents)
+        self.snake_size = snake_size
+        self.max_steps = max_steps
+        self.rng = Random(seed)
+        self.game_state = GameState(width, height)
+        self.obs_mode = obs_mode
+        if obs_mode == "vector":
+            # the body can be at most one segment longer than the board while the snake grows
+            self.obs_shape = (self.game_state.get_vector_size(width * height + 1),)
+        elif obs_mode == "grid":
+            self.obs_shape = self.game_state.get_grid_shape()
+        else:
+            raise ValueError(f"Unknown observation mode: {obs_mode}")
+        self.game_logic: Optional[GameLogic] = None
+        self.grid_observation: Optional[GridObservation] = None
+
+    def reset(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Start a new episode.
+
+        Args:
+            out (Optional[np.ndarray]): The buffer to write the first observation into.
+
+        Returns:
+            np.ndarray: The first observation.
+        """
+        # ring buffer bodies keep many boards small and give the observation contiguous segments
+        self.game_logic = GameLogic(
+            self.width, self.height, self.controllers, self.snake_size, len(self.controllers), "normal",
+            cell_index=True, compact_body=True, seed=self.rng.randrange(2 ** 32)
+        )
+        # place the food before the first step so the agent can see it
+        self.game_logic.update_food()
+        if self.obs_mode == "grid":
+            self.grid_observation = GridObservation(self.game_logic, 0, out)
+        self.game_state.reset()
+        self.game_state.step_count = 0
+        return self.observe(out)
+
+    def step(self, action: int, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float, bool]:
+        """
+        Play one step with the agent moving in the given direction.
+
+        Args:
+            action (int): The index of the direction in Controller.DIRECTIONS.
+            out (Optional[np.ndarray]): The buffer to write the observation into.
+
+        Returns:
+            Tuple[np.ndarray, float, bool]: The observation, the reward and whether the episode ended.
+        """
+        logic = self.game_logic
+        state = self.game_state
+        state.reset()
+        logic.controllers[0].set_direction(Controller.DIRECTIONS[action])
+        logic.update()
+        state.increment_step()
+
+        snake = logic.snakes.get(0)
+        alive = snake is not None and snake.check_alive()
+        state.set_just_ate(alive and snake.check_ate())
+        state.update_reward(self.STEP_REWARD)
+        if state.get_just_ate():
+            state.update_reward(self.FOOD_REWARD)
+        if not alive:
+            state.update_reward(self.DEATH_REWARD)
+        done = not alive or not logic.running or 0 < self.max_steps <= state.step_count
+        return self.observe(out), state.get_reward(), done
+
+    def observe(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the agent's view of the game.
+
+        Args:
+            out (Optional[np.ndarray]): The buffer to write the observation into.
+
+        Returns:
+            np.ndarray: The observation.
+        """
+        if out is None:
+            out = np.zeros(self.obs_shape, dtype=np.float32)
+        logic = self.game_logic
+        controller = logic.controllers.get(0)
+        if 0 not in logic.snakes or controller is None:
+            out[:] = 0
+            return out
+        if self.obs_mode == "grid":
+            grid = self.grid_observation.update()
+            if out.ctypes.data != grid.ctypes.data:
+                out[:] = grid
+            return out
+        return self.game_state.write_vector_state(
+            out, logic.snakes[0].body.get_segments(), logic.get_food_position(),
+            controller.direction, controller.opposite_direction
+        )
+
+
+def _worker(conn, env_kwargs: List[dict]) -> None:
+    """
+    Run a chunk of environments in a worker process, answering commands from the pipe.
+
+    Args:
+        conn: The worker's end of the pipe.
+        env_kwargs (List[dict]): The arguments of each environment.
+    """
+    envs = VecSnakeEnv.make_envs(env_kwargs)
+    obs = np.zeros((len(envs),) + envs[0].obs_shape, dtype=np.float32)
+    rewards = np.zeros(len(envs), dtype=np.float32)
+    dones = np.zeros(len(envs), dtype=bool)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "step":
+                VecSnakeEnv.step_envs(envs, data, obs, rewards, dones)
+                conn.send((obs, rewards, dones))
+            elif command == "reset":
+                for i, env in enumerate(envs):
+                    env.reset(obs[i])
+                conn.send(obs)
+            elif command == "close":
+                break
+    finally:
+        conn.close()
+
+
+class VecSnakeEnv:
+    """
+    A batch of SnakeEnv boards stepped together, run in this process or
+    split across a pool of worker processes.
+
+    Observations, rewards and dones are returned as stacked arrays that are
+    reused between calls. A board whose episode ended is reset in place, and
+    the observation returned for it is the first one of the new episode.
+    """
+
+    def __init__(
+        self, num_envs: int, width: int, height: int, opponents: Sequence[str] = (), snake_size: int = 3,
+        max_steps: int = 0, seed: Optional[int] = None, num_workers: int = 0, obs_mode: str = "vector"
+    ) -> None:
+        """
+        Initialize the environments.
+
+        Args:
+            num_envs (int): The number of boards.
+            width (int): The width of the game area.
+            height (int): The height of the game area.
+            opponents (Sequence[str]): The controller types of the other snakes on each board.
+            snake_size (int): The initial size of the snakes.
+            max_steps (int): The number of steps after which an episode is cut off, 0 for no limit.
+            seed (Optional[int]): Seed for the boards, board i uses seed + i. Random if None.
+            num_workers (int): The number of worker processes, 0 to run in this process.
+            obs_mode (str): 'vector' for the padded vector state, 'grid' for the grid state.
+        """
+        seeds = [None if seed is None else seed + i for i in range(num_envs)]
+        env_kwargs = [
+            dict(width=width, height=height, opponents=tuple(opponents), snake_size=snake_size,
+                 max_steps=max_steps, seed=env_seed, obs_mode=obs_mode)
+            for env_seed in seeds
+        ]
+        self.num_envs = num_envs
+        self.num_workers = min(num_workers, num_envs)
+        self.envs: List[SnakeEnv] = []
+        self.conns = []
+        self.processes = []
+        self.slices = []
+        if self.num_workers:
+            chunks = np.array_split(np.arange(num_envs), self.num_workers)
+            for chunk in chunks:
+                parent, child = mp.Pipe()
+                process = mp.Process(
+                    target=_worker, args=(child, [env_kwargs[i] for i in chunk]), daemon=True
+                )
+                process.start()
+                child.close()
+                self.conns.append(parent)
+                self.processes.append(process)
+                self.slices.append(slice(int(chunk[0]), int(chunk[-1]) + 1))
+            self.obs_shape = SnakeEnv(**env_kwargs[0]).obs_shape
+        else:
+            self.envs = self.make_envs(env_kwargs)
+            self.obs_shape = self.envs[0].obs_shape
+        self.obs = np.zeros((num_envs,) + self.obs_shape, dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+
+    @staticmethod
+    def make_envs(env_kwargs: List[dict]) -> List[SnakeEnv]:
+        """
+        Create environments from their arguments.
+
+        Args:
+            env_kwargs (List[dict]): The arguments of each environment.
+
+        Returns:
+            List[SnakeEnv]: The environments.
+        """
+        return [SnakeEnv(**kwargs) for kwargs in env_kwargs]
+
+    @staticmethod
+    def step_envs(
+        envs: List[SnakeEnv], actions: Sequence[int], obs: np.ndarray, rewards: np.ndarray, dones: np.ndarray
+    ) -> None:
+        """
+        Step environments, resetting the ones that finished, and write the results into the given arrays.
+
+        Args:
+            envs (List[SnakeEnv]): The environments to step.
+            actions (Sequence[int]): The action for each environment.
+            obs (np.ndarray): The observations to write into.
+            rewards (np.ndarray): The rewards to write into.
+            dones (np.ndarray): The done flags to write into.
+        """
+        for i, env in enumerate(envs):
+            _, rewards[i], dones[i] = env.step(int(actions[i]), obs[i])
+            if dones[i]:
+                env.reset(obs[i])
+
+    def reset(self) -> np.ndarray:
+        """
+        Start a new episode on every board.
+
+        Returns:
+            np.ndarray: The stacked first observations.
+        """
+        if self.num_workers:
+            for conn in self.conns:
+                conn.send(("reset", None))
+            for conn, part in zip(self.conns, self.slices):
+                self.obs[part] = conn.recv()
+        else:
+            for i, env in enumerate(self.envs):
+                env.reset(self.obs[i])
+        return self.obs
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Play one step on every board.
+
+        Args:
+            actions (Sequence[int]): The action for each board.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The stacked observations, rewards and done flags.
+        """
+        if self.num_workers:
+            actions = np.asarray(actions)
+            for conn, part in zip(self.conns, self.slices):
+                conn.send(("step", actions[part]))
+            for conn, part in zip(self.conns, self.slices):
+                self.obs[part], self.rewards[part], self.dones[part] = conn.recv()
+        else:
+            self.step_envs(self.envs, actions, self.obs, self.rewards, self.dones)
+        return self.obs, self.rewards, self.dones
+
+    def close(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self.processes:
+            process.join(timeout=1)
+        self.conns = []
+        self.processes = []
+
+    def __enter__(self) -> "VecSnakeEnv":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -2,10 +2,13 @@ import pygame
 from interfaces.main_menu import MainMenu
 from interfaces.play_game import PlayGame
 from interfaces.options import Options
+from interfaces.replay_game import ReplayGame
+from logic.replay import list_replays
+from logic.game_objects.hamiltonian_cycle import HamiltonianCycle
 from config.config import GameConfig
+from diagnostics.tracer import tracer, save_trace
 
 ### bugs ###
-# spawn generator goes outside area like due to snake death un expected behaviour 
 # test an ai can move backwards through itself 
 ### update ###
 # make better system for handling button clicks
@@ -55,7 +58,24 @@ def main() -> None:
         print(e)
         return
 
-    # Create the main menu
+    # build the cycles for the preset boards once, later starts read them from disk
+    HamiltonianCycle.precompute(
+        (size["number_of_cells"], size["number_of_cells"]) for size in config.GAME_SIZE_BUTTONS.values()
+    )
+
+    if config.TRACE:
+        tracer.enable(config.TRACE_CAPACITY)
+
+    try:
+        run_menu(screen, config)
+    finally:
+        # quitting from any screen ends up here, keep what was traced
+        if tracer.count:
+            print(f"Trace saved to {save_trace(config.TRACE_DIR)}")
+
+
+def run_menu(screen: pygame.Surface, config: GameConfig) -> None:
+    """Show the main menu and run the screens chosen from it until Quit."""
     main_menu = MainMenu(screen, config)
     while True:
         main_menu.reset()
@@ -73,8 +93,16 @@ def main() -> None:
             options = Options(screen, config)
             options.run()
         elif choice == config.REPLAY:
-            # Handle replay mode
-            pass
+            # play the most recent recording
+            replays = list_replays(config.REPLAY_DIR)
+            if not replays:
+                continue
+            try:
+                replay_game = ReplayGame(screen, config, replays[0])
+            except ValueError as e:
+                print(e)
+                continue
+            replay_game.run()
         else:
             break
 
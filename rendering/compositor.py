@@ -0,0 +1,80 @@
+import pygame
+from typing import Callable, Hashable, List, Optional, Tuple
+
+
+class Compositor:
+    """
+    Keeps the static layers of a screen, such as the background, the board
+    border and the buttons, pre-rendered in one surface, so a frame starts
+    from a single blit instead of redrawing them.
+
+    Each layer has a key that changes whenever the layer would look
+    different. The cached surface is rebuilt, drawing every layer in order,
+    when the screen size or any key changes.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        """
+        Initialize a compositor without layers.
+
+        Args:
+            screen (pygame.Surface): The screen the layers are drawn onto.
+        """
+        self.screen = screen
+        self.layers: List[Tuple[Callable[[pygame.Surface], None], Callable[[], Hashable]]] = []
+        self.surface: Optional[pygame.Surface] = None
+        self.keys: Optional[tuple] = None
+        self.rebuilds = 0
+
+    def add_layer(self, draw: Callable[[pygame.Surface], None], get_key: Callable[[], Hashable]) -> None:
+        """
+        Add a layer on top of the ones added before.
+
+        Args:
+            draw (Callable[[pygame.Surface], None]): Draws the layer onto the given surface.
+            get_key (Callable[[], Hashable]): Returns a value that changes when the layer has to be redrawn.
+        """
+        self.layers.append((draw, get_key))
+        self.surface = None
+
+    def get_keys(self) -> tuple:
+        return (self.screen.get_size(),) + tuple(get_key() for _, get_key in self.layers)
+
+    def is_stale(self) -> bool:
+        """
+        Check if the cached layers no longer match what they would draw now.
+
+        Returns:
+            bool: True if the next draw rebuilds the cached surface.
+        """
+        return self.surface is None or self.get_keys() != self.keys
+
+    def rebuild(self) -> None:
+        """Draw every layer into a new cached surface."""
+        self.keys = self.get_keys()
+        self.surface = pygame.Surface(self.screen.get_size())
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        for draw, _ in self.layers:
+            draw(self.surface)
+        self.rebuilds += 1
+
+    def draw(self, area: Optional[pygame.Rect] = None) -> bool:
+        """
+        Blit the static layers onto the screen, rebuilding them first if they are stale.
+
+        Args:
+            area (Optional[pygame.Rect]): The only part of the screen drawn over since the
+                last draw, the whole screen if None. It is ignored when the layers are rebuilt.
+
+        Returns:
+            bool: True if the whole screen was drawn.
+        """
+        if self.is_stale():
+            self.rebuild()
+            area = None
+        if area is None:
+            self.screen.blit(self.surface, (0, 0))
+            return True
+        self.screen.blit(self.surface, area, area)
+        return False
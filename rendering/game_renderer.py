@@ -1,18 +1,54 @@
+import numpy as np
 import pygame
 from config.config import GameConfig
 from collections import deque
-from typing import Tuple, List, Deque, Dict
+from typing import Tuple, List, Deque, Dict, Optional, Set, NamedTuple, Sequence
+
+
+class DrawnState(NamedTuple):
+    """What a frame drew, to find the cells the next frame has to redraw."""
+    layout: Tuple[int, int, int, Tuple[int, int]]
+    paused: bool
+    # snake id -> head cell, direction and whether the snake is alive
+    heads: Dict[int, Tuple[int, Tuple[int, int], bool]]
+    # snake id -> index of the first tapered segment and the cells from there to the tail
+    tails: Dict[int, Tuple[int, List[int]]]
+    food: int
+
 
 class GameRenderer:
-    def __init__(self, screen, config: GameConfig):
+    # full: every segment every frame, dirty: only changed cells, lowres: one pixel per cell scaled up
+    RENDER_MODES = ("full", "dirty", "lowres")
+    # segments at the tail end that shrink when only the changed cells are redrawn
+    TAPER_SEGMENTS = 4
+
+    def __init__(self, screen, config: GameConfig, board_size: Optional[Tuple[int, int]] = None):
         self.screen = screen
         self.config = config
-        self.WIDTH = config.game_width
-        self.HEIGHT = config.game_height
+        self.board_size = board_size
+        self.WIDTH, self.HEIGHT = board_size or (config.game_width, config.game_height)
         self.paused = False 
+        # rendered snake segments by (cell size, size, color, direction, is head)
+        self.sprites: Dict[Tuple, pygame.Surface] = {}
+        # set when a compositor caches the border
+        self.border_cached = False
+        # low resolution rendering, sized by update_low_res
+        self.palette: Optional[np.ndarray] = None
+        self.cell_colors: Optional[np.ndarray] = None
+        self.cells_surface: Optional[pygame.Surface] = None
+        self.scaled_surface: Optional[pygame.Surface] = None
+        # dirty rect rendering, set up by track
+        self.game_logic = None
+        self.taper_segments: Optional[int] = None
+        self.dirty_cells: Set[int] = set()
+        self.drawn: Optional[DrawnState] = None
 
     def update_offsets(self):
-        self.cell_size = self.config.cell_size
+        if self.board_size is None:
+            self.cell_size = self.config.cell_size
+        else:
+            # fit a board that was not sized from the current config, e.g. a replay
+            self.cell_size = min(self.config.gw // self.WIDTH, self.config.gh // self.HEIGHT)
         screen_width, screen_height = self.screen.get_size()
         self.off_x = (screen_width - self.WIDTH * self.cell_size) // 2
         self.off_y = (screen_height - self.HEIGHT * self.cell_size) // 2
@@ -22,12 +58,16 @@ class GameRenderer:
         self.FOOD_SIZE = self.cell_size // 6
 
     def update_screen_size(self):
+        cell_size = getattr(self, "cell_size", None)
         self.update_offsets()
         self.update_sizes()
+        if self.cell_size != cell_size:
+            # sprites are drawn for one cell size
+            self.sprites.clear()
 
-    def draw_border(self):
+    def draw_border(self, surface: Optional[pygame.Surface] = None):
         pygame.draw.rect(
-            self.screen,
+            surface or self.screen,
             self.config.BORDER_COLOR,
             pygame.Rect(
                 self.off_x - self.config.gbt - self.config.gbos,
@@ -38,70 +78,131 @@ class GameRenderer:
             self.config.gbt,
         )
 
+    def get_board_rect(self) -> pygame.Rect:
+        """Get the area the game draws in: the board, its border and the tongues reaching over it."""
+        border = self.config.gbt + self.config.gbos + self.cell_size // 2
+        return pygame.Rect(
+            self.off_x - border,
+            self.off_y - border,
+            self.WIDTH * self.cell_size + border * 2,
+            self.HEIGHT * self.cell_size + border * 2,
+        ).clip(self.screen.get_rect())
+
+    def get_border_key(self) -> tuple:
+        """Get a key that changes whenever the border moves or changes size."""
+        return (self.off_x, self.off_y, self.cell_size, self.config.gbt, self.config.gbos)
+
+    def add_layers(self, compositor) -> None:
+        """Let a compositor cache the border, call update_screen_size before it draws."""
+        compositor.add_layer(self.draw_border, self.get_border_key)
+        self.border_cached = True
+
+    def get_color(self, snake_id: int) -> Tuple[int, int, int]:
+        if snake_id == 0:
+            return self.config.GREEN_SNAKE
+        elif snake_id == 1:
+            return (129, 0, 0)  # Dark Red
+        return (169, 169, 169)  # Grey
+
+    def get_segment_size(self, index: int, length: int) -> int:
+        """Get the drawn size of the segment at an index from the head of a body."""
+        max_size = self.cell_size
+        min_size = max_size // 2
+        if self.taper_segments is None:
+            size_step = (max_size - min_size) / (length - 1) if length > 1 else 0
+            return max_size - int(index * size_step)
+        # only the last segments shrink, so a move changes a fixed number of cells
+        from_tail = length - 1 - index
+        if index == 0 or from_tail >= self.taper_segments:
+            return max_size
+        return max_size - int((self.taper_segments - from_tail) * (max_size - min_size) / self.taper_segments)
+
     def draw_snake(self, snake: Deque[Tuple[int, int]], last_direction: Tuple[int, int], color: Tuple[int, int, int]):
         body = snake
+        length = len(body)
+        for i, pos in enumerate(body):
+            self.draw_segment(pos, self.get_segment_size(i, length), i == 0, last_direction, color)
 
-        if body:
-            max_size = self.cell_size
-            min_size = max_size // 2
-            size_step = (max_size - min_size) / (len(body) - 1) if len(body) > 1 else 0
-
-            for i, pos in enumerate(body):
-                size = max_size - int(i * size_step)
-                half_diff = (max_size - size) // 2
-                position = (
-                    pos[0] * self.cell_size + self.off_x + half_diff,
-                    pos[1] * self.cell_size + self.off_y + half_diff,
-                )
-                rect = pygame.Rect(position, (size, size))
-                border_radius = min(size // 2, self.SNAKE_BORDER_RADIUS)
-
-                if i == 0:
-                    pygame.draw.rect(self.screen, self.config.BORDER_COLOR, rect, border_radius=border_radius)
-                    outline_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    pygame.draw.rect(outline_surface, self.config.BORDER_COLOR, outline_surface.get_rect(), 2, border_radius=border_radius)
-                    self.screen.blit(outline_surface, position)
-                    
-                    eye_width = size // 4
-                    eye_height = size // 8
-                    eye_offset = size // 3
-                    
-                    left_eye = right_eye = pygame.Rect(0, 0, eye_width, eye_height)
-                    tongue_points = [(0, 0), (0, 0), (0, 0)]
-
-                    if last_direction == (1, 0):  # Right
-                        left_eye = pygame.Rect(position[0] + eye_offset, position[1] + eye_height, eye_width, eye_height)
-                        right_eye = pygame.Rect(position[0] + eye_offset, position[1] + size - 2 * eye_height, eye_width, eye_height)
-                        tongue_points = [(position[0] + size + eye_width, position[1] + size // 2),
-                                         (position[0] + size, position[1] + size // 2 - eye_height),
-                                         (position[0] + size, position[1] + size // 2 + eye_height)]
-                    elif last_direction == (-1, 0):  # Left
-                        left_eye = pygame.Rect(position[0] + size - eye_offset - eye_width, position[1] + eye_height, eye_width, eye_height)
-                        right_eye = pygame.Rect(position[0] + size - eye_offset - eye_width, position[1] + size - 2 * eye_height, eye_width, eye_height)
-                        tongue_points = [(position[0] - eye_width, position[1] + size // 2),
-                                         (position[0], position[1] + size // 2 - eye_height),
-                                         (position[0], position[1] + size // 2 + eye_height)]
-                    elif last_direction == (0, 1):  # Down
-                        left_eye = pygame.Rect(position[0] + eye_height, position[1] + eye_offset, eye_height, eye_width)
-                        right_eye = pygame.Rect(position[0] + size - 2 * eye_height, position[1] + eye_offset, eye_height, eye_width)
-                        tongue_points = [(position[0] + size // 2, position[1] + size + eye_height),
-                                         (position[0] + size // 2 - eye_width, position[1] + size),
-                                         (position[0] + size // 2 + eye_width, position[1] + size)]
-                    elif last_direction == (0, -1):  # Up
-                        left_eye = pygame.Rect(position[0] + eye_height, position[1] + size - eye_offset - eye_width, eye_height, eye_width)
-                        right_eye = pygame.Rect(position[0] + size - 2 * eye_height, position[1] + size - eye_offset - eye_width, eye_height, eye_width)
-                        tongue_points = [(position[0] + size // 2, position[1] - eye_height),
-                                         (position[0] + size // 2 - eye_width, position[1]),
-                                         (position[0] + size // 2 + eye_width, position[1])]
-                    
-                    pygame.draw.rect(self.screen, color, left_eye)
-                    pygame.draw.rect(self.screen, color, right_eye)
-                    pygame.draw.polygon(self.screen, self.config.RED, tongue_points)
-                else:
-                    pygame.draw.rect(self.screen, color, rect, border_radius=border_radius)
-                    outline_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    pygame.draw.rect(outline_surface, (*self.config.BORDER_COLOR, self.config.SNAKE_TRANS), outline_surface.get_rect(), 2, border_radius=border_radius)
-                    self.screen.blit(outline_surface, position)
+    def draw_segment(self, pos: Tuple[int, int], size: int, is_head: bool, last_direction: Tuple[int, int], color: Tuple[int, int, int]):
+        half_diff = (self.cell_size - size) // 2
+        x = pos[0] * self.cell_size + self.off_x + half_diff
+        y = pos[1] * self.cell_size + self.off_y + half_diff
+        if is_head:
+            # head sprites have room around the head for the tongue
+            margin = size // 4 + 1
+            self.screen.blit(self.get_sprite(size, True, last_direction, color), (x - margin, y - margin))
+        else:
+            self.screen.blit(self.get_sprite(size, False, None, color), (x, y))
+
+    def get_sprite(self, size: int, is_head: bool, last_direction: Optional[Tuple[int, int]], color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the sprite of a segment, rendering it the first time it is asked for at the current cell size."""
+        key = (self.cell_size, size, color, last_direction, is_head)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if is_head:
+                sprite = self.render_head(size, last_direction, color)
+            else:
+                sprite = self.render_segment(size, color)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.sprites[key] = sprite
+        return sprite
+
+    def render_segment(self, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        border_radius = min(size // 2, self.SNAKE_BORDER_RADIUS)
+        pygame.draw.rect(sprite, color, sprite.get_rect(), border_radius=border_radius)
+        outline_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(outline_surface, (*self.config.BORDER_COLOR, self.config.SNAKE_TRANS), outline_surface.get_rect(), 2, border_radius=border_radius)
+        sprite.blit(outline_surface, (0, 0))
+        return sprite
+
+    def render_head(self, size: int, last_direction: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+        eye_width = size // 4
+        eye_height = size // 8
+        eye_offset = size // 3
+
+        margin = eye_width + 1
+        sprite = pygame.Surface((size + 2 * margin, size + 2 * margin), pygame.SRCALPHA)
+        position = (margin, margin)
+        rect = pygame.Rect(position, (size, size))
+        border_radius = min(size // 2, self.SNAKE_BORDER_RADIUS)
+        pygame.draw.rect(sprite, self.config.BORDER_COLOR, rect, border_radius=border_radius)
+        pygame.draw.rect(sprite, self.config.BORDER_COLOR, rect, 2, border_radius=border_radius)
+
+        left_eye = right_eye = pygame.Rect(0, 0, eye_width, eye_height)
+        tongue_points = [(0, 0), (0, 0), (0, 0)]
+
+        if last_direction == (1, 0):  # Right
+            left_eye = pygame.Rect(position[0] + eye_offset, position[1] + eye_height, eye_width, eye_height)
+            right_eye = pygame.Rect(position[0] + eye_offset, position[1] + size - 2 * eye_height, eye_width, eye_height)
+            tongue_points = [(position[0] + size + eye_width, position[1] + size // 2),
+                             (position[0] + size, position[1] + size // 2 - eye_height),
+                             (position[0] + size, position[1] + size // 2 + eye_height)]
+        elif last_direction == (-1, 0):  # Left
+            left_eye = pygame.Rect(position[0] + size - eye_offset - eye_width, position[1] + eye_height, eye_width, eye_height)
+            right_eye = pygame.Rect(position[0] + size - eye_offset - eye_width, position[1] + size - 2 * eye_height, eye_width, eye_height)
+            tongue_points = [(position[0] - eye_width, position[1] + size // 2),
+                             (position[0], position[1] + size // 2 - eye_height),
+                             (position[0], position[1] + size // 2 + eye_height)]
+        elif last_direction == (0, 1):  # Down
+            left_eye = pygame.Rect(position[0] + eye_height, position[1] + eye_offset, eye_height, eye_width)
+            right_eye = pygame.Rect(position[0] + size - 2 * eye_height, position[1] + eye_offset, eye_height, eye_width)
+            tongue_points = [(position[0] + size // 2, position[1] + size + eye_height),
+                             (position[0] + size // 2 - eye_width, position[1] + size),
+                             (position[0] + size // 2 + eye_width, position[1] + size)]
+        elif last_direction == (0, -1):  # Up
+            left_eye = pygame.Rect(position[0] + eye_height, position[1] + size - eye_offset - eye_width, eye_height, eye_width)
+            right_eye = pygame.Rect(position[0] + size - 2 * eye_height, position[1] + size - eye_offset - eye_width, eye_height, eye_width)
+            tongue_points = [(position[0] + size // 2, position[1] - eye_height),
+                             (position[0] + size // 2 - eye_width, position[1]),
+                             (position[0] + size // 2 + eye_width, position[1])]
+
+        pygame.draw.rect(sprite, color, left_eye)
+        pygame.draw.rect(sprite, color, right_eye)
+        if last_direction in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            pygame.draw.polygon(sprite, self.config.RED, tongue_points)
+        return sprite
 
     def draw_food(self, food):
         if not food:
@@ -133,15 +234,10 @@ class GameRenderer:
         )
 
     def draw(self, snake_data: List[Tuple[int, Deque[Tuple[int, int]], Tuple[int, int]]], food, paused=False):
-        self.draw_border()
+        if not self.border_cached:
+            self.draw_border()
         for snake_id, snake_body, snake_direction in snake_data:
-            if snake_id == 0:
-                color = self.config.GREEN_SNAKE
-            elif snake_id == 1:
-                color = (129, 0, 0)  # Dark Red
-            else:
-                color = (169, 169, 169)  # Grey
-            self.draw_snake(snake_body, snake_direction, color)
+            self.draw_snake(snake_body, snake_direction, self.get_color(snake_id))
         self.draw_food(food)
         if self.paused:
             self.draw_paused_overlay()
@@ -149,4 +245,191 @@ class GameRenderer:
     def update(self, snake_data: List[Tuple[int, Deque[Tuple[int, int]], Tuple[int, int]]], food, paused=False):
         self.update_screen_size()
         self.draw(snake_data, food, paused)
+        if self.game_logic is not None:
+            self.drawn = self.get_drawn_state()
+            self.dirty_cells.clear()
+
+    def track(self, game_logic) -> None:
+        """
+        Follow the changes of a game so update_dirty can redraw only the cells
+        that changed. Only the last TAPER_SEGMENTS segments of a snake shrink
+        while tracking, so a move changes a bounded number of cells.
+        """
+        if self.game_logic is not None:
+            self.game_logic.occupancy.listeners.remove(self)
+        self.game_logic = game_logic
+        self.taper_segments = self.TAPER_SEGMENTS
+        self.dirty_cells.clear()
+        self.drawn = None
+        game_logic.occupancy.listeners.append(self)
 
+    def invalidate(self) -> None:
+        """Make the next update_dirty ask for a full redraw."""
+        self.drawn = None
+
+    def cell_changed(self, index: int, owner: int) -> None:
+        """Mark a cell that became empty or occupied for redrawing."""
+        self.dirty_cells.add(index)
+
+    def get_drawn_state(self) -> DrawnState:
+        """Get the heads, tapered tails and food of the tracked game."""
+        logic = self.game_logic
+        occupancy = logic.occupancy
+        heads = {}
+        tails = {}
+        for key in logic.keys:
+            snake = logic.snakes[key]
+            direction = logic.get_controller(key).get_current_direction()
+            heads[key] = (occupancy.index(snake.get_head()), direction, snake.check_alive())
+            body = snake.get_body()
+            length = len(body)
+            first = max(1, length - self.taper_segments)
+            tails[key] = (first, [occupancy.index(body[i]) for i in range(first, length)])
+        food = logic.food.get_position()
+        layout = (self.cell_size, self.off_x, self.off_y, self.screen.get_size())
+        return DrawnState(layout, self.paused, heads, tails, occupancy.index(food) if food is not None else -1)
+
+    def reaches_border(self, cell: int, direction: Tuple[int, int]) -> bool:
+        """Check if a head's tongue reaches over the border of the board."""
+        return cell >= 0 and direction in ((1, 0), (-1, 0), (0, 1), (0, -1)) and self.get_tongue_cell(cell, direction) < 0
+
+    def get_tongue_cell(self, cell: int, direction: Tuple[int, int]) -> int:
+        """Get the cell a head's tongue reaches into, -1 if it is off the board."""
+        x = cell % self.WIDTH + direction[0]
+        y = cell // self.WIDTH + direction[1]
+        if x < 0 or x >= self.WIDTH or y < 0 or y >= self.HEIGHT:
+            return -1
+        return y * self.WIDTH + x
+
+    def update_dirty(self) -> Optional[List[pygame.Rect]]:
+        """
+        Redraw the cells of the tracked game that changed since the last frame:
+        cells a snake entered or left, old and new heads with the cells their
+        tongues reach, tapered tails and the food.
+
+        Returns:
+            Optional[List[pygame.Rect]]: The screen areas redrawn, or None if the
+                whole game has to be redrawn with update instead. That is the case
+                on the first frame, after a resize or a pause, when a snake dies or
+                is removed, and when a head's tongue reaches over the border.
+        """
+        self.update_screen_size()
+        last = self.drawn
+        if last is None:
+            return None
+        if self.paused != last.paused:
+            return None
+        if self.paused:
+            # the overlay stays as it is until the game is unpaused and redrawn
+            return []
+        state = self.get_drawn_state()
+        if (
+            state.layout != last.layout
+            or state.heads.keys() != last.heads.keys()
+            or any(alive != last.heads[key][2] for key, (_, _, alive) in state.heads.items())
+        ):
+            return None
+
+        cells = self.dirty_cells
+        tongues: Dict[int, List[int]] = {}
+        for key, head in state.heads.items():
+            cell, direction, _ = head
+            last_cell, last_direction, _ = last.heads[key]
+            if self.reaches_border(cell, direction) or self.reaches_border(last_cell, last_direction):
+                return None
+            tongue = self.get_tongue_cell(cell, direction) if cell >= 0 else -1
+            tongues.setdefault(tongue, []).append(key)
+            if head == last.heads[key] and state.tails[key] == last.tails[key]:
+                continue
+            cells.update((cell, tongue, last_cell))
+            if last_cell >= 0:
+                cells.add(self.get_tongue_cell(last_cell, last_direction))
+            cells.update(last.tails[key][1])
+            cells.update(state.tails[key][1])
+        if state.food != last.food:
+            cells.update((last.food, state.food))
+        cells.discard(-1)
+
+        rects = [self.redraw_cell(cell, state, tongues.get(cell, ())) for cell in cells]
+        self.drawn = state
+        cells.clear()
+        return rects
+
+    def redraw_cell(self, cell: int, state: DrawnState, tongue_keys: Sequence[int]) -> pygame.Rect:
+        """
+        Clear a cell and draw what is on it, along with the parts of neighbouring
+        heads' tongues that reach into it, in the order draw would.
+        """
+        x, y = cell % self.WIDTH, cell // self.WIDTH
+        rect = pygame.Rect(x * self.cell_size + self.off_x, y * self.cell_size + self.off_y, self.cell_size, self.cell_size)
+        self.screen.set_clip(rect)
+        self.screen.fill(self.config.BACKGROUND_GREEN, rect)
+        owner = self.game_logic.occupancy.owners[cell] - 1
+        for key in state.heads:
+            if key in tongue_keys:
+                head, direction, _ = state.heads[key]
+                self.draw_segment((head % self.WIDTH, head // self.WIDTH), self.cell_size, True, direction, self.get_color(key))
+            if key == owner:
+                self.draw_cell_segments(cell, state, key)
+        if cell == state.food:
+            self.draw_food((x, y))
+        self.screen.set_clip(None)
+        return rect
+
+    def draw_cell_segments(self, cell: int, state: DrawnState, key: int) -> None:
+        """Draw the segments of a snake that are on a cell."""
+        pos = (cell % self.WIDTH, cell // self.WIDTH)
+        head, direction, _ = state.heads[key]
+        first, tail = state.tails[key]
+        color = self.get_color(key)
+        if cell == head:
+            self.draw_segment(pos, self.cell_size, True, direction, color)
+        elif cell in tail:
+            # a growing tail stacks segments on one cell, draw them in order like draw_snake
+            length = first + len(tail)
+            for i, tail_cell in enumerate(tail):
+                if tail_cell == cell:
+                    self.draw_segment(pos, self.get_segment_size(first + i, length), False, direction, color)
+        else:
+            self.draw_segment(pos, self.cell_size, False, direction, color)
+
+    def update_low_res(self, game_logic) -> None:
+        """
+        Draw a game with one pixel per cell: the snake color of every cell is
+        looked up from the occupancy owners in one NumPy operation, written to
+        a board-sized surface and scaled up to the cell size in one blit. Only
+        heads and food are drawn in detail, so the cost does not grow with the
+        length of the snakes.
+        """
+        self.update_screen_size()
+        if not self.border_cached:
+            self.draw_border()
+        board_size = (self.WIDTH * self.cell_size, self.HEIGHT * self.cell_size)
+        if self.cells_surface is None or self.cells_surface.get_size() != (self.WIDTH, self.HEIGHT):
+            # owner 0 is an empty cell, owner n is snake n - 1
+            self.palette = np.array(
+                [self.config.BACKGROUND_GREEN] + [self.get_color(owner) for owner in range(255)], dtype=np.uint8
+            )
+            self.cell_colors = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+            self.cells_surface = pygame.Surface((self.WIDTH, self.HEIGHT))
+        if self.scaled_surface is None or self.scaled_surface.get_size() != board_size:
+            self.scaled_surface = pygame.Surface(board_size)
+
+        owners = np.frombuffer(game_logic.occupancy.owners, dtype=np.uint8).reshape(self.HEIGHT, self.WIDTH)
+        np.take(self.palette, owners, axis=0, out=self.cell_colors)
+        # surfarray indexes columns first
+        pygame.surfarray.blit_array(self.cells_surface, self.cell_colors.transpose(1, 0, 2))
+        pygame.transform.scale(self.cells_surface, board_size, self.scaled_surface)
+        self.screen.blit(self.scaled_surface, (self.off_x, self.off_y))
+
+        occupancy = game_logic.occupancy
+        for key in game_logic.keys:
+            head = occupancy.index(game_logic.snakes[key].get_head())
+            if head >= 0:
+                direction = game_logic.get_controller(key).get_current_direction()
+                self.draw_segment(
+                    (head % self.WIDTH, head // self.WIDTH), self.cell_size, True, direction, self.get_color(key)
+                )
+        self.draw_food(game_logic.get_food_position())
+        if self.paused:
+            self.draw_paused_overlay()
@@ -27,8 +27,21 @@ class GameUIManager(Renderer):
         self.speed_mult.update(self.center_w - self.config.std_width//2, self.screen_h - self.config.std_height)
 
     def draw(self):
-        self.screen.fill(self.config.BACKGROUND_GREEN)
-        self.draw_objects(self.buttons)
+        self.draw_static(self.screen)
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Draw the background and the buttons onto a surface."""
+        surface.fill(self.config.BACKGROUND_GREEN)
+        for button in self.buttons:
+            button.draw(surface)
+
+    def get_layer_key(self) -> tuple:
+        """Get a key that changes whenever a button is rendered again or moved."""
+        return tuple((button.surface, button.rect.topleft) for button in self.buttons)
+
+    def add_layers(self, compositor) -> None:
+        """Let a compositor cache the background and the buttons."""
+        compositor.add_layer(self.draw_static, self.get_layer_key)
 
 
         
@@ -0,0 +1,51 @@
+import pygame
+from config.config import GameConfig
+from interfaces.frame_metrics import FrameMetrics
+from ui.font_cache import FontCache
+
+
+class MetricsHud:
+    """Draws the frame metrics in the bottom left corner of the screen."""
+
+    # ms between refreshes of the text, rendering it every frame would skew the draw time
+    REFRESH_MS = 250
+    PADDING = 6
+
+    def __init__(self, screen: pygame.Surface, config: GameConfig) -> None:
+        self.screen = screen
+        self.config = config
+        self.panel = None
+        self.last_refresh = -self.REFRESH_MS
+
+    def format_lines(self, summary: dict) -> list:
+        """Format the metrics summary as text lines."""
+        phases = summary["phases_ms"]
+        return [
+            f"FPS {summary['fps']:.1f}",
+            f"frame p50 {summary['frame_p50_ms']:.1f} p95 {summary['frame_p95_ms']:.1f} "
+            f"p99 {summary['frame_p99_ms']:.1f} max {summary['frame_max_ms']:.1f} ms",
+            f"ticks/frame {summary['ticks_per_frame']:.2f} backlog {summary['backlog']:.2f} "
+            f"(max {summary['max_backlog']:.2f})",
+            "logic {logic:.2f} events {events:.2f} draw {draw:.2f} flip {flip:.2f} wait {wait:.2f} ms".format(**phases),
+        ]
+
+    def refresh(self, metrics: FrameMetrics) -> None:
+        """Render the text panel from the current metrics."""
+        font = FontCache.get_font(max(12, self.config.std_f_size // 3))
+        lines = [font.render(line, True, self.config.BACKGROUND_GREEN) for line in self.format_lines(metrics.get_summary())]
+        width = max(line.get_width() for line in lines) + 2 * self.PADDING
+        height = sum(line.get_height() for line in lines) + 2 * self.PADDING
+        self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.panel.fill((*self.config.GREEN_BLACK, 200))
+        y = self.PADDING
+        for line in lines:
+            self.panel.blit(line, (self.PADDING, y))
+            y += line.get_height()
+
+    def draw(self, metrics: FrameMetrics) -> None:
+        """Draw the panel, refreshing its text a few times per second."""
+        now = pygame.time.get_ticks()
+        if self.panel is None or now - self.last_refresh >= self.REFRESH_MS:
+            self.refresh(metrics)
+            self.last_refresh = now
+        self.screen.blit(self.panel, (0, self.screen.get_height() - self.panel.get_height()))
@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.batch_game_logic import BatchGameLogic
+from logic.controller.controller import Controller
+
+
+class TestBatchGameLogic(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = BatchGameLogic(4, 9, 9, snake_size=3, num_snakes=2, seed=0)
+
+    def check_consistency(self, batch):
+        """Check that the grid and free-cell set match the snake bodies."""
+        for board in range(batch.num_boards):
+            expected = np.zeros(batch.cells, dtype=np.int32)
+            for snake_id in range(batch.num_snakes):
+                for x, y in batch.get_snake_body(board, snake_id):
+                    expected[y * batch.width + x] += 1
+            np.testing.assert_array_equal(batch.grid[board], expected)
+            free = set(batch.free_list[board, :batch.free_count[board]].tolist())
+            self.assertEqual(free, set(np.flatnonzero(expected == 0).tolist()))
+
+    def test_initialization(self):
+        """Test if every board starts with stacked snakes and no food."""
+        self.assertEqual(self.batch.get_snake_body(0, 0), [(2, 0)] * 3)
+        self.assertTrue(self.batch.alive.all())
+        self.assertTrue((self.batch.food == -1).all())
+        self.check_consistency(self.batch)
+
+    def test_move_and_food_respawn(self):
+        """Test that snakes move forward and food spawns on a free cell."""
+        self.batch.step()
+        self.assertEqual(self.batch.get_snake_body(0, 0), [(2, 1), (2, 0), (2, 0)])
+        for board in range(self.batch.num_boards):
+            food = self.batch.food[board]
+            self.assertGreaterEqual(food, 0)
+            self.assertEqual(self.batch.grid[board, food], 0)
+        self.check_consistency(self.batch)
+
+    def test_eat_and_grow(self):
+        """Test that eating food grows the snake and increases the score."""
+        batch = BatchGameLogic(1, 9, 9, snake_size=2, num_snakes=1, seed=0)
+        batch.step()
+        batch.food[0] = 2 * 9 + 4  # directly below the head
+        batch.step()
+        self.assertEqual(batch.scores[0], 1)
+        self.assertEqual(batch.get_snake_body(0, 0), [(4, 2), (4, 1), (4, 1)])
+        self.check_consistency(batch)
+
+    def test_wall_collision_and_reset(self):
+        """Test that a snake leaving the board dies, retracts and resets the board."""
+        batch = BatchGameLogic(1, 5, 5, snake_size=2, num_snakes=1, seed=0)
+        up = Controller.DIRECTIONS.index((0, -1))
+        scores, dones = batch.step(np.array([[up]]))
+        self.assertTrue(dones[0])
+        self.assertTrue(batch.alive[0, 0])
+        self.assertEqual(batch.steps[0], 0)
+        self.check_consistency(batch)
+
+    def test_dead_snake_retracts(self):
+        """Test that a dead snake loses one segment per step until it disappears."""
+        up = Controller.DIRECTIONS.index((0, -1))
+        actions = self.batch.directions.copy()
+        actions[:, 0] = up
+        self.batch.step(actions)
+        self.assertFalse(self.batch.alive[:, 0].any())
+        self.assertEqual(len(self.batch.get_snake_body(0, 0)), 2)
+        self.batch.step()
+        self.batch.step()
+        self.assertFalse(self.batch.exists[:, 0].any())
+        self.check_consistency(self.batch)
+
+    def test_random_play_consistency(self):
+        """Test that random play keeps the grid and free-cell set in sync."""
+        batch = BatchGameLogic(16, 9, 9, snake_size=3, num_snakes=4, max_steps=50, seed=1)
+        rng = np.random.default_rng(2)
+        for _ in range(200):
+            batch.step(rng.integers(0, 4, size=(16, 4)))
+            self.check_consistency(batch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.game_loop import build_cases, run_case, load_settings
+from benchmarks.report import compare
+from benchmarks import game_objects
+
+
+class TestGameLoopBenchmark(unittest.TestCase):
+
+    def test_build_cases(self):
+        """Test that the sweep skips unrunnable modes and single snake mixes with several snakes."""
+        cases = build_cases(load_settings(), maps=["XS"], snakes=[1, 3])
+        ids = [case["id"] for case in cases]
+        self.assertIn("XS/1/hamiltonian/normal", ids)
+        self.assertNotIn("XS/3/hamiltonian/normal", ids)
+        self.assertFalse(any(case["mode"] == "survival" for case in cases))
+        mixed = next(case for case in cases if case["id"] == "XS/3/mixed/normal")
+        self.assertEqual(mixed["controllers"], ["Greedy", "BFS", "SafeGreedy"])
+
+    def test_run_and_compare(self):
+        """Test that a case reports its metrics and slowdowns are flagged."""
+        case = build_cases(load_settings(), maps=["XS"], snakes=[2], mixes=["greedy"])[0]
+        result = run_case(case, ticks=20, warmup=2)
+        for key in ("ticks_per_sec", "p50_us", "p99_us", "alloc_peak_bytes_per_tick", "net_blocks_per_tick"):
+            self.assertIn(key, result)
+        baseline = {case["id"]: dict(result, ticks_per_sec=result["ticks_per_sec"] * 2)}
+        regressions = compare({case["id"]: result}, baseline, metrics=("ticks_per_sec",), higher_is_better=("ticks_per_sec",))
+        self.assertEqual([regression["metric"] for regression in regressions], ["ticks_per_sec"])
+        self.assertEqual(compare({case["id"]: result}, {case["id"]: result}), [])
+
+
+class TestGameObjectsBenchmark(unittest.TestCase):
+
+    def test_run_all(self):
+        """Test that every benchmark and footprint runs on a small board."""
+        results = game_objects.run_all(size=8, repeat=1)
+        self.assertEqual(
+            len(results), len(game_objects.BENCHMARKS) + len(game_objects.FOOTPRINTS)
+        )
+        self.assertGreater(results["snake/move/compact"]["ns_per_op"], 0)
+        self.assertGreater(results["compact_hash_queue/footprint"]["bytes_per_element"], 0)
+
+    def test_cells_match_board_size(self):
+        """Test that the queue benchmarks use every cell of the board they are run on."""
+        cells = game_objects.tuple_cells(8)
+        self.assertEqual(len(cells), 64)
+        self.assertEqual(set(cells), {(x, y) for x in range(8) for y in range(8)})
+        self.assertEqual(list(game_objects.index_cells(8)), list(range(64)))
+
+    def test_compare_tolerance(self):
+        """Test that only increases past the tolerance count as regressions."""
+        baseline = {"food/cycle": {"ns_per_op": 100.0}}
+        self.assertEqual(compare({"food/cycle": {"ns_per_op": 115.0}}, baseline, tolerance=0.2), [])
+        regressions = compare({"food/cycle": {"ns_per_op": 130.0}}, baseline, tolerance=0.2)
+        self.assertEqual([regression["id"] for regression in regressions], ["food/cycle"])
+
+    def test_compare_refuses_other_parameters(self):
+        """Test that results are not compared to a baseline measured with other parameters."""
+        baseline = {"food/cycle": {"ns_per_op": 100.0}}
+        with self.assertRaises(ValueError):
+            compare(baseline, baseline, params={"size": 20}, baseline_params={"size": 50})
+        with self.assertRaises(ValueError):
+            compare(baseline, baseline, params={"size": 20}, baseline_params=None)
+        self.assertEqual(compare(baseline, baseline, params={"size": 50}, baseline_params={"size": 50}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.cell_codec import CellCodec
+from logic.game_logic import GameLogic
+
+
+class TestCellCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CellCodec(4, 3)
+
+    def test_encode_decode(self):
+        """Test converting between positions and cell indices."""
+        self.assertEqual(self.codec.encode((1, 2)), 9)
+        self.assertEqual(self.codec.decode(9), (1, 2))
+        self.assertEqual(self.codec.encode((4, 0)), CellCodec.OUT)
+        self.assertIsNone(self.codec.decode(CellCodec.OUT))
+        self.assertEqual(self.codec.decode_all([0, 11]), [(0, 0), (3, 2)])
+
+    def test_decode_is_cached(self):
+        """Test that decoding returns the same tuple object every time."""
+        self.assertIs(self.codec.decode(5), self.codec.decode(5))
+
+    def test_step(self):
+        """Test moving between neighbouring cells."""
+        self.assertEqual(self.codec.step(5, (1, 0)), 6)
+        self.assertEqual(self.codec.step(5, (0, 1)), 9)
+        self.assertEqual(self.codec.step(3, (1, 0)), CellCodec.OUT)
+        self.assertEqual(self.codec.step(1, (0, -1)), CellCodec.OUT)
+        self.assertFalse(self.codec.in_bounds(self.codec.step(8, (-1, 0))))
+
+    def test_game_logic_modes_match(self):
+        """Test that cell index mode plays exactly the same game as tuple mode."""
+        tuples = GameLogic(12, 12, ["Greedy"] * 4, 3, 4, "normal", seed=7)
+        cells = GameLogic(12, 12, ["Greedy"] * 4, 3, 4, "normal", cell_index=True, seed=7)
+        for _ in range(300):
+            tuples.update()
+            cells.update()
+            self.assertEqual(tuples.keys, cells.keys)
+            self.assertEqual(tuples.get_food_position(), cells.get_food_position())
+            for key in tuples.keys:
+                self.assertEqual(list(tuples.get_snake_body(key)), cells.get_snake_body(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
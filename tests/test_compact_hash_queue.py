@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.compact_hash_queue import CompactHashQueue
+
+
+class TestCompactHashQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.hash_queue = CompactHashQueue(16, 4)
+
+    def test_initialization(self):
+        """Test if the CompactHashQueue is initialized correctly."""
+        self.assertEqual(len(self.hash_queue.get_data()), 0)
+        self.assertEqual(self.hash_queue.get_length(), 0)
+        self.assertIsNone(self.hash_queue.peak_front())
+        self.assertIsNone(self.hash_queue.pop_back())
+
+    def test_add_and_pop(self):
+        """Test adding and removing elements at both ends."""
+        self.hash_queue.add_front(1)
+        self.hash_queue.add_back(2)
+        self.hash_queue.add_front(3)
+        self.assertEqual(list(self.hash_queue.get_data()), [3, 1, 2])
+        self.assertEqual(self.hash_queue.peak_front(), 3)
+        self.assertEqual(self.hash_queue.peak_back(), 2)
+        self.assertEqual(self.hash_queue.pop_back(), 2)
+        self.assertEqual(self.hash_queue.pop_front(), 3)
+        self.assertEqual(list(self.hash_queue.get_data()), [1])
+
+    def test_counts(self):
+        """Test has_one and has_multi with repeated elements."""
+        self.hash_queue.add_back(5)
+        self.hash_queue.add_back(5)
+        self.assertTrue(self.hash_queue.has_multi(5))
+        self.hash_queue.pop_back()
+        self.assertFalse(self.hash_queue.has_multi(5))
+        self.assertTrue(self.hash_queue.has_one(5))
+        self.hash_queue.pop_back()
+        self.assertFalse(self.hash_queue.has_one(5))
+
+    def test_out_of_bounds_sentinel(self):
+        """Test that -1 is counted separately from the last cell."""
+        self.hash_queue.add_front(-1)
+        self.assertTrue(self.hash_queue.has_one(-1))
+        self.assertFalse(self.hash_queue.has_one(15))
+        self.assertEqual(self.hash_queue.pop_front(), -1)
+
+    def test_wrap_and_expand(self):
+        """Test that the ring buffer wraps around and grows when full."""
+        for i in range(3):
+            self.hash_queue.add_back(i)
+        self.hash_queue.pop_front()
+        self.hash_queue.add_back(3)
+        self.hash_queue.add_back(4)
+        self.assertEqual(len(self.hash_queue.get_segments()), 2)
+        self.hash_queue.add_front(9)
+        self.hash_queue.add_back(10)
+        self.assertEqual(self.hash_queue.capacity, 8)
+        self.assertEqual(list(self.hash_queue.get_data()), [9, 1, 2, 3, 4, 10])
+
+    def test_view(self):
+        """Test that the view is live and indexable without copying."""
+        view = self.hash_queue.get_data()
+        self.hash_queue.add_back(7)
+        self.hash_queue.add_front(8)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view[0], 8)
+        self.assertEqual(view[-1], 7)
+        self.assertIn(7, view)
+        self.assertNotIn(6, view)
+        segments = self.hash_queue.get_segments()
+        self.assertEqual([x for segment in segments for x in segment], [8, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
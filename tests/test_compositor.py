@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from rendering.compositor import Compositor
+
+
+class TestCompositor(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = pygame.Surface((40, 30))
+        self.compositor = Compositor(self.screen)
+        self.color = (10, 20, 30)
+        self.box = pygame.Rect(5, 5, 10, 10)
+        self.compositor.add_layer(lambda surface: surface.fill(self.color), lambda: self.color)
+        self.compositor.add_layer(lambda surface: surface.fill((200, 0, 0), self.box), lambda: tuple(self.box))
+
+    def test_layers_drawn_in_order(self):
+        """Test that later layers are drawn over earlier ones."""
+        self.compositor.draw()
+        self.assertEqual(self.screen.get_at((0, 0))[:3], self.color)
+        self.assertEqual(self.screen.get_at((6, 6))[:3], (200, 0, 0))
+
+    def test_rebuilt_only_when_a_key_changes(self):
+        """Test that the cached layers are reused until a layer's key changes."""
+        for _ in range(3):
+            self.compositor.draw()
+        self.assertEqual(self.compositor.rebuilds, 1)
+        self.assertFalse(self.compositor.is_stale())
+
+        self.box.x = 20
+        self.assertTrue(self.compositor.is_stale())
+        self.compositor.draw()
+        self.assertEqual(self.compositor.rebuilds, 2)
+        self.assertEqual(self.screen.get_at((6, 6))[:3], self.color)
+        self.assertEqual(self.screen.get_at((21, 6))[:3], (200, 0, 0))
+
+    def test_screen_drawn_over_is_restored(self):
+        """Test that each draw starts the frame from the cached layers."""
+        self.compositor.draw()
+        self.screen.fill((0, 0, 0))
+        self.compositor.draw()
+        self.assertEqual(self.screen.get_at((0, 0))[:3], self.color)
+        self.assertEqual(self.compositor.rebuilds, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
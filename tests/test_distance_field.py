@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.distance_field import DistanceField
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_logic import GameLogic
+
+
+class TestDistanceField(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = OccupancyGrid(5, 5)
+        self.field = DistanceField(self.grid)
+
+    def test_open_board(self):
+        """Test that distances on an empty board are Manhattan distances."""
+        self.field.update(0, (2, 2))
+        self.assertEqual(self.field.get_distance((2, 2)), 0)
+        self.assertEqual(self.field.get_distance((0, 0)), 4)
+        self.assertEqual(self.field.get_distance((-1, 0)), DistanceField.UNREACHABLE)
+
+    def test_walls_and_unreachable(self):
+        """Test that occupied cells are routed around and enclosed cells are unreachable."""
+        for y in range(4):
+            self.grid.add((1, y), 0)
+        self.field.update(0, (0, 0))
+        self.assertEqual(self.field.get_distance((2, 0)), 10)
+        self.assertEqual(self.field.get_distance((1, 0)), DistanceField.UNREACHABLE)
+        self.grid.add((0, 4), 0)
+        self.field.update(1, (0, 0))
+        self.assertEqual(self.field.get_distance((2, 0)), DistanceField.UNREACHABLE)
+
+    def test_cached_per_tick(self):
+        """Test that the field is only rebuilt when the tick or the food changes."""
+        self.field.update(0, (2, 2))
+        expanded = self.field.nodes_expanded
+        self.field.update(0, (2, 2))
+        self.assertEqual(self.field.nodes_expanded, expanded)
+        self.field.update(0, (0, 0))
+        self.assertEqual(self.field.nodes_expanded, 2 * expanded)
+
+    def test_bfs_controllers_share_one_search(self):
+        """Test that all BFS snakes read a single search per tick."""
+        for cell_index in (False, True):
+            logic = GameLogic(12, 12, ["BFS"] * 4, 3, 4, "normal", cell_index=cell_index, seed=3)
+            for _ in range(50):
+                logic.update()
+            self.assertLessEqual(logic.distance_field.nodes_expanded, 50 * 2 * 144)
+            self.assertGreater(sum(snake.get_size() for snake in logic.snakes.values()), 4 * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
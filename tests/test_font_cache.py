@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from ui.font_cache import FontCache
+
+
+class TestFontCache(unittest.TestCase):
+
+    def setUp(self):
+        pygame.font.init()
+        FontCache.clear()
+
+    def tearDown(self):
+        FontCache.clear()
+
+    def test_fonts_shared_by_size(self):
+        """Test that a font is loaded once per size."""
+        self.assertIs(FontCache.get_font(20), FontCache.get_font(20))
+        self.assertIsNot(FontCache.get_font(20), FontCache.get_font(30))
+
+    def test_text_cached_by_text_size_and_color(self):
+        """Test that text surfaces are reused only for the same text, size and color."""
+        surface = FontCache.render("Back", 20, (1, 2, 3))
+        self.assertIs(FontCache.render("Back", 20, [1, 2, 3]), surface)
+        self.assertIsNot(FontCache.render("Back", 20, (3, 2, 1)), surface)
+        self.assertIsNot(FontCache.render("Back", 24, (1, 2, 3)), surface)
+        self.assertIsNot(FontCache.render("Play", 20, (1, 2, 3)), surface)
+
+    def test_least_recently_used_evicted(self):
+        """Test that the least recently used text is dropped once the cache is full."""
+        old_size = FontCache.MAX_TEXT_SURFACES
+        FontCache.MAX_TEXT_SURFACES = 2
+        try:
+            first = FontCache.render("a", 20, (0, 0, 0))
+            second = FontCache.render("b", 20, (0, 0, 0))
+            FontCache.render("a", 20, (0, 0, 0))
+            FontCache.render("c", 20, (0, 0, 0))
+            self.assertIs(FontCache.render("a", 20, (0, 0, 0)), first)
+            self.assertIsNot(FontCache.render("b", 20, (0, 0, 0)), second)
+        finally:
+            FontCache.MAX_TEXT_SURFACES = old_size
+
+
+if __name__ == "__main__":
+    unittest.main()
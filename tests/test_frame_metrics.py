@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from interfaces.frame_metrics import FrameMetrics
+
+
+class TestFrameMetrics(unittest.TestCase):
+
+    def record(self, metrics, frames):
+        """Record frames of (frame ms, ticks, backlog, draw ms) against a fake clock."""
+        clock = [1]
+        with patch("interfaces.frame_metrics.perf_counter_ns", lambda: clock[0]):
+            for frame_ms, ticks, backlog, draw_ms in frames:
+                metrics.begin_frame()
+                metrics.set_logic(ticks, backlog)
+                metrics.add_phase("draw", int(draw_ms * 1e6))
+                clock[0] += int(frame_ms * 1e6)
+        metrics.end_frame(clock[0])
+
+    def test_empty(self):
+        """Test the summary before any frame."""
+        self.assertEqual(FrameMetrics().get_summary()["fps"], 0.0)
+
+    def test_summary(self):
+        """Test fps, percentiles, ticks, backlog and phase means."""
+        metrics = FrameMetrics(window=10)
+        self.record(metrics, [(10, 1, 0.5, 2)] * 9 + [(100, 4, 2.0, 20)])
+        summary = metrics.get_summary()
+        self.assertAlmostEqual(summary["fps"], 1000 * 10 / 190)
+        self.assertAlmostEqual(summary["frame_p50_ms"], 10)
+        self.assertAlmostEqual(summary["frame_max_ms"], 100)
+        self.assertAlmostEqual(summary["ticks_per_frame"], 1.3)
+        self.assertEqual(summary["backlog"], 2.0)
+        self.assertAlmostEqual(summary["phases_ms"]["draw"], 3.8)
+
+    def test_window_wraps(self):
+        """Test that only the most recent frames are kept."""
+        metrics = FrameMetrics(window=4)
+        self.record(metrics, [(100, 0, 0, 5)] * 4 + [(10, 2, 0.25, 1)] * 4)
+        summary = metrics.get_summary()
+        self.assertAlmostEqual(summary["frame_max_ms"], 10)
+        self.assertEqual(summary["ticks_per_frame"], 2)
+        self.assertEqual(summary["max_backlog"], 0.25)
+        self.assertAlmostEqual(summary["phases_ms"]["draw"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
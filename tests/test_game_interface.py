@@ -0,0 +1,131 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from interfaces.game_interface import GameInterface
+from config.config import GameConfig
+from interfaces.play_game import PlayGame
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def new_play_game(controllers, turbo=False):
+    """Start a game on a small board with the given controllers, the config loaded from the repo root."""
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        pygame.init()
+        screen = pygame.display.set_mode((640, 360))
+        config = GameConfig(640, 360)
+    finally:
+        os.chdir(cwd)
+    config.p1, config.p2 = controllers[:2]
+    config.n_snakes = len(controllers)
+    config.game_mode = "normal"
+    config.number_of_cells = 9
+    config.calculate_grid_dimensions()
+    config.TURBO = turbo
+    config.TURBO_TICK_RATE = 0
+    return PlayGame(screen, config)
+
+
+class LogicGame(GameInterface):
+    """Runs a game logic with a fixed time between frames."""
+
+    def __init__(self, logic, delta_time, game_speed=10, tick_rate=0, budget_ms=1000):
+        config = SimpleNamespace(game_speed=game_speed, TURBO_TICK_RATE=tick_rate, TURBO_FRAME_BUDGET_MS=budget_ms)
+        super().__init__(pygame.Surface((10, 10)), config)
+        self.logic = logic
+        self.delta_time = delta_time
+
+    def tick_clock(self):
+        return self.delta_time
+
+    def update_game_logic(self):
+        return self.logic.update()
+
+    def handle_events(self):
+        pass
+
+    def draw(self):
+        pass
+
+
+class CountingLogic:
+    """Counts ticks and ends the game after a number of them."""
+
+    def __init__(self, ticks=10 ** 9):
+        self.ticks = 0
+        self.max_ticks = ticks
+
+    def update(self):
+        self.ticks += 1
+        return self.ticks < self.max_ticks
+
+
+class TestGameInterface(unittest.TestCase):
+
+    def test_backlog_capped(self):
+        """Test that a long frame only owes the logic the capped backlog instead of every missed tick."""
+        game = LogicGame(CountingLogic(), delta_time=5000)
+        game.handle_logic()
+        self.assertEqual(game.logic.ticks, 2)
+        self.assertEqual(game.time_accumulator, 50)
+
+    def test_turbo_unthrottled(self):
+        """Test that an unthrottled batch stops at the frame budget, or when the game ends."""
+        game = LogicGame(CountingLogic(), delta_time=16, budget_ms=0)
+        game.set_turbo(True)
+        game.handle_logic()
+        self.assertEqual(game.logic.ticks, 1)
+
+        game = LogicGame(CountingLogic(500), delta_time=16)
+        game.set_turbo(True)
+        game.handle_logic()
+        self.assertEqual(game.logic.ticks, 500)
+        self.assertFalse(game.running)
+
+    def test_turbo_tick_rate(self):
+        """Test that a target tick rate runs the ticks owed and drops those the budget cannot fit."""
+        game = LogicGame(CountingLogic(), delta_time=16, tick_rate=1000)
+        game.set_turbo(True)
+        game.handle_logic()
+        self.assertEqual(game.logic.ticks, 16)
+        self.assertEqual(game.time_accumulator, 0)
+
+        game.config.TURBO_FRAME_BUDGET_MS = 0
+        game.handle_logic()
+        self.assertEqual(game.logic.ticks, 17)
+        self.assertEqual(game.time_accumulator, 0)
+
+    def test_turbo_match_finishes(self):
+        """Test that an AI only match ends once every snake is gone."""
+        game = new_play_game(["Greedy"] * 4, turbo=True)
+        self.assertTrue(game.turbo)
+        for _ in range(100):
+            game.handle_logic()
+            if not game.running:
+                break
+        self.assertFalse(game.running)
+        self.assertFalse(game.logic.keys)
+
+    def test_human_game_waits_for_back(self):
+        """Test that a game with a human player keeps going once every snake is gone, and cannot turbo while one lives."""
+        game = new_play_game(["Human", "Greedy"], turbo=True)
+        self.assertFalse(game.turbo)
+        for key in list(game.logic.keys):
+            game.logic.remove_key(key)
+        self.assertTrue(game.update_game_logic())
+        game.set_turbo(True)
+        self.assertTrue(game.turbo)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from logic.game_logic_human import GameLogicHuman
+from rendering.game_renderer import GameRenderer
+
+
+class TestDirtyRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.config = SimpleNamespace(
+            BORDER_COLOR=(24, 30, 40), BACKGROUND_GREEN=(136, 175, 146), SNAKE_TRANS=200, RED=(191, 47, 55),
+            FOOD_COLOR=(191, 47, 55), GREEN_SNAKE=(8, 71, 57), gbt=4, gbos=1, gw=360, gh=360,
+            cell_size=30, game_width=12, game_height=12,
+        )
+
+    def draw_full(self, renderer, logic):
+        renderer.screen.fill(self.config.BACKGROUND_GREEN)
+        renderer.update(logic.get_all_snakes_body_and_direction(), logic.get_food_position())
+
+    def test_matches_full_redraw(self):
+        """Test that redrawing the changed cells gives the same picture as redrawing everything."""
+        logic = GameLogicHuman(12, 12, ["Greedy"] * 3, 3, 3, "normal", cell_index=True, compact_body=True, seed=5)
+        full = GameRenderer(pygame.Surface((400, 400)), self.config)
+        dirty = GameRenderer(pygame.Surface((400, 400)), self.config)
+        # the reference tracks too so both taper only the tail, but always redraws everything
+        full.track(logic)
+        dirty.track(logic)
+        partial_frames = 0
+        for _ in range(150):
+            logic.update()
+            self.draw_full(full, logic)
+            rects = dirty.update_dirty()
+            if rects is None:
+                self.draw_full(dirty, logic)
+            else:
+                partial_frames += 1
+                self.assertLess(len(rects), 40)
+            self.assertEqual(
+                pygame.image.tobytes(full.screen, "RGB"), pygame.image.tobytes(dirty.screen, "RGB"),
+                f"frames differ at step {logic.step_count}"
+            )
+        self.assertGreater(partial_frames, 100)
+
+    def test_first_frame_and_pause_redraw_everything(self):
+        """Test that a full redraw is asked for before anything was drawn and after a pause."""
+        logic = GameLogicHuman(12, 12, ["Greedy"], 3, 1, "normal", cell_index=True, compact_body=True, seed=1)
+        renderer = GameRenderer(pygame.Surface((400, 400)), self.config)
+        renderer.track(logic)
+        self.assertIsNone(renderer.update_dirty())
+        self.draw_full(renderer, logic)
+        logic.update()
+        self.assertIsNotNone(renderer.update_dirty())
+        renderer.paused = True
+        self.assertIsNone(renderer.update_dirty())
+        self.draw_full(renderer, logic)
+        logic.update()
+        self.assertEqual(renderer.update_dirty(), [])
+        renderer.paused = False
+        self.assertIsNone(renderer.update_dirty())
+
+
+class TestSpriteCache(unittest.TestCase):
+
+    def setUp(self):
+        TestDirtyRendering.setUp(self)
+
+    def test_sprites_reused_and_cleared_on_resize(self):
+        """Test that segments are rendered once per look and rendered again for a new cell size."""
+        logic = GameLogicHuman(12, 12, ["Greedy"] * 2, 3, 2, "normal", cell_index=True, compact_body=True, seed=2)
+        renderer = GameRenderer(pygame.Surface((400, 400)), self.config)
+        snake_data = logic.get_all_snakes_body_and_direction()
+        renderer.update(snake_data, logic.get_food_position())
+        sprites = dict(renderer.sprites)
+        self.assertTrue(sprites)
+        renderer.update(snake_data, logic.get_food_position())
+        self.assertEqual(renderer.sprites.keys(), sprites.keys())
+        self.assertTrue(all(renderer.sprites[key] is sprite for key, sprite in sprites.items()))
+
+        self.config.cell_size = 20
+        renderer.update(snake_data, logic.get_food_position())
+        self.assertTrue(renderer.sprites)
+        self.assertTrue(all(key[0] == 20 for key in renderer.sprites))
+
+
+class TestLowResRendering(unittest.TestCase):
+
+    def setUp(self):
+        TestDirtyRendering.setUp(self)
+
+    def test_cells_colored_from_owners(self):
+        """Test that body cells get their snake's color, empty cells the background and heads the detailed sprite."""
+        logic = GameLogicHuman(12, 12, ["Greedy"] * 2, 4, 2, "normal", cell_index=True, compact_body=True, seed=3)
+        for _ in range(5):
+            logic.update()
+        renderer = GameRenderer(pygame.Surface((400, 400)), self.config)
+        renderer.screen.fill((0, 0, 0))
+        renderer.update_low_res(logic)
+
+        def center(pos):
+            size = renderer.cell_size
+            return renderer.screen.get_at((pos[0] * size + renderer.off_x + size // 2, pos[1] * size + renderer.off_y + size // 2))[:3]
+
+        for key in logic.keys:
+            body = list(logic.get_snake_body(key))
+            for pos in body[1:]:
+                if pos != body[0]:
+                    self.assertEqual(center(pos), renderer.get_color(key))
+            self.assertEqual(center(body[0]), self.config.BORDER_COLOR)
+        occupied = {pos for key in logic.keys for pos in logic.get_snake_body(key)}
+        empty = next((x, y) for y in range(12) for x in range(12)
+                     if (x, y) not in occupied and (x, y) != logic.get_food_position())
+        self.assertEqual(center(empty), self.config.BACKGROUND_GREEN)
+        self.assertEqual(center(logic.get_food_position()), self.config.FOOD_COLOR)
+
+
+if __name__ == "__main__":
+    unittest.main()
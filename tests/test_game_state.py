@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+import sys
+import os
+from array import array
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_state import GameState
+
+
+class TestGameState(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState(5, 4)
+        self.body = [(2, 1), (1, 1), (1, 0)]
+        self.cells = array("i", [y * 5 + x for x, y in self.body])
+
+    def test_vector_state_matches_assembled_state(self):
+        """Test that the fixed-size vector holds the assembled state with the body padded."""
+        out = np.full(self.state.get_vector_size(6), 9, dtype=np.float32)
+        self.state.write_vector_state(out, [memoryview(self.cells)], (3, 2), (0, 1), (0, -1))
+        expected = self.state.assemble_game_state(self.body, (3, 2), (0, 1), (0, -1))
+        self.assertEqual(out[0], 3)
+        np.testing.assert_array_equal(out[1:7], expected[:6])
+        np.testing.assert_array_equal(out[7:13], 0)
+        np.testing.assert_array_equal(out[13:], expected[6:])
+
+    def test_vector_state_split_and_truncated(self):
+        """Test a body split over two segments and cut off at the maximum length."""
+        out = np.zeros(self.state.get_vector_size(2), dtype=np.float32)
+        view = memoryview(self.cells)
+        self.state.write_vector_state(out, [view[:1], view[1:]], None, (0, 1), (0, -1))
+        self.assertEqual(out[0], 2)
+        np.testing.assert_array_equal(out[1:5], [2, 1, 1, 1])
+        np.testing.assert_array_equal(out[5:7], [-1, -1])
+
+    def test_grid_state(self):
+        """Test the channels of the grid state."""
+        owners = bytearray(20)
+        for cell in self.cells:
+            owners[cell] = 1
+        owners[19] = 2
+        out = np.full(self.state.get_grid_shape(), 7, dtype=np.float32)
+        self.state.write_grid_state(out, owners, 0, [(2, 1), (4, 3)], (0, 3))
+        self.assertEqual(out[0].sum(), 3)
+        self.assertEqual(out[0, 1, 2], 1)
+        self.assertEqual(out[1].sum(), 1)
+        self.assertEqual(out[1, 3, 4], 1)
+        self.assertEqual(out[2].sum(), 2)
+        self.assertEqual(out[3, 3, 0], 1)
+        self.assertEqual(out[3].sum(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
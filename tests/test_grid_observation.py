@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.grid_observation import GridObservation
+from logic.game_logic import GameLogic
+from logic.game_logic_human import GameLogicHuman
+from logic.game_state import GameState
+
+
+class TestGridObservation(unittest.TestCase):
+
+    def expected_grid(self, logic, snake_id):
+        state = GameState(logic.width, logic.height)
+        out = np.zeros(state.get_grid_shape(), dtype=np.float32)
+        heads = [logic.get_snake_head(key) for key in logic.keys]
+        heads = [head for head in heads if head is not None]
+        return state.write_grid_state(out, logic.occupancy.owners, snake_id, heads, logic.get_food_position())
+
+    def test_matches_full_rebuild(self):
+        """Test that the incremental grid matches a full rebuild on every tick."""
+        for logic_class in (GameLogic, GameLogicHuman):
+            for cell_index in (False, True):
+                logic = logic_class(10, 10, ["Greedy"] * 4, 3, 4, "normal", cell_index=cell_index, seed=6)
+                observation = GridObservation(logic, 1)
+                for _ in range(150):
+                    logic.update()
+                    np.testing.assert_array_equal(observation.update(), self.expected_grid(logic, 1))
+
+    def test_shared_buffer_and_close(self):
+        """Test that the grid can live in a caller's buffer and stops following the board when closed."""
+        logic = GameLogic(6, 6, ["Greedy"], 3, 1, "normal", seed=1)
+        out = np.zeros((2, 4, 6, 6), dtype=np.float32)
+        observation = GridObservation(logic, 0, out[1])
+        logic.update()
+        observation.update()
+        self.assertEqual(out[1, 0].sum(), 2)
+        observation.close()
+        self.assertNotIn(observation, logic.occupancy.listeners)
+
+
+if __name__ == "__main__":
+    unittest.main()
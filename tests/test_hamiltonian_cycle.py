@@ -0,0 +1,77 @@
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.hamiltonian_cycle import HamiltonianCycle
+from logic.game_logic import GameLogic
+
+
+class TestHamiltonianCycle(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.old_cache_dir = HamiltonianCycle.CACHE_DIR
+        HamiltonianCycle.CACHE_DIR = self.cache_dir.name
+        HamiltonianCycle._cache.clear()
+
+    def tearDown(self):
+        HamiltonianCycle.CACHE_DIR = self.old_cache_dir
+        HamiltonianCycle._cache.clear()
+        self.cache_dir.cleanup()
+
+    def test_build_visits_every_cell(self):
+        """Test that cycles are closed, step between neighbours and skip at most one cell."""
+        for width in range(2, 8):
+            for height in range(2, 8):
+                order = HamiltonianCycle.build(width, height)
+                self.assertEqual(len(set(order)), width * height - (width * height) % 2)
+                for a, b in zip(order, order[1:] + order[:1]):
+                    self.assertEqual(abs(a % width - b % width) + abs(a // width - b // width), 1)
+
+    def test_disk_cache(self):
+        """Test that a cycle is written once and read back unchanged."""
+        HamiltonianCycle.precompute([(9, 9)])
+        path = HamiltonianCycle.cache_path(9, 9)
+        self.assertEqual(os.path.getsize(path), 80 * 2)
+        cycle = HamiltonianCycle.load(9, 9)
+        self.assertEqual(list(cycle.order), HamiltonianCycle.build(9, 9))
+        self.assertIs(HamiltonianCycle.load(9, 9), cycle)
+
+    def test_damaged_cache_is_rebuilt(self):
+        """Test that a cache file of the wrong size is ignored."""
+        os.makedirs(HamiltonianCycle.CACHE_DIR, exist_ok=True)
+        with open(HamiltonianCycle.cache_path(4, 4), "wb") as file:
+            file.write(b"\x00\x01\x02")
+        self.assertEqual(list(HamiltonianCycle.load(4, 4).order), HamiltonianCycle.build(4, 4))
+
+    def test_controller_survives(self):
+        """Test that a lone Hamiltonian snake only stops once it fills the board."""
+        for cell_index in (False, True):
+            logic = GameLogic(10, 9, ["Hamiltonian"], 3, 1, "normal", cell_index=cell_index, seed=4)
+            snake = logic.snakes[0]
+            for _ in range(3000):
+                logic.update()
+                if not snake.check_alive():
+                    break
+            self.assertEqual(snake.get_size(), 10 * 9)
+
+    def test_controller_fills_odd_boards(self):
+        """Test that a lone Hamiltonian snake also eats the cell left out of the cycle of an odd board."""
+        for width, height in ((9, 9), (7, 11), (5, 5)):
+            for seed in range(12):
+                logic = GameLogic(width, height, ["Hamiltonian"], 3, 1, "normal", cell_index=seed % 2 == 0, seed=seed)
+                snake = logic.snakes[0]
+                for _ in range(3000):
+                    logic.update()
+                    if not snake.check_alive():
+                        break
+                self.assertFalse(snake.check_alive())
+                # running into the full board drops the head
+                self.assertGreaterEqual(snake.get_size(), width * height - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
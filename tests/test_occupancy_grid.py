@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_objects.spawn_generator import SpawnGenerator
+
+
+class TestOccupancyGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.spawn_generator = SpawnGenerator(4, 3)
+        self.grid = OccupancyGrid(4, 3, self.spawn_generator)
+
+    def test_initialization(self):
+        """Test if the grid starts empty."""
+        self.assertFalse(self.grid.is_occupied((0, 0)))
+        self.assertTrue(self.grid.is_free((3, 2)))
+        self.assertIsNone(self.grid.get_owner((1, 1)))
+
+    def test_add_remove(self):
+        """Test counting segments and owners on a cell."""
+        self.grid.add((1, 2), 3)
+        self.grid.add((1, 2), 3)
+        self.assertEqual(self.grid.get_count((1, 2)), 2)
+        self.assertEqual(self.grid.get_owner((1, 2)), 3)
+        self.grid.remove((1, 2))
+        self.assertTrue(self.grid.is_occupied((1, 2)))
+        self.grid.remove((1, 2))
+        self.assertFalse(self.grid.is_occupied((1, 2)))
+        self.assertIsNone(self.grid.get_owner((1, 2)))
+
+    def test_first_owner_kept(self):
+        """Test that an overlapping segment does not take over the cell."""
+        self.grid.add((2, 1), 0)
+        self.grid.add((2, 1), 1)
+        self.grid.remove((2, 1))
+        self.assertEqual(self.grid.get_owner((2, 1)), 0)
+
+    def test_out_of_bounds(self):
+        """Test that positions outside the board are ignored."""
+        self.grid.add((-1, 0), 0)
+        self.grid.add((4, 0), 0)
+        self.assertEqual(self.grid.get_count((-1, 0)), 0)
+        self.assertFalse(self.grid.is_free((0, 3)))
+        self.grid.remove((0, -1))
+
+    def test_spawn_generator_sync(self):
+        """Test that occupied cells leave the free-cell set and return when vacated."""
+        self.grid.add((0, 0), 0)
+        self.assertNotIn((0, 0), self.spawn_generator.map)
+        self.assertEqual(len(self.spawn_generator.list), 11)
+        self.grid.remove((0, 0))
+        self.assertIn((0, 0), self.spawn_generator.map)
+        self.assertEqual(len(self.spawn_generator.list), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.ray_features import RayFeatures
+from logic.game_logic import GameLogic
+
+
+class TestRayFeatures(unittest.TestCase):
+
+    def naive_features(self, logic, key, directions):
+        """Walk every ray cell by cell."""
+        x, y = logic.get_snake_head(key)
+        food = logic.get_food_position()
+        wall, body, found = [], [], []
+        for dx, dy in directions:
+            step, hit_body, hit_food = 1, 0.0, 0.0
+            while 0 <= x + dx * step < logic.width and 0 <= y + dy * step < logic.height:
+                pos = (x + dx * step, y + dy * step)
+                cell = logic.codec.encode(pos) if logic.codec is not None else pos
+                if not hit_body and logic.occupancy.get_count(cell):
+                    hit_body = 1 / step
+                if not hit_food and pos == food:
+                    hit_food = 1 / step
+                step += 1
+            wall.append(1 / step)
+            body.append(hit_body)
+            found.append(hit_food)
+        return wall + body + found
+
+    def test_matches_naive_rays(self):
+        """Test the vectorized rays against walking each ray."""
+        for num_directions, directions in ((8, RayFeatures.DIRECTIONS_8), (16, RayFeatures.DIRECTIONS_16)):
+            for cell_index in (False, True):
+                logic = GameLogic(11, 9, ["Greedy"] * 6, 3, 6, "normal", cell_index=cell_index, seed=2)
+                rays = RayFeatures(11, 9, num_directions)
+                for _ in range(60):
+                    logic.update()
+                    keys, features = rays.compute(logic)
+                    self.assertEqual(features.shape, (len(keys), rays.get_feature_size()))
+                    for row, key in zip(features, keys):
+                        np.testing.assert_allclose(row, self.naive_features(logic, key, directions), rtol=1e-6)
+
+    def test_corner(self):
+        """Test the rays of a snake in the corner of an empty board."""
+        logic = GameLogic(5, 5, ["Greedy"], 1, 1, "normal", seed=0)
+        snake = logic.snakes[0]
+        logic.occupancy.remove(snake.body.pop_front())
+        snake.body.add_front((0, 0))
+        logic.occupancy.add((0, 0), 0)
+        keys, features = RayFeatures(5, 5).compute(logic)
+        self.assertEqual(keys, [0])
+        # up, down, left, right, then the diagonals
+        np.testing.assert_allclose(features[0, :8], [1, 1 / 5, 1, 1 / 5, 1, 1, 1, 1 / 5])
+        np.testing.assert_array_equal(features[0, 8:], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
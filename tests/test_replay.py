@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_logic import GameLogic
+from logic.replay import ReplayRecorder, load_replay, list_replays
+
+
+def snapshot(game_logic):
+    """Capture the visible state of a game."""
+    bodies = {key: list(game_logic.get_snake_body(key)) for key in game_logic.keys}
+    return bodies, game_logic.get_food_position()
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "game.snkr")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def record(self, game_logic, ticks, keyframe_interval=1000):
+        recorder = ReplayRecorder(game_logic, keyframe_interval)
+        states = []
+        for _ in range(ticks):
+            game_logic.update()
+            recorder.record_tick()
+            states.append(snapshot(game_logic))
+        recorder.save(self.path)
+        return states
+
+    def test_seeded_games_match(self):
+        """Test that two games with the same seed play out identically."""
+        first = GameLogic(15, 15, ["Greedy"] * 3, 3, 3, "normal", seed=11)
+        second = GameLogic(15, 15, ["Greedy"] * 3, 3, 3, "normal", seed=11)
+        for _ in range(200):
+            first.update()
+            second.update()
+            self.assertEqual(snapshot(first), snapshot(second))
+
+    def test_replay_is_bit_exact(self):
+        """Test that replaying a recording reproduces every tick."""
+        states = self.record(GameLogic(20, 20, ["Greedy"] * 4, 3, 4, "normal", seed=5), 400, 64)
+        with load_replay(self.path) as replay:
+            self.assertEqual(replay.ticks, 400)
+            game_logic = replay.create_game(cell_index=True)
+            for tick, state in enumerate(states):
+                replay.step(game_logic, tick)
+                self.assertEqual(snapshot(game_logic), state)
+
+    def test_seek(self):
+        """Test that seeking forwards and backwards restores the exact state."""
+        states = self.record(GameLogic(12, 12, ["Greedy"] * 3, 3, 3, "normal", seed=9), 300, 50)
+        with load_replay(self.path) as replay:
+            for cell_index in (False, True):
+                game_logic = replay.create_game(cell_index=cell_index)
+                for tick in (230, 120, 121, 299, 50, 1, 300, 175):
+                    replay.seek(game_logic, tick)
+                    self.assertEqual(game_logic.step_count, tick)
+                    self.assertEqual(snapshot(game_logic), states[tick - 1])
+                replay.seek(game_logic, 140)
+                for tick in range(140, 300):
+                    replay.step(game_logic, tick)
+                    self.assertEqual(snapshot(game_logic), states[tick])
+
+    def test_seek_to_snake_without_body(self):
+        """Test seeking to a keyframe where a crashed snake has no cells left but is not removed yet."""
+        states = self.record(GameLogic(6, 6, ["Greedy"] * 4, 1, 4, "normal", seed=34), 30, 7)
+        self.assertIn([], states[6][0].values())
+        with load_replay(self.path) as replay:
+            game_logic = replay.create_game()
+            replay.seek(game_logic, 7)
+            self.assertEqual(snapshot(game_logic), states[6])
+            for tick in range(7, 30):
+                replay.step(game_logic, tick)
+                self.assertEqual(snapshot(game_logic), states[tick])
+
+    def test_replay_is_compact(self):
+        """Test that a long game with many snakes fits in a few KB, keyframes included."""
+        self.record(GameLogic(50, 50, ["SafeGreedy"] * 12, 5, 12, "normal", seed=3, cell_index=True), 10000)
+        self.assertLess(os.path.getsize(self.path), 8 * 1024)
+
+    def test_list_replays(self):
+        """Test finding replay files in a directory."""
+        self.record(GameLogic(9, 9, ["Greedy"], 2, 1, "normal", seed=1), 10)
+        self.assertEqual(list_replays(self.tmp.name), [self.path])
+        self.assertEqual(list_replays(os.path.join(self.tmp.name, "missing")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
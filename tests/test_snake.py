@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.snake import Snake
+from logic.game_objects.occupancy_grid import OccupancyGrid
+
+
+class TestSnake(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = OccupancyGrid(5, 5)
+        self.snake = Snake((2, 2), 3, self.grid, 0)
+
+    def test_initialization(self):
+        """Test if the snake starts stacked on its start position."""
+        self.assertEqual(self.snake.get_head(), (2, 2))
+        self.assertEqual(self.snake.get_size(), 3)
+        self.assertEqual(self.grid.get_count((2, 2)), 3)
+
+    def test_move_updates_grid(self):
+        """Test that moving keeps the occupancy grid in sync."""
+        self.snake.update((1, 0), None)
+        self.snake.update((1, 0), None)
+        self.assertEqual(list(self.snake.get_body()), [(4, 2), (3, 2), (2, 2)])
+        self.assertEqual(self.grid.get_count((2, 2)), 1)
+        self.assertEqual(self.grid.get_count((4, 2)), 1)
+
+    def test_eat_grows(self):
+        """Test that eating food grows the snake."""
+        self.snake.update((0, 1), (2, 3))
+        self.assertTrue(self.snake.check_ate())
+        self.assertEqual(self.snake.get_size(), 4)
+        self.assertEqual(self.grid.get_count((2, 2)), 3)
+
+    def test_wall_collision(self):
+        """Test that leaving the board kills the snake without touching the grid."""
+        snake = Snake((0, 0), 2, self.grid, 1)
+        snake.update((-1, 0), None)
+        self.assertTrue(snake.check_collision(5, 5, {}, []))
+        self.assertFalse(snake.check_alive())
+        self.assertEqual(self.grid.get_count((0, 0)), 1)
+
+    def test_collision_with_other_snake(self):
+        """Test that moving into another snake's body is a collision."""
+        other = Snake((3, 2), 2, self.grid, 1)
+        self.snake.update((1, 0), None)
+        self.assertTrue(self.snake.check_collision(5, 5, {}, []))
+        self.assertEqual(self.grid.get_count((3, 2)), 2)
+        self.assertEqual(self.grid.get_owner((3, 2)), 1)
+        self.assertTrue(other.check_alive())
+
+    def test_dead_snake_retracts(self):
+        """Test that a dead snake clears the grid as it disappears."""
+        self.snake.update((0, -1), None)
+        self.snake.die()
+        while self.snake.check_exists():
+            self.snake.update((0, -1), None)
+        self.assertFalse(any(self.grid.counts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.space_evaluator import SpaceEvaluator
+from logic.game_objects.occupancy_grid import OccupancyGrid
+from logic.game_logic import GameLogic
+
+
+class TestSpaceEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = OccupancyGrid(5, 5)
+        # wall off the left column from the rest of the board
+        for y in range(5):
+            self.grid.add((1, y), 0)
+        self.evaluator = SpaceEvaluator(self.grid)
+
+    def test_count_regions(self):
+        """Test counting the cells of separated regions."""
+        self.assertEqual(self.evaluator.count_reachable((0, 0), 100), 5)
+        self.assertEqual(self.evaluator.count_reachable((4, 4), 100), 15)
+        self.assertEqual(self.evaluator.count_reachable((1, 1), 100), 0)
+        self.assertEqual(self.evaluator.count_reachable((-1, 0), 100), 0)
+
+    def test_bounded_and_reused(self):
+        """Test that fills stop at the limit and are reused until the grid changes."""
+        self.assertEqual(self.evaluator.count_reachable((4, 4), 6), 6)
+        expanded = self.evaluator.nodes_expanded
+        self.assertEqual(self.evaluator.count_reachable((3, 3), 6), 6)
+        self.assertEqual(self.evaluator.nodes_expanded, expanded)
+        self.assertEqual(self.evaluator.count_reachable((3, 3), 100), 15)
+        self.grid.remove((1, 2))
+        self.assertEqual(self.evaluator.count_reachable((0, 0), 100), 21)
+
+    def test_safe_greedy_plays(self):
+        """Test that safe greedy snakes play in both position modes."""
+        for cell_index in (False, True):
+            logic = GameLogic(12, 12, ["SafeGreedy"] * 3, 3, 3, "normal", cell_index=cell_index, seed=5)
+            for _ in range(200):
+                logic.update()
+            self.assertGreater(sum(snake.get_size() for snake in logic.snakes.values()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+from random import Random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_objects.spawn_generator import SpawnGenerator
+
+
+class TestSpawnGenerator(unittest.TestCase):
+
+    def picks(self, generator, seed, count=50):
+        generator.rng = Random(seed)
+        return [generator.get_random() for _ in range(count)]
+
+    def test_pick_ignores_list_order(self):
+        """Test that the same free cells give the same picks however the spawn list is ordered."""
+        taken = [3, 17, 18, 40, 41, 42, 63]
+        first = SpawnGenerator(8, 8, cell_index=True)
+        second = SpawnGenerator(8, 8, cell_index=True)
+        for cell in taken:
+            first.remove(cell)
+        for cell in reversed(taken):
+            second.remove(cell)
+        second.remove(0)
+        second.insert(0)
+        self.assertNotEqual(first.list, second.list)
+        self.assertEqual(self.picks(first, 1), self.picks(second, 1))
+        self.assertTrue(all(cell not in taken for cell in self.picks(first, 2)))
+
+    def test_tuples_and_indices_agree(self):
+        """Test that tuple and cell index boards pick the same cells."""
+        tuples = SpawnGenerator(6, 5)
+        indices = SpawnGenerator(6, 5, cell_index=True)
+        for cell in range(0, 30, 4):
+            tuples.remove((cell % 6, cell // 6))
+            indices.remove(cell)
+        self.assertEqual([(cell % 6, cell // 6) for cell in self.picks(indices, 3)], self.picks(tuples, 3))
+
+    def test_nearly_full_board(self):
+        """Test that the last free cells are still found, and None once the board is full."""
+        generator = SpawnGenerator(10, 10, cell_index=True)
+        for cell in range(100):
+            if cell not in (37, 81):
+                generator.remove(cell)
+        self.assertEqual(set(self.picks(generator, 4)), {37, 81})
+        generator.remove(37)
+        generator.remove(81)
+        self.assertIsNone(generator.get_random())
+
+    def test_reset(self):
+        """Test that reset makes every cell free again."""
+        generator = SpawnGenerator(4, 4)
+        generator.remove((1, 1))
+        generator.reset()
+        self.assertEqual(sorted(generator.list), sorted((x, y) for x in range(4) for y in range(4)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import logging
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.game_logic import GameLogic
+from logic.tick_profiler import TickProfiler
+
+
+class TestTickProfiler(unittest.TestCase):
+
+    def new_game(self):
+        return GameLogic(12, 12, ["Greedy", "BFS", "SafeGreedy"], 3, 3, "normal", cell_index=True, seed=8)
+
+    def test_profiled_game_plays_the_same(self):
+        """Test that profiling does not change how the game plays."""
+        plain, profiled = self.new_game(), self.new_game()
+        profiled.enable_profiling()
+        for _ in range(100):
+            plain.update()
+            profiled.update()
+        self.assertEqual(plain.keys, profiled.keys)
+        for key in plain.keys:
+            self.assertEqual(list(plain.get_snake_body(key)), list(profiled.get_snake_body(key)))
+        self.assertEqual(plain.get_food_position(), profiled.get_food_position())
+
+    def test_phases_and_counters(self):
+        """Test that phases are timed and events counted per snake and controller type."""
+        logic = self.new_game()
+        profiler = logic.enable_profiling()
+        for _ in range(50):
+            logic.update()
+        summary = profiler.get_summary()
+        self.assertEqual(summary["ticks"], 50)
+        self.assertEqual(set(summary["by_controller"]), {"Greedy", "BFS", "SafeGreedy"})
+        for phase in TickProfiler.PHASES:
+            self.assertGreater(summary["totals"][phase], 0)
+        self.assertGreater(summary["by_controller"]["BFS"]["nodes_expanded"], 0)
+        self.assertEqual(summary["by_controller"]["Greedy"]["nodes_expanded"], 0)
+        self.assertGreater(summary["totals"]["food_respawns"], 0)
+        self.assertGreater(summary["by_snake"][0]["collisions_checked"], 0)
+        self.assertIs(logic.disable_profiling(), profiler)
+        logic.update()
+        self.assertEqual(profiler.ticks, 50)
+
+    def test_periodic_log(self):
+        """Test that a summary is logged every interval."""
+        logic = self.new_game()
+        logic.enable_profiling(TickProfiler(log_interval=10))
+        with self.assertLogs("logic.tick_profiler", logging.INFO) as logs:
+            for _ in range(25):
+                logic.update()
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("BFS", logs.records[0].getMessage())
+
+
+if __name__ == "__main__":
+    unittest.main()
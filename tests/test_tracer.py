@@ -0,0 +1,74 @@
+import unittest
+import tempfile
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from diagnostics.tracer import Tracer, tracer, save_trace
+from logic.game_logic import GameLogic
+
+
+class TestTracer(unittest.TestCase):
+
+    def tearDown(self):
+        tracer.disable()
+        tracer.clear()
+
+    def test_ring_buffer(self):
+        """Test that the oldest spans are overwritten once the buffer is full."""
+        trace = Tracer(capacity=3)
+        for i in range(5):
+            trace.add(f"span{i}", "test", i * 1000, i * 1000 + 500)
+        self.assertEqual(trace.count, 3)
+        self.assertEqual(trace.dropped, 2)
+        events = [event for event in trace.get_events() if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in events], ["span2", "span3", "span4"])
+        self.assertEqual(events[0]["ts"], 2.0)
+        self.assertEqual(events[0]["dur"], 0.5)
+
+    def test_span(self):
+        """Test that spans are only recorded while enabled."""
+        trace = Tracer()
+        with trace.span("off", "test"):
+            pass
+        trace.enable()
+        with trace.span("on", "test", {"value": 1}):
+            pass
+        events = [event for event in trace.get_events() if event["ph"] == "X"]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["args"], {"value": 1})
+        self.assertGreaterEqual(events[0]["dur"], 0)
+
+    def test_save(self):
+        """Test that the saved file is Chrome trace-event JSON."""
+        trace = Tracer()
+        trace.add("frame", "frame", 0, 16000000)
+        with tempfile.TemporaryDirectory() as directory:
+            path = save_trace(os.path.join(directory, "traces"), trace)
+            with open(path) as file:
+                data = json.load(file)
+        self.assertEqual(data["displayTimeUnit"], "ms")
+        self.assertIn({"name": "frame", "cat": "frame", "ph": "X", "ts": 0.0, "dur": 16000.0,
+                       "pid": os.getpid(), "tid": 0}, data["traceEvents"])
+
+    def test_game_logic_spans(self):
+        """Test that a traced game records ticks and controller decisions and plays the same."""
+        plain = GameLogic(12, 12, ["Greedy", "BFS"], 3, 2, "normal", cell_index=True, seed=4)
+        traced = GameLogic(12, 12, ["Greedy", "BFS"], 3, 2, "normal", cell_index=True, seed=4)
+        for _ in range(20):
+            plain.update()
+        tracer.enable()
+        for _ in range(20):
+            traced.update()
+        self.assertEqual(list(plain.get_snake_body(0)), list(traced.get_snake_body(0)))
+        events = [event for event in tracer.get_events() if event["ph"] == "X"]
+        self.assertEqual(sum(event["name"] == "tick" for event in events), 20)
+        controllers = [event for event in events if event["cat"] == "controller"]
+        self.assertEqual({event["name"] for event in controllers}, {"Greedy", "BFS"})
+        self.assertTrue(all("nodes_expanded" in event["args"] for event in controllers))
+
+
+if __name__ == "__main__":
+    unittest.main()
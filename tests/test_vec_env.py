@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.vec_env import SnakeEnv, VecSnakeEnv
+from logic.controller.controller import Controller
+
+
+class TestVecSnakeEnv(unittest.TestCase):
+
+    def run_env(self, num_workers, obs_mode="vector"):
+        with VecSnakeEnv(
+            4, 8, 8, opponents=("Greedy",), max_steps=30, seed=0, num_workers=num_workers, obs_mode=obs_mode
+        ) as env:
+            obs = env.reset().copy()
+            rng = np.random.default_rng(1)
+            history = []
+            for _ in range(60):
+                obs, rewards, dones = env.step(rng.integers(0, 4, size=4))
+                history.append((obs.copy(), rewards.copy(), dones.copy()))
+        return history
+
+    def test_shapes_and_auto_reset(self):
+        """Test that results are stacked and finished boards restart."""
+        history = self.run_env(0)
+        obs, rewards, dones = history[0]
+        self.assertEqual(obs.shape, (4, 1 + 2 * 65 + 14))
+        self.assertEqual(rewards.shape, (4,))
+        self.assertTrue(any(step[2].any() for step in history))
+
+    def test_worker_pool_matches_in_process(self):
+        """Test that a worker pool produces the same results as running in process."""
+        for local, pooled in zip(self.run_env(0, "grid"), self.run_env(2, "grid")):
+            for a, b in zip(local, pooled):
+                np.testing.assert_array_equal(a, b)
+
+    def test_food_and_death_rewards(self):
+        """Test that eating is rewarded and dying is punished and ends the episode."""
+        env = SnakeEnv(8, 8, seed=3)
+        env.reset()
+        logic = env.game_logic
+        head = logic.get_snake_head(0)
+        logic.food.respawn(logic.codec.encode((head[0], head[1] + 1)))
+        _, reward, done = env.step(Controller.DOWN)
+        self.assertEqual(reward, SnakeEnv.FOOD_REWARD)
+        self.assertFalse(done)
+        _, reward, done = env.step(Controller.UP)
+        self.assertEqual(reward, SnakeEnv.DEATH_REWARD)
+        self.assertTrue(done)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+
+class FontCache:
+    """
+    Process-wide cache of the default font by size, and of rendered text
+    surfaces by (text, size, color) with least recently used eviction.
+
+    Rendered surfaces are shared, so callers blit them and never draw onto them.
+    """
+
+    MAX_TEXT_SURFACES = 256
+    _fonts: Dict[int, pygame.font.Font] = {}
+    _texts: "OrderedDict[Tuple[str, int, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
+
+    @classmethod
+    def get_font(cls, size: int) -> pygame.font.Font:
+        """
+        Get the default font at a size, loading it the first time.
+
+        Args:
+            size (int): The font size.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        font = cls._fonts.get(size)
+        if font is None:
+            font = cls._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    @classmethod
+    def render(cls, text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Get a text rendered antialiased in the default font, rendering it if it is not cached.
+
+        Args:
+            text (str): The text to render.
+            size (int): The font size.
+            color (Tuple[int, ...]): The text color.
+
+        Returns:
+            pygame.Surface: The shared text surface.
+        """
+        key = (text, size, tuple(color))
+        surface = cls._texts.get(key)
+        if surface is not None:
+            cls._texts.move_to_end(key)
+            return surface
+        surface = cls._texts[key] = cls.get_font(size).render(text, True, color)
+        if len(cls._texts) > cls.MAX_TEXT_SURFACES:
+            cls._texts.popitem(last=False)
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached font and text surface, e.g. after pygame.font.quit."""
+        cls._fonts.clear()
+        cls._texts.clear()
@@ -1,6 +1,7 @@
 import pygame
 from abc import ABC, abstractmethod
 from config.config import GameConfig
+from ui.font_cache import FontCache
 
 class HoverButton(ABC):
     def __init__(self, text: str, config: GameConfig, font=None) -> None:
@@ -61,7 +62,7 @@ class HoverButton(ABC):
 
     def render(self) -> None:
         """Render the button surface."""
-        self.font = pygame.font.Font(None, self.get_font_size())
+        self.font = FontCache.get_font(self.get_font_size())
         self.surface = pygame.Surface(self.get_size(), pygame.SRCALPHA)
         text_color, bg_color = self.get_colors()
         border_radius = self.get_border_radius()
@@ -71,7 +72,7 @@ class HoverButton(ABC):
             (0, 0, self.width, self.height),
             border_radius=border_radius,
         )
-        text_surface = self.font.render(self.text_string, True, text_color)
+        text_surface = FontCache.render(self.text_string, self.get_font_size(), text_color)
         self.surface.blit(
             text_surface,
             (
@@ -1,5 +1,6 @@
 import pygame
 from config.config import GameConfig
+from ui.font_cache import FontCache
 
 class TitleText:
     def __init__(self, text: str, config: GameConfig):
@@ -11,8 +12,8 @@ class TitleText:
 
     def update(self, x: int, y: int):
         """Update the text surface and its rectangle."""
-        self.title_font = pygame.font.Font(None, self.config.tital_f_size)
-        self.surface = self.title_font.render(self.text, True, self.config.TEXT_COLOR)
+        self.title_font = FontCache.get_font(self.config.tital_f_size)
+        self.surface = FontCache.render(self.text, self.config.tital_f_size, self.config.TEXT_COLOR)
         self.rect = self.surface.get_rect(center=(x, y))
 
     def draw(self, screen: pygame.Surface):